@@ -0,0 +1,25 @@
+"""
+gunicorn settings, read from the working directory by `make render-start`.
+
+The application is loaded in every worker rather than preloaded in the
+master: the access log writer and the error reporter run background
+threads that would not survive the fork.
+"""
+
+
+def post_worker_init(worker):
+    """
+    Warm up the worker after the application is loaded and before it
+    accepts requests.
+    """
+    from django.conf import settings
+
+    if not settings.WARMUP["ENABLED"]:
+        return
+
+    from task_manager.warmup import warm_up
+
+    for row in warm_up():
+        worker.log.info(
+            "Warm-up %s: %d in %.1f ms", row["phase"], row["count"], row["ms"]
+        )
@@ -9,8 +9,13 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
+from task_manager.static_files import StaticFilesApp
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "task_manager.settings")
 
-application = get_asgi_application()
+application = StaticFilesApp(
+    get_asgi_application(), settings.STATIC_ROOT, settings.STATIC_URL
+)
@@ -0,0 +1,118 @@
+"""
+Content encodings used by `CompressionMiddleware`.
+
+gzip and brotli are always available; zstd is used when the standard
+library `compression.zstd` (Python 3.14) or the `backports.zstd` package
+is installed.
+"""
+
+import zlib
+
+import brotli
+
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        from backports import zstd
+    except ImportError:
+        zstd = None
+
+
+class GzipCompressor:
+    def __init__(self, level):
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data, flush=False):
+        output = self.compressor.compress(data)
+        if flush:
+            output += self.compressor.flush(zlib.Z_SYNC_FLUSH)
+        return output
+
+    def finish(self):
+        return self.compressor.flush()
+
+
+class BrotliCompressor:
+    def __init__(self, level):
+        self.compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data, flush=False):
+        output = self.compressor.process(data)
+        if flush:
+            output += self.compressor.flush()
+        return output
+
+    def finish(self):
+        return self.compressor.finish()
+
+
+class ZstdCompressor:
+    def __init__(self, level):
+        self.compressor = zstd.ZstdCompressor(level=level)
+
+    def compress(self, data, flush=False):
+        mode = zstd.ZstdCompressor.CONTINUE
+        if flush:
+            mode = zstd.ZstdCompressor.FLUSH_BLOCK
+        return self.compressor.compress(data, mode=mode)
+
+    def finish(self):
+        return self.compressor.flush()
+
+
+COMPRESSORS = {"gzip": GzipCompressor, "br": BrotliCompressor}
+if zstd is not None:
+    COMPRESSORS["zstd"] = ZstdCompressor
+
+
+def choose_encoding(accept_encoding, preferred):
+    """
+    Pick the first of `preferred` encodings allowed by an
+        `Accept-Encoding` header value.
+
+    Returns:
+        str | None: Encoding name, None if the client accepts none.
+    """
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            if quality and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(name.strip())
+    for encoding in preferred:
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return None
+
+
+def compress(encoding, level, data):
+    compressor = COMPRESSORS[encoding](level)
+    return compressor.compress(data) + compressor.finish()
+
+
+def compress_stream(encoding, level, chunks):
+    """
+    Compress an iterable of chunks, flushing after each one so a streamed
+        response is not held back until the end.
+    """
+    compressor = COMPRESSORS[encoding](level)
+    for chunk in chunks:
+        if output := compressor.compress(chunk, flush=True):
+            yield output
+    yield compressor.finish()
+
+
+async def acompress_stream(encoding, level, chunks):
+    """
+    Async version of `compress_stream` for async iterators.
+    """
+    compressor = COMPRESSORS[encoding](level)
+    async for chunk in chunks:
+        if output := compressor.compress(chunk, flush=True):
+            yield output
+    yield compressor.finish()
@@ -0,0 +1,116 @@
+import hashlib
+
+from django.contrib.messages import get_messages
+from django.db.models import F
+from django.middleware.csrf import get_token
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from task_manager.invalidation import get_or_set
+from task_manager.labels.models import Label
+from task_manager.models import TableVersion
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+# Every page shows the current user in the navigation bar, so the users
+# table is part of all validators.
+TRACKED_MODELS = (Task, Status, Label, User)
+
+
+def bump_table_version(model, using):
+    """
+    Increment the change counter of the table of `model`.
+    """
+    table = model._meta.db_table
+    versions = TableVersion.objects.using(using)
+    updated = versions.filter(table=table).update(
+        version=F("version") + 1, updated_at=timezone.now()
+    )
+    if not updated:
+        versions.get_or_create(table=table)
+        versions.filter(table=table).update(
+            version=F("version") + 1, updated_at=timezone.now()
+        )
+
+
+def get_table_versions(models):
+    """
+    Read the change counters of the tables of `models`.
+
+    The counters are cached per process until the invalidation bus reports
+    a write to one of the tables, so most requests skip the query.
+
+    Returns:
+        dict[str, tuple[int, datetime]]: Version and time of the last change
+            by table name. Tables never changed are missing.
+    """
+    tables = [model._meta.db_table for model in models]
+
+    def read():
+        return {
+            table: (version, updated_at)
+            for table, version, updated_at in TableVersion.objects.filter(
+                table__in=tables
+            ).values_list("table", "version", "updated_at")
+        }
+
+    return get_or_set(f"table_versions:{','.join(tables)}", tables, read)
+
+
+class ConditionalGetMixin:
+    """
+    Answer GET requests with 304 Not Modified while the page is unchanged.
+
+    The validators come from the change counters of `conditional_models`
+    instead of the page itself. The weak ETag also covers the user, the
+    language and the CSRF secret rendered into forms; there is no
+    Last-Modified, which could not. Responses are private and must be
+    revalidated, so browsers never show a stale page from their cache.
+    Requests with pending flash messages are always rendered, so the
+    messages are shown and consumed.
+    """
+
+    conditional_models = TRACKED_MODELS
+
+    def get_etag_parts(self, request):
+        """
+        Return what the page depends on besides the tables.
+        """
+        return [
+            request.user.pk,
+            getattr(request, "LANGUAGE_CODE", ""),
+            request.META.get("CSRF_COOKIE", ""),
+        ]
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return super().dispatch(request, *args, **kwargs)
+        if len(get_messages(request)):
+            response = super().dispatch(request, *args, **kwargs)
+        else:
+            response = self.dispatch_conditional(request, *args, **kwargs)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def dispatch_conditional(self, request, *args, **kwargs):
+        versions = get_table_versions(self.conditional_models)
+
+        def etag(request, *args, **kwargs):
+            # Makes sure the CSRF secret exists before the page renders it.
+            get_token(request)
+            parts = [
+                *self.get_etag_parts(request),
+                *(
+                    versions.get(model._meta.db_table, (0, None))[0]
+                    for model in self.conditional_models
+                ),
+            ]
+            digest = hashlib.md5(
+                repr(parts).encode(), usedforsecurity=False
+            ).hexdigest()
+            return f'W/"{digest}"'
+
+        view = condition(etag_func=etag)(super().dispatch)
+        return view(request, *args, **kwargs)
@@ -0,0 +1,35 @@
+from django.utils.cache import patch_vary_headers
+
+FRAGMENT_HEADER = "X-Fragment"
+
+
+class FragmentMixin:
+    """
+    Mixin to answer fragment requests with a part of the page.
+
+    Requests whose `X-Fragment` header names a key of `fragment_templates`
+    get only that template, rendered with the full page context, so a
+    script can update the page in place. Responses vary on the header, and
+    with `ConditionalGetMixin` (which must come later in the bases) the
+    fragment and the page get different ETags.
+    """
+
+    fragment_templates = {}
+
+    def get_fragment(self):
+        fragment = self.request.headers.get(FRAGMENT_HEADER)
+        return fragment if fragment in self.fragment_templates else None
+
+    def get_template_names(self):
+        fragment = self.get_fragment()
+        if fragment is not None:
+            return [self.fragment_templates[fragment]]
+        return super().get_template_names()
+
+    def get_etag_parts(self, request):
+        return [*super().get_etag_parts(request), self.get_fragment()]
+
+    def dispatch(self, request, *args, **kwargs):
+        response = super().dispatch(request, *args, **kwargs)
+        patch_vary_headers(response, (FRAGMENT_HEADER,))
+        return response
@@ -0,0 +1,249 @@
+"""
+Cross-node cache invalidation.
+
+Values cached with `get_or_set` are stored under keys holding this
+process's generation of every table they were built from. A write bumps
+the generations of its table locally and broadcasts the table name after
+commit; every other process bumps its generation on receipt, so entries
+built before the change are never read again and simply expire.
+
+The broadcast uses PostgreSQL LISTEN/NOTIFY when the default database is
+PostgreSQL, and Unix datagram sockets in a shared directory otherwise
+(several workers on one host). A listener that reconnects drops every
+generation, as it may have missed notifications.
+"""
+
+import atexit
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+logger = logging.getLogger(__name__)
+
+# Keeps keys of a restarted process apart from entries of its previous
+# life when the cache backend is shared.
+_prefix = uuid.uuid4().hex[:8]
+_generations = defaultdict(int)
+_epoch = 0
+_lock = threading.Lock()
+_bus = None
+_bus_pid = None
+
+
+def bump_generations(tables=None):
+    """
+    Invalidate cached values built from `tables`, or all values if None.
+    """
+    global _epoch
+    with _lock:
+        if tables is None:
+            _epoch += 1
+            return
+        for table in tables:
+            _generations[table] += 1
+
+
+def versioned_key(name, tables):
+    """
+    Return the cache key of `name` for the current table generations.
+    """
+    parts = ",".join(f"{table}.{_generations[table]}" for table in tables)
+    return f"{_prefix}.{_epoch}:{name}:{parts}"
+
+
+def get_or_set(name, tables, default, timeout=None):
+    """
+    Return the cached value of `name`, computing it with `default` after
+        any of `tables` changed.
+
+    Args:
+        name (str): Key of the value, unique per set of inputs.
+        tables (list[str]): Tables the value is built from.
+        default (Callable[[], Any]): Computes the value on a miss.
+        timeout (float | None): Cache timeout, the bus default if None.
+
+    Returns:
+        Any: The cached or computed value.
+    """
+    get_bus()
+    if timeout is None:
+        timeout = settings.CACHE_INVALIDATION["TIMEOUT"]
+    return cache.get_or_set(versioned_key(name, tables), default, timeout)
+
+
+def invalidate(tables, using=DEFAULT_DB_ALIAS):
+    """
+    Invalidate `tables` in this process now and on every node after the
+        current transaction commits.
+
+    The local bump is repeated after commit, so values cached from the
+    old rows while the transaction was open are dropped as well.
+    """
+    tables = list(tables)
+    bump_generations(tables)
+
+    def broadcast():
+        bump_generations(tables)
+        try:
+            get_bus().publish(tables)
+        except Exception:
+            logger.exception("Cache invalidation broadcast failed")
+
+    transaction.on_commit(broadcast, using=using)
+
+
+class LocalBus:
+    """
+    Bus of a single process, used when nothing else shares the cache.
+    """
+
+    def start(self, callback):
+        pass
+
+    def publish(self, tables):
+        pass
+
+
+class SocketBus:
+    """
+    Bus between the processes of one host.
+
+    Every process binds a Unix datagram socket in `directory` and sends
+    invalidations to all other sockets found there. Sockets of processes
+    that are gone are removed by the first sender that fails to reach them.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.path = self.directory / f"{os.getpid()}-{uuid.uuid4().hex}.sock"
+        self.sock = None
+
+    def start(self, callback):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(str(self.path))
+        atexit.register(self.close)
+        threading.Thread(
+            target=self.listen, args=(callback,), daemon=True
+        ).start()
+
+    def listen(self, callback):
+        while True:
+            data = self.sock.recv(65536)
+            try:
+                callback(json.loads(data))
+            except ValueError:
+                logger.warning("Ignored malformed invalidation %r", data)
+
+    def publish(self, tables):
+        payload = json.dumps(tables).encode()
+        sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        with sender:
+            for path in self.directory.glob("*.sock"):
+                if path == self.path:
+                    continue
+                try:
+                    sender.sendto(payload, str(path))
+                except (ConnectionRefusedError, FileNotFoundError):
+                    path.unlink(missing_ok=True)
+                except OSError:
+                    logger.warning("Could not notify %s", path)
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+        self.path.unlink(missing_ok=True)
+
+
+class PostgresBus:
+    """
+    Bus between all nodes using the database through LISTEN/NOTIFY.
+
+    A daemon thread keeps its own connection listening on `channel`;
+    publishing sends `pg_notify` on the regular connection.
+    """
+
+    def __init__(self, alias, channel):
+        self.alias = alias
+        self.channel = channel
+
+    def start(self, callback):
+        threading.Thread(
+            target=self.listen, args=(callback,), daemon=True
+        ).start()
+
+    def listen(self, callback):
+        import psycopg
+        from psycopg import sql
+
+        params = connections[self.alias].get_connection_params()
+        while True:
+            try:
+                with psycopg.connect(**params, autocommit=True) as connection:
+                    connection.execute(
+                        sql.SQL("LISTEN {}").format(
+                            sql.Identifier(self.channel)
+                        )
+                    )
+                    callback(None)
+                    for notify in connection.notifies():
+                        try:
+                            callback(json.loads(notify.payload))
+                        except ValueError:
+                            logger.warning(
+                                "Ignored malformed invalidation %r",
+                                notify.payload,
+                            )
+            except psycopg.Error:
+                logger.exception("Cache invalidation listener disconnected")
+                time.sleep(1)
+
+    def publish(self, tables):
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, %s)", [self.channel, json.dumps(tables)]
+            )
+
+
+def create_bus(config):
+    """
+    Build the bus selected by `CACHE_INVALIDATION["BACKEND"]`.
+
+    'auto' picks PostgreSQL on PostgreSQL and sockets elsewhere.
+    """
+    backend = config["BACKEND"]
+    if backend == "auto":
+        vendor = connections[DEFAULT_DB_ALIAS].vendor
+        backend = "postgres" if vendor == "postgresql" else "socket"
+    if backend == "postgres":
+        return PostgresBus(DEFAULT_DB_ALIAS, config["CHANNEL"])
+    if backend == "socket" and hasattr(socket, "AF_UNIX"):
+        return SocketBus(config["SOCKET_DIR"])
+    return LocalBus()
+
+
+def get_bus():
+    """
+    Return the bus of this process, starting its listener on first use.
+
+    Started lazily, so forked workers each get their own listener and
+    management commands that never cache do not start one.
+    """
+    global _bus, _bus_pid
+    if _bus is None or _bus_pid != os.getpid():
+        with _lock:
+            if _bus is None or _bus_pid != os.getpid():
+                bus = create_bus(settings.CACHE_INVALIDATION)
+                bus.start(bump_generations)
+                _bus, _bus_pid = bus, os.getpid()
+    return _bus
@@ -0,0 +1,40 @@
+"""
+Jinja2 environment of the list templates in task_manager/jinja2/.
+
+The globals and filters mirror what the Django templates use: `url` and
+`static`, `_`/`gettext` through the i18n extension bound to Django's active
+translation, the `bootstrap_*` helpers of django_bootstrap5 and a `date`
+filter formatting in the current time zone and language, like the Django
+filter of the same name.
+"""
+
+from django.template.defaultfilters import date as format_date
+from django.templatetags.static import static
+from django.urls import reverse
+from django.utils import timezone, translation
+from django_bootstrap5.jinja2 import BootstrapTags
+from jinja2 import Environment
+
+
+def url(name, *args, **kwargs):
+    return reverse(name, args=args or None, kwargs=kwargs or None)
+
+
+def date(value, format_string=None):
+    return format_date(timezone.template_localtime(value), format_string)
+
+
+def environment(**options):
+    env = Environment(extensions=["jinja2.ext.i18n", BootstrapTags], **options)
+    env.install_gettext_callables(
+        translation.gettext, translation.ngettext, newstyle=True
+    )
+    env.globals.update(
+        {
+            "url": url,
+            "static": static,
+            "get_current_language": translation.get_language,
+        }
+    )
+    env.filters["date"] = date
+    return env
@@ -0,0 +1,66 @@
+import os
+import signal
+import socket
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils.module_loading import autodiscover_modules
+
+from task_manager.jobs.queue import (
+    claim_jobs,
+    purge_finished,
+    requeue_stale,
+    run_batch,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued background jobs. Several workers may run at once; "
+        "SIGTERM and SIGINT stop a worker after its current job."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run the jobs that are due and exit.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.JOBS["BATCH_SIZE"],
+            help="Jobs claimed at a time.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=settings.JOBS["POLL_INTERVAL"],
+            help="Seconds to wait when the queue is empty.",
+        )
+
+    def handle(self, *args, **options):
+        autodiscover_modules("jobs")
+        worker = f"{socket.gethostname()}:{os.getpid()}"
+        stop = threading.Event()
+        if not options["once"]:
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, lambda *args: stop.set())
+
+        done = failed = 0
+        while not stop.is_set():
+            requeue_stale(settings.JOBS["STALE_AFTER_SECONDS"])
+            jobs = claim_jobs(worker, options["batch_size"])
+            succeeded, errors = run_batch(jobs, stop)
+            done += succeeded
+            failed += errors
+            if not jobs:
+                purge_finished(settings.JOBS["KEEP_DAYS"])
+                if options["once"]:
+                    break
+                close_old_connections()
+                stop.wait(options["poll_interval"])
+
+        self.stdout.write(f"Jobs done: {done}, failed attempts: {failed}")
@@ -0,0 +1,303 @@
+import logging
+import random
+import threading
+import time
+import traceback
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+registry = {}
+
+
+def job(name, max_attempts=None, timeout=None):
+    """
+    Register a function as the handler of jobs called `name`.
+
+    Handlers receive the job payload and live in `jobs.py` modules of the
+    installed apps, which the worker imports on start.
+
+    Args:
+        name (str): Name used with `enqueue`.
+        max_attempts (int | None): Runs before the job is marked failed,
+            `JOBS["MAX_ATTEMPTS"]` if None.
+        timeout (float | None): Seconds after which a run is considered
+            hung and left to `requeue_stale`; no limit if None.
+    """
+
+    def register(func):
+        registry[name] = (func, max_attempts, timeout)
+        return func
+
+    return register
+
+
+def enqueue(name, payload=None, delay=None, using=None):
+    """
+    Add a job in the current transaction.
+
+    Call it inside the transaction of the triggering change: the job is
+    committed or rolled back together with it.
+
+    Args:
+        name (str): Registered handler name.
+        payload (dict | None): JSON serializable arguments of the handler.
+        delay (float | None): Seconds to wait before the first run.
+
+    Returns:
+        Job: The stored job.
+    """
+    max_attempts = None
+    if name in registry:
+        max_attempts = registry[name][1]
+    return Job.objects.using(using or router.db_for_write(Job)).create(
+        name=name,
+        payload=payload or {},
+        max_attempts=max_attempts or settings.JOBS["MAX_ATTEMPTS"],
+        run_at=timezone.now() + timedelta(seconds=delay or 0),
+    )
+
+
+def backoff(attempts):
+    """
+    Return the delay before retry number `attempts`.
+
+    The delay doubles with every attempt up to `JOBS["MAX_BACKOFF_SECONDS"]`
+    and is jittered so failed jobs do not retry in lockstep.
+    """
+    config = settings.JOBS
+    delay = min(
+        config["BACKOFF_SECONDS"] * 2 ** (attempts - 1),
+        config["MAX_BACKOFF_SECONDS"],
+    )
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def claim_jobs(worker, limit):
+    """
+    Mark up to `limit` due jobs as running for `worker`.
+
+    On PostgreSQL the candidates are selected with
+    `SELECT ... FOR UPDATE SKIP LOCKED`, so concurrent workers pass over
+    each other's rows. SQLite has no row locks; there the conditional
+    update only moves jobs that are still pending, and since SQLite
+    serializes writes, each job is claimed by one worker only.
+
+    Returns:
+        list[Job]: Claimed jobs, oldest first.
+    """
+    using = router.db_for_write(Job)
+    features = connections[using].features
+    token = f"{worker}:{uuid.uuid4().hex[:8]}"
+    now = timezone.now()
+    with transaction.atomic(using=using):
+        candidates = Job.objects.using(using).filter(
+            status=Job.PENDING, run_at__lte=now
+        )
+        if features.has_select_for_update_skip_locked:
+            candidates = candidates.select_for_update(skip_locked=True)
+        ids = list(
+            candidates.order_by("run_at", "pk").values_list("pk", flat=True)[
+                :limit
+            ]
+        )
+        Job.objects.using(using).filter(pk__in=ids, status=Job.PENDING).update(
+            status=Job.RUNNING,
+            locked_by=token,
+            locked_at=now,
+            attempts=F("attempts") + 1,
+        )
+    return list(
+        Job.objects.using(using)
+        .filter(pk__in=ids, locked_by=token, status=Job.RUNNING)
+        .order_by("run_at", "pk")
+    )
+
+
+@contextmanager
+def heartbeat(jobs, interval, timeout=None):
+    """
+    Refresh `locked_at` of the running job every `interval` seconds.
+
+    A job whose heartbeat stops, because its worker crashed or it ran
+    longer than `timeout` seconds, is picked up by `requeue_stale`; a long
+    but healthy job is not.
+    """
+    stop = threading.Event()
+
+    def beat():
+        deadline = time.monotonic() + timeout if timeout else None
+        try:
+            while not stop.wait(interval):
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+                jobs.update(locked_at=timezone.now())
+        finally:
+            connections.close_all()
+
+    thread = threading.Thread(target=beat, name="job-heartbeat", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def run_job(claimed):
+    """
+    Run a claimed job and record the outcome.
+
+    Failures are retried with `backoff` until `max_attempts` runs were
+    made; then the job is marked failed with the last traceback. While the
+    handler runs, its lock is kept alive with `heartbeat`.
+
+    The lock is renewed with a conditional update first: if the job was
+    requeued by `requeue_stale` since it was claimed, and maybe claimed by
+    another worker, the handler is not run.
+
+    Returns:
+        bool: Whether the handler succeeded.
+    """
+    using = claimed._state.db
+    jobs = Job.objects.using(using).filter(
+        pk=claimed.pk, locked_by=claimed.locked_by, status=Job.RUNNING
+    )
+    if not jobs.update(locked_at=timezone.now()):
+        logger.warning("Job %s lost its lock before it started", claimed)
+        return False
+    try:
+        handler, _, timeout = registry[claimed.name]
+    except KeyError:
+        jobs.update(
+            status=Job.FAILED,
+            last_error=f"No handler registered for {claimed.name!r}",
+            finished_at=timezone.now(),
+        )
+        return False
+
+    try:
+        with heartbeat(jobs, settings.JOBS["HEARTBEAT_SECONDS"], timeout):
+            handler(claimed.payload)
+    except Exception:
+        error = traceback.format_exc()
+        logger.warning("Job %s failed", claimed, exc_info=True)
+        if claimed.attempts >= claimed.max_attempts:
+            jobs.update(
+                status=Job.FAILED,
+                last_error=error,
+                finished_at=timezone.now(),
+            )
+        else:
+            jobs.update(
+                status=Job.PENDING,
+                last_error=error,
+                run_at=timezone.now() + backoff(claimed.attempts),
+                locked_by="",
+                locked_at=None,
+            )
+        return False
+
+    jobs.update(status=Job.DONE, finished_at=timezone.now())
+    return True
+
+
+def run_batch(claimed, stop):
+    """
+    Run claimed jobs one after another until `stop` is set.
+
+    While a job runs, the locks of the jobs waiting after it are kept
+    alive with `heartbeat`, so a long job does not let `requeue_stale`
+    hand them to another worker. Jobs left when `stop` is set are
+    returned to the queue with `release_jobs`.
+
+    Returns:
+        tuple[int, int]: Numbers of succeeded and failed runs.
+    """
+    done = failed = 0
+    for number, current in enumerate(claimed):
+        if stop.is_set():
+            release_jobs(claimed[number:])
+            break
+        waiting = Job.objects.using(current._state.db).filter(
+            pk__in=[job.pk for job in claimed[number + 1 :]],
+            locked_by=current.locked_by,
+            status=Job.RUNNING,
+        )
+        with heartbeat(waiting, settings.JOBS["HEARTBEAT_SECONDS"]):
+            if run_job(current):
+                done += 1
+            else:
+                failed += 1
+    return done, failed
+
+
+def release_jobs(claimed):
+    """
+    Return claimed jobs that were not started to the queue.
+    """
+    for unstarted in claimed:
+        Job.objects.using(unstarted._state.db).filter(
+            pk=unstarted.pk, locked_by=unstarted.locked_by
+        ).update(
+            status=Job.PENDING,
+            attempts=F("attempts") - 1,
+            locked_by="",
+            locked_at=None,
+        )
+
+
+def requeue_stale(timeout):
+    """
+    Return jobs whose heartbeat stopped more than `timeout` seconds ago,
+        because their worker crashed or they hung, to the queue.
+
+    Jobs that already used up their attempts are marked failed instead,
+    so a job that keeps crashing its worker does not run forever.
+
+    Returns:
+        int: Number of requeued or failed jobs.
+    """
+    now = timezone.now()
+    stale = Job.objects.filter(
+        status=Job.RUNNING, locked_at__lt=now - timedelta(seconds=timeout)
+    )
+    error = f"No heartbeat from the worker for {timeout} seconds"
+    failed = stale.filter(attempts__gte=F("max_attempts")).update(
+        status=Job.FAILED,
+        last_error=error,
+        finished_at=now,
+        locked_by="",
+        locked_at=None,
+    )
+    requeued = stale.update(
+        status=Job.PENDING,
+        last_error=error,
+        run_at=now,
+        locked_by="",
+        locked_at=None,
+    )
+    return failed + requeued
+
+
+def purge_finished(days):
+    """
+    Delete jobs that finished more than `days` days ago.
+
+    Returns:
+        int: Number of deleted jobs.
+    """
+    deadline = timezone.now() - timedelta(days=days)
+    deleted, _ = Job.objects.filter(
+        status__in=(Job.DONE, Job.FAILED), finished_at__lt=deadline
+    ).delete()
+    return deleted
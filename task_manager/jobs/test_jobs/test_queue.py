@@ -0,0 +1,224 @@
+import threading
+import time
+from datetime import timedelta
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connections, transaction
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+
+from task_manager.jobs.models import Job
+from task_manager.utils import remove_rollbar, test_english
+from task_manager.jobs.queue import (
+    claim_jobs,
+    enqueue,
+    heartbeat,
+    release_jobs,
+    requeue_stale,
+    run_batch,
+    run_job,
+)
+from .testcase import JobsTestCase, calls
+
+
+class TestJobQueue(JobsTestCase):
+    def test_job_is_rolled_back_with_its_change(self) -> None:
+        """
+        Test that a job enqueued in a failed transaction is never stored.
+        """
+        try:
+            with transaction.atomic():
+                enqueue("test.record", {"task": 1})
+                raise RuntimeError("change failed")
+        except RuntimeError:
+            pass
+
+        self.assertFalse(Job.objects.exists())
+
+    def test_claimed_job_runs_once(self) -> None:
+        """
+        Test that a claimed job is not claimed again and is marked done
+            after it ran.
+        """
+        enqueue("test.record", {"task": 1})
+
+        claimed = claim_jobs("worker-1", 10)
+
+        self.assertEqual(len(claimed), 1)
+        self.assertEqual(claim_jobs("worker-2", 10), [])
+        self.assertTrue(run_job(claimed[0]))
+        self.assertEqual(calls, [{"task": 1}])
+        job = Job.objects.get()
+        self.assertEqual(job.status, Job.DONE)
+        self.assertEqual(job.attempts, 1)
+
+    def test_failed_job_is_retried_with_backoff(self) -> None:
+        """
+        Test that a failing job is rescheduled until its attempts run out.
+        """
+        enqueue("test.fail")
+
+        self.assertFalse(run_job(claim_jobs("worker", 10)[0]))
+        job = Job.objects.get()
+        self.assertEqual(job.status, Job.PENDING)
+        self.assertGreater(job.run_at, timezone.now())
+        self.assertIn("boom", job.last_error)
+        self.assertEqual(claim_jobs("worker", 10), [])
+
+        Job.objects.update(run_at=timezone.now())
+        run_job(claim_jobs("worker", 10)[0])
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertEqual(job.attempts, 2)
+
+    def test_unknown_job_fails(self) -> None:
+        """
+        Test that a job without handler is marked failed.
+        """
+        enqueue("test.unknown")
+
+        self.assertFalse(run_job(claim_jobs("worker", 10)[0]))
+        self.assertEqual(Job.objects.get().status, Job.FAILED)
+
+    def test_stale_and_released_jobs_return_to_queue(self) -> None:
+        """
+        Test that jobs of crashed or stopped workers become pending again.
+        """
+        enqueue("test.record")
+        enqueue("test.record")
+        first, second = claim_jobs("worker", 10)
+
+        Job.objects.filter(pk=first.pk).update(
+            locked_at=timezone.now() - timedelta(hours=1)
+        )
+        release_jobs([second])
+
+        self.assertEqual(requeue_stale(600), 1)
+        self.assertEqual(Job.objects.filter(status=Job.PENDING).count(), 2)
+        self.assertEqual(Job.objects.get(pk=second.pk).attempts, 0)
+
+    def test_stale_job_without_attempts_left_fails(self) -> None:
+        """
+        Test that a job that keeps crashing its worker is marked failed
+            once its attempts are used up instead of being requeued.
+        """
+        enqueue("test.fail")
+        Job.objects.update(attempts=1)
+        job = claim_jobs("worker", 10)[0]
+        Job.objects.filter(pk=job.pk).update(
+            locked_at=timezone.now() - timedelta(hours=1)
+        )
+
+        self.assertEqual(requeue_stale(600), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertEqual(job.attempts, 2)
+        self.assertIn("heartbeat", job.last_error)
+        self.assertIsNotNone(job.finished_at)
+        self.assertEqual(claim_jobs("worker", 10), [])
+
+    def test_job_taken_over_is_not_run(self) -> None:
+        """
+        Test that a job requeued and claimed by another worker before it
+            started is skipped by the worker that claimed it first.
+        """
+        enqueue("test.record", {"task": 1})
+        first = claim_jobs("worker-1", 10)[0]
+        Job.objects.update(locked_at=timezone.now() - timedelta(hours=1))
+        requeue_stale(600)
+        second = claim_jobs("worker-2", 10)[0]
+
+        self.assertFalse(run_job(first))
+        self.assertEqual(calls, [])
+        self.assertTrue(run_job(second))
+        self.assertEqual(calls, [{"task": 1}])
+
+    def test_run_worker_once(self) -> None:
+        """
+        Test that the worker runs all due jobs and leaves delayed ones.
+        """
+        enqueue("test.record", {"n": 1})
+        enqueue("test.record", {"n": 2})
+        enqueue("test.record", {"n": 3}, delay=3600)
+        out = StringIO()
+
+        call_command("run_worker", once=True, batch_size=1, stdout=out)
+
+        self.assertEqual(calls, [{"n": 1}, {"n": 2}])
+        self.assertIn("Jobs done: 2", out.getvalue())
+        self.assertEqual(Job.objects.filter(status=Job.PENDING).count(), 1)
+
+
+@test_english
+@remove_rollbar
+class TestJobHeartbeat(TransactionTestCase):
+    def setUp(self) -> None:
+        self.job = Job.objects.create(
+            name="test.record",
+            max_attempts=3,
+            status=Job.RUNNING,
+            locked_by="worker",
+            locked_at=timezone.now() - timedelta(hours=1),
+        )
+        self.jobs = Job.objects.filter(pk=self.job.pk)
+
+    def test_heartbeat_keeps_long_job(self) -> None:
+        """
+        Test that a running job with a heartbeat is not requeued however
+            long it runs.
+        """
+        with heartbeat(self.jobs, 0.05):
+            time.sleep(0.3)
+
+        self.assertEqual(requeue_stale(60), 0)
+        self.assertEqual(self.jobs.get().status, Job.RUNNING)
+
+    def test_heartbeat_stops_after_timeout(self) -> None:
+        """
+        Test that a job running past its timeout loses its heartbeat.
+        """
+        with heartbeat(self.jobs, 0.05, timeout=0.01):
+            time.sleep(0.3)
+
+        self.assertEqual(requeue_stale(60), 1)
+        self.assertEqual(self.jobs.get().status, Job.PENDING)
+
+
+@test_english
+@remove_rollbar
+@override_settings(JOBS={**settings.JOBS, "HEARTBEAT_SECONDS": 0.05})
+class TestJobBatch(TransactionTestCase):
+    def setUp(self) -> None:
+        calls.clear()
+        self.addCleanup(calls.clear)
+
+    def test_waiting_job_is_not_run_twice(self) -> None:
+        """
+        Test that a job waiting behind one that outlives the stale timeout
+            keeps its lock and is not claimed by another worker.
+        """
+        enqueue("test.sleep", {"seconds": 0.6})
+        enqueue("test.record", {"n": 2})
+        claimed = claim_jobs("worker-1", 10)
+        taken = []
+
+        def other_worker():
+            time.sleep(0.4)
+            try:
+                requeue_stale(0.2)
+                taken.extend(claim_jobs("worker-2", 10))
+            finally:
+                connections.close_all()
+
+        thread = threading.Thread(target=other_worker)
+        thread.start()
+        result = run_batch(claimed, threading.Event())
+        thread.join()
+
+        self.assertEqual(result, (2, 0))
+        self.assertEqual(taken, [])
+        self.assertEqual(calls, [{"seconds": 0.6}, {"n": 2}])
+        self.assertEqual(Job.objects.filter(status=Job.DONE).count(), 2)
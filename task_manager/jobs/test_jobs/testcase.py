@@ -0,0 +1,33 @@
+import time
+
+from django.test import TestCase
+
+from task_manager.jobs.queue import job, registry
+from task_manager.utils import remove_rollbar, test_english
+
+calls = []
+
+
+@job("test.record")
+def record(payload):
+    calls.append(payload)
+
+
+@job("test.fail", max_attempts=2)
+def fail(payload):
+    raise RuntimeError("boom")
+
+
+@job("test.sleep")
+def sleep(payload):
+    time.sleep(payload["seconds"])
+    calls.append(payload)
+
+
+@test_english
+@remove_rollbar
+class JobsTestCase(TestCase):
+    def setUp(self) -> None:
+        calls.clear()
+        self.addCleanup(calls.clear)
+        self.assertIn("test.record", registry)
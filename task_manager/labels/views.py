@@ -3,12 +3,25 @@ from django.views.generic import ListView, CreateView, UpdateView, DeleteView
 from django.utils.translation import gettext_lazy as _
 from django.contrib.messages.views import SuccessMessageMixin
 
-from task_manager.mixins import AuthRequiredMixin, DeleteProtectionMixin
+from task_manager.conditional import ConditionalGetMixin
+from task_manager.rows import ListRowsMixin
+from task_manager.mixins import (
+    AuthRequiredMixin,
+    DeleteProtectionMixin,
+    ListTemplateEngineMixin,
+)
+from task_manager.users.models import User
 from .models import Label
 from .forms import LabelForm
 
 
-class LabelsListView(AuthRequiredMixin, ListView):
+class LabelsListView(
+    AuthRequiredMixin,
+    ConditionalGetMixin,
+    ListTemplateEngineMixin,
+    ListRowsMixin,
+    ListView,
+):
     """
     Show all labels.
 
@@ -18,6 +31,12 @@ class LabelsListView(AuthRequiredMixin, ListView):
     template_name = "labels/labels.html"
     model = Label
     context_object_name = "labels"
+    conditional_models = (Label, User)
+    row_urls = {"update_url": "label_update", "delete_url": "label_delete"}
+    row_dates = {"created": "created_at"}
+
+    def get_row(self, label):
+        return {"id": label.pk, "name": label.name}
 
     def get_context_data(self, **kwargs):
         context = {
@@ -0,0 +1,30 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from task_manager.warmup import warm_up
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile templates, resolve URLs and load translations as a fresh "
+        "worker does before its first request, and show how long it took."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--json", action="store_true", help="Output JSON instead of text."
+        )
+
+    def handle(self, *args, **options):
+        results = warm_up()
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        self.stdout.write(f"{'phase':<14}{'count':>8}{'ms':>10}")
+        for row in results:
+            self.stdout.write(
+                f"{row['phase']:<14}{row['count']:>8}{row['ms']:>10.1f}"
+            )
@@ -0,0 +1,155 @@
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+
+from task_manager import compression, routers
+from task_manager.monitoring.metrics import metrics
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+CSRF_FIELD = b'name="csrfmiddlewaretoken"'
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Route reads of safe requests to replicas with read-your-writes.
+
+    A request that writes to the database (or uses an unsafe method) sets
+    a cookie keeping the browser on the primary for
+    `REPLICA_STICKY_SECONDS`, so the page after a redirect, e.g. `/tasks/`
+    after creating a task, always shows the change. Disabled when no
+    replicas are configured.
+    """
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.cookie_name = settings.REPLICA_STICKY_COOKIE_NAME
+        self.window = settings.REPLICA_STICKY_SECONDS
+
+    def is_sticky(self, request):
+        try:
+            return float(request.COOKIES.get(self.cookie_name, 0)) > time.time()
+        except ValueError:
+            return False
+
+    def __call__(self, request):
+        use_replica = request.method in SAFE_METHODS and not self.is_sticky(
+            request
+        )
+        token = routers.begin_request(use_replica)
+        try:
+            response = self.get_response(request)
+        finally:
+            state = routers.end_request(token)
+
+        if state.wrote or request.method not in SAFE_METHODS:
+            response.set_cookie(
+                self.cookie_name,
+                f"{time.time() + self.window:.3f}",
+                max_age=self.window,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class CompressionMiddleware:
+    """
+    Compress HTML and JSON responses with the best encoding the client
+        accepts.
+
+    Configured by `RESPONSE_COMPRESSION`. Responses below `MIN_SIZE` bytes
+    are sent as they are; streamed responses are compressed chunk by chunk,
+    except server-sent events, whose content type is not listed.
+
+    BREACH recovers secrets from the compressed size of pages that also
+    reflect attacker-controlled input. With `BREACH_PROTECTION` a page
+    with a CSRF form field (or, for streamed responses, any request with a
+    CSRF secret) is left uncompressed when the request carries input, a
+    query string or a form submission. Pages without input still compress,
+    and Django masks the token differently in every response.
+    """
+
+    def __init__(self, get_response):
+        config = settings.RESPONSE_COMPRESSION
+        if not config["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.config = config
+        self.encodings = [
+            encoding
+            for encoding in config["ENCODINGS"]
+            if encoding in compression.COMPRESSORS
+        ]
+
+    def is_breach_exposed(self, request, response):
+        if not self.config["BREACH_PROTECTION"]:
+            return False
+        if not request.GET and request.method in SAFE_METHODS:
+            return False
+        if response.streaming:
+            return "CSRF_COOKIE" in request.META
+        return CSRF_FIELD in response.content
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        content_type = response.get("Content-Type", "").split(";")[0]
+        if (
+            content_type.strip() not in self.config["CONTENT_TYPES"]
+            or response.has_header("Content-Encoding")
+            or (
+                not response.streaming
+                and len(response.content) < self.config["MIN_SIZE"]
+            )
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if self.is_breach_exposed(request, response):
+            return response
+        encoding = compression.choose_encoding(
+            request.META.get("HTTP_ACCEPT_ENCODING", ""), self.encodings
+        )
+        if encoding is None:
+            return response
+        level = self.config["LEVELS"][encoding]
+
+        if response.streaming:
+            stream = (
+                compression.acompress_stream
+                if response.is_async
+                else compression.compress_stream
+            )
+            response.streaming_content = stream(
+                encoding, level, response.streaming_content
+            )
+            del response["Content-Length"]
+        else:
+            compressed = compression.compress(encoding, level, response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            metrics.inc(
+                "response_compression_bytes_in_total",
+                len(response.content),
+                "Response bytes before compression.",
+                encoding=encoding,
+            )
+            metrics.inc(
+                "response_compression_bytes_out_total",
+                len(compressed),
+                "Response bytes after compression.",
+                encoding=encoding,
+            )
+            response.content = compressed
+            response["Content-Length"] = str(len(compressed))
+
+        # The body differs from the uncompressed one the ETag was made for.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = encoding
+        return response
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import reverse_lazy
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
@@ -96,3 +97,16 @@ class AuthorDeletionMixin(UserPassesTestMixin):
         """
         messages.error(self.request, self.author_message)
         return redirect(self.author_url)
+
+
+class ListTemplateEngineMixin:
+    """
+    Mixin to render a list page with the engine chosen in settings.
+
+    LIST_TEMPLATE_ENGINE names the template engine: "django" renders
+    templates/, "jinja2" the equivalent templates in jinja2/.
+    """
+
+    @property
+    def template_engine(self):
+        return settings.LIST_TEMPLATE_ENGINE
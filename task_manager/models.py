@@ -0,0 +1,14 @@
+from django.db import models
+
+
+class TableVersion(models.Model):
+    """
+    Change counter of one database table.
+
+    Bumped after every write to a tracked model, so pages built from these
+    tables can be validated without querying or rendering them.
+    """
+
+    table = models.CharField(max_length=100, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
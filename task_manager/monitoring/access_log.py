@@ -0,0 +1,39 @@
+import time
+
+
+class QueryTimer:
+    """
+    Execute wrapper summing the time spent in database queries.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+class RenderTimer:
+    """
+    Wrap the `render()` of a TemplateResponse to measure rendering time.
+
+    Queries run lazily by the template are included in the render time as
+    well as in the database time.
+    """
+
+    def __init__(self, render):
+        self.render = render
+        self.duration = None
+
+    def __call__(self):
+        start = time.perf_counter()
+        try:
+            return self.render()
+        finally:
+            self.duration = time.perf_counter() - start
@@ -0,0 +1,123 @@
+import time
+import uuid
+
+from django.conf import settings
+from django.db import transaction
+from django.test import Client
+from django.urls import reverse
+
+from task_manager import compression
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.tasks.views import TaskChunkView
+from task_manager.users.models import User
+from .stats import percentile
+
+
+def seed_tasks(rows):
+    """
+    Create a user with `rows` tasks.
+
+    Returns:
+        User: Author and executor of the tasks.
+    """
+    suffix = uuid.uuid4().hex[:8]
+    user = User.objects.create(
+        username=f"benchmark_{suffix}", first_name="Bench", last_name="Mark"
+    )
+    status = Status.objects.create(name=f"benchmark {suffix}")
+    Label.objects.create(name=f"benchmark {suffix}")
+    Task.objects.bulk_create(
+        Task(
+            name=f"Benchmark task {number} {suffix}",
+            description="Compression benchmark task",
+            status=status,
+            author=user,
+            executor=user,
+        )
+        for number in range(rows)
+    )
+    return user
+
+
+def chunk_urls(client):
+    """
+    Walk the chunk endpoint over all tasks in chunks of its maximum size.
+
+    Returns:
+        list[str]: URL of every chunk.
+    """
+    base = reverse("task_chunk")
+    urls = []
+    after = 0
+    while after is not None:
+        urls.append(f"{base}?after={after}&limit={TaskChunkView.max_limit}")
+        after = client.get(urls[-1]).json()["next"]
+    return urls
+
+
+def run_benchmark(rows=10000, repeat=3, path=None):
+    """
+    Request the whole task list with every available encoding, and without
+        one, over `rows` seeded tasks.
+
+    The list is read as the page script does, from every chunk of the
+    chunk endpoint; sizes and times are totals over the chunks. A `path`
+    measures that single page instead. The tasks are created in a
+    transaction that is rolled back, so the database is left unchanged.
+
+    Returns:
+        list[dict]: Per encoding the response bytes, ratio to the
+            uncompressed size, p50 and max request latency, and the time
+            spent compressing the bodies alone.
+    """
+    config = settings.RESPONSE_COMPRESSION
+    encodings = [
+        encoding
+        for encoding in config["ENCODINGS"]
+        if encoding in compression.COMPRESSORS
+    ]
+    results = []
+    with transaction.atomic():
+        client = Client(SERVER_NAME="localhost")
+        client.force_login(seed_tasks(rows))
+        urls = [path] if path else chunk_urls(client)
+
+        plain = None
+        for encoding in ("identity", *encodings):
+            latencies = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                responses = [
+                    client.get(url, HTTP_ACCEPT_ENCODING=encoding)
+                    for url in urls
+                ]
+                latencies.append((time.perf_counter() - start) * 1000)
+            if plain is None:
+                plain = [response.content for response in responses]
+
+            compress_ms = 0.0
+            if encoding != "identity":
+                start = time.perf_counter()
+                for content in plain:
+                    compression.compress(
+                        encoding, config["LEVELS"][encoding], content
+                    )
+                compress_ms = (time.perf_counter() - start) * 1000
+            size = sum(len(response.content) for response in responses)
+            results.append(
+                {
+                    "encoding": responses[0].get(
+                        "Content-Encoding", "identity"
+                    ),
+                    "requests": len(urls),
+                    "bytes": size,
+                    "ratio": size / sum(len(content) for content in plain),
+                    "p50_ms": percentile(latencies, 50),
+                    "max_ms": max(latencies),
+                    "compress_ms": compress_ms,
+                }
+            )
+        transaction.set_rollback(True)
+    return results
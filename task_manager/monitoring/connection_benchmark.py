@@ -0,0 +1,82 @@
+import copy
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db.utils import ConnectionHandler
+
+from task_manager.postgres import postgres_pool_options
+from .stats import percentile
+
+MODES = {
+    # The previous production setup: one connection per thread, pinged at
+    # the start of every request.
+    "persistent": {"CONN_MAX_AGE": 600, "CONN_HEALTH_CHECKS": True},
+    # A new connection for every request.
+    "per_request": {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False},
+    # Connections borrowed from the psycopg pool.
+    "pool": {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False},
+}
+
+
+def build_settings(base, mode, pool_size):
+    settings_dict = copy.deepcopy(base)
+    settings_dict["OPTIONS"] = {
+        key: value
+        for key, value in settings_dict.get("OPTIONS", {}).items()
+        if key != "pool"
+    }
+    settings_dict.update(MODES[mode])
+    if mode == "pool":
+        settings_dict["OPTIONS"].update(
+            postgres_pool_options(min_size=pool_size, max_size=pool_size)
+        )
+    return settings_dict
+
+
+def run_mode(base, mode, threads, requests, pool_size):
+    """
+    Emulate `requests` requests per thread with one query each.
+
+    Every request runs the same connection management as Django's
+    request_started/request_finished handlers around a trivial query, so
+    the measured latency is dominated by connection overhead.
+
+    Returns:
+        dict: Requests, throughput and p50/p95/p99 latency of the mode.
+    """
+    alias = f"benchmark_{mode}"
+    handler = ConnectionHandler({alias: build_settings(base, mode, pool_size)})
+
+    def worker(_):
+        connection = handler[alias]
+        latencies = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            connection.close_if_unusable_or_obsolete()
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            connection.close_if_unusable_or_obsolete()
+            latencies.append((time.perf_counter() - start) * 1000)
+        connection.close()
+        return latencies
+
+    if mode == "pool":
+        handler[alias].pool.wait()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies = [
+            value
+            for values in executor.map(worker, range(threads))
+            for value in values
+        ]
+    elapsed = time.perf_counter() - started
+    if mode == "pool":
+        handler[alias].close_pool()
+
+    return {
+        "mode": mode,
+        "requests": len(latencies),
+        "requests_per_s": len(latencies) / elapsed,
+        **{f"p{rank}_ms": percentile(latencies, rank) for rank in (50, 95, 99)},
+    }
@@ -0,0 +1,221 @@
+"""
+Queued and deduplicated Rollbar reporting.
+
+Rollbar's default handler starts a thread and an HTTPS request per error,
+so a failing endpoint under load spawns one thread per request and stalls
+on the network. Here payloads are still built on the request thread (they
+capture the request and the traceback), but only put on a bounded queue;
+one daemon thread per process ships them in batches. Rollbar has no batch
+item endpoint, so a batch is sent back to back over one keep-alive
+session.
+
+Identical tracebacks seen again within `DEDUP_SECONDS` are dropped before
+the payload is built. Queued, sent, dropped and deduplicated reports are
+counted in the metrics registry.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import queue
+import threading
+import time
+import traceback
+
+import rollbar
+from rollbar.lib import events
+
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+_reporter = None
+_lock = threading.Lock()
+
+
+def fingerprint(exc_info):
+    """
+    Return a key identifying the exception type and the code path that
+        raised it, ignoring the message and local values.
+    """
+    exc_type, _, tb = exc_info
+    parts = [f"{exc_type.__module__}.{exc_type.__qualname__}"]
+    for frame in traceback.extract_tb(tb):
+        parts.append(f"{frame.filename}:{frame.lineno}:{frame.name}")
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()
+
+
+class ErrorReporter:
+    """
+    Bounded queue of Rollbar payloads drained by a background thread.
+
+    Args:
+        queue_size (int): Payloads kept waiting; new ones are dropped and
+            counted when it is full.
+        batch_size (int): Payloads sent per batch.
+        flush_interval (float): Seconds a batch waits to fill up.
+        dedup_seconds (float): Window in which repeated tracebacks are
+            reported once.
+        send (Callable[[dict], None] | None): Sends one payload,
+            `rollbar.send_payload` if None.
+    """
+
+    def __init__(
+        self, queue_size, batch_size, flush_interval, dedup_seconds, send=None
+    ):
+        self.queue = queue.Queue(queue_size)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dedup_seconds = dedup_seconds
+        self.send = send or self.send_to_rollbar
+        self.seen = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.thread = None
+        self.pid = None
+
+    def filter_exception(self, exc_info, **kwargs):
+        """
+        Rollbar exception handler dropping tracebacks reported recently.
+        """
+        if exc_info is None or exc_info[0] is None:
+            return exc_info
+        key = fingerprint(exc_info)
+        now = time.monotonic()
+        with self.lock:
+            if len(self.seen) > 1000:
+                self.seen = {
+                    seen_key: seen_at
+                    for seen_key, seen_at in self.seen.items()
+                    if now - seen_at < self.dedup_seconds
+                }
+            seen_at = self.seen.get(key)
+            if seen_at is not None and now - seen_at < self.dedup_seconds:
+                duplicate = True
+            else:
+                duplicate = False
+                self.seen[key] = now
+        if duplicate:
+            metrics.inc(
+                "error_reports_deduplicated_total",
+                help_text="Error reports skipped as recent duplicates.",
+            )
+            return False
+        return exc_info
+
+    def enqueue(self, payload, **kwargs):
+        """
+        Rollbar payload handler queueing payloads instead of sending them.
+
+        Payloads being sent by `send_batch` pass through.
+        """
+        if getattr(self.local, "sending", False):
+            return payload
+        self.start()
+        try:
+            self.queue.put_nowait(payload)
+        except queue.Full:
+            metrics.inc(
+                "error_reports_dropped_total",
+                help_text="Error reports dropped because the queue was full.",
+            )
+        else:
+            metrics.inc(
+                "error_reports_queued_total",
+                help_text="Error reports queued for sending.",
+            )
+        return False
+
+    def start(self):
+        """
+        Start the sending thread once per process.
+        """
+        if self.pid == os.getpid() and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.pid == os.getpid() and self.thread.is_alive():
+                return
+            if self.pid != os.getpid():
+                # A forked worker inherits the payloads of its parent.
+                self.queue = queue.Queue(self.queue.maxsize)
+            self.thread = threading.Thread(
+                target=self.run, name="rollbar-reporter", daemon=True
+            )
+            self.pid = os.getpid()
+            self.thread.start()
+
+    def run(self):
+        while True:
+            self.send_batch(self.next_batch())
+
+    def next_batch(self, block=True):
+        """
+        Wait for a payload, then collect more for up to `flush_interval`
+            seconds or until the batch is full.
+        """
+        batch = []
+        try:
+            batch.append(self.queue.get(block=block))
+        except queue.Empty:
+            return batch
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if not block or timeout <= 0:
+                timeout = 0
+            try:
+                batch.append(self.queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def send_batch(self, batch):
+        self.local.sending = True
+        for payload in batch:
+            try:
+                self.send(payload)
+            except Exception:
+                logger.exception("Could not send an error report")
+                metrics.inc(
+                    "error_reports_failed_total",
+                    help_text="Error reports that could not be sent.",
+                )
+            else:
+                metrics.inc(
+                    "error_reports_sent_total",
+                    help_text="Error reports sent to Rollbar.",
+                )
+        self.local.sending = False
+
+    def send_to_rollbar(self, payload):
+        rollbar.send_payload(payload, payload.get("access_token"))
+
+    def flush(self):
+        """
+        Send the queued payloads from the calling thread.
+        """
+        while batch := self.next_batch(block=False):
+            self.send_batch(batch)
+
+
+def install_reporter(config):
+    """
+    Route Rollbar reports of this process through an `ErrorReporter`.
+
+    Returns:
+        ErrorReporter: The installed reporter, shared by repeated calls.
+    """
+    global _reporter
+    with _lock:
+        if _reporter is None:
+            _reporter = ErrorReporter(
+                config["QUEUE_SIZE"],
+                config["BATCH_SIZE"],
+                config["FLUSH_INTERVAL"],
+                config["DEDUP_SECONDS"],
+            )
+            events.add_exception_info_handler(_reporter.filter_exception)
+            events.add_payload_handler(_reporter.enqueue)
+            atexit.register(_reporter.flush)
+    return _reporter
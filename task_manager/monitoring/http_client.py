@@ -0,0 +1,68 @@
+import time
+import urllib.error
+import urllib.request
+from http.cookiejar import CookieJar
+from urllib.parse import urlencode, urljoin
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class HttpSession:
+    """
+    Minimal stdlib HTTP client keeping cookies between requests.
+
+    Redirects are not followed, so each call times exactly one request.
+    Responses with 4xx/5xx statuses are returned, not raised.
+    """
+
+    def __init__(self, base_url, timeout=30):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.cookies = CookieJar()
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(self.cookies), _NoRedirect
+        )
+
+    def get_cookie(self, name):
+        for cookie in self.cookies:
+            if cookie.name == name:
+                return cookie.value
+        return None
+
+    def request(self, method, path, query=None, data=None, headers=None):
+        """
+        Send a request and measure its latency.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Path relative to the base URL.
+            query (dict | None): Query parameters; values may be lists.
+            data (dict | None): Form fields sent url-encoded.
+            headers (dict | None): Extra request headers.
+
+        Returns:
+            tuple[int, bytes, float]: Status code (0 on network errors),
+                body and latency in milliseconds.
+        """
+        url = urljoin(self.base_url, path)
+        if query:
+            url += "?" + urlencode(query, doseq=True)
+        body = urlencode(data, doseq=True).encode() if data else None
+        request = urllib.request.Request(
+            url, data=body, method=method, headers=headers or {}
+        )
+        if self.base_url.startswith("http"):
+            request.add_header("Referer", self.base_url)
+
+        start = time.perf_counter()
+        try:
+            with self.opener.open(request, timeout=self.timeout) as response:
+                status, content = response.status, response.read()
+        except urllib.error.HTTPError as error:
+            status, content = error.code, error.read()
+        except (urllib.error.URLError, TimeoutError, ConnectionError):
+            status, content = 0, b""
+        return status, content, (time.perf_counter() - start) * 1000
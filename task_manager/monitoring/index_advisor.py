@@ -0,0 +1,332 @@
+import re
+import statistics
+import time
+from dataclasses import dataclass, field
+
+from django.apps import apps
+from django.db import models, transaction
+from django.test import Client
+
+from .slow_queries import explain, is_explainable, normalize_sql
+
+_RELATION = re.compile(
+    r'(?:FROM|JOIN)\s+"(\w+)"'
+    r"(?:\s+(?!ON\b|WHERE\b|INNER\b|LEFT\b|ORDER\b|GROUP\b|LIMIT\b)(\w+))?",
+    re.IGNORECASE,
+)
+_PREDICATE = re.compile(
+    r'"?(\w+)"?\."(\w+)"\s*(=|IN\b|IS\b|<=|>=|<|>|LIKE\b|BETWEEN\b)',
+    re.IGNORECASE,
+)
+_ORDER_COLUMN = re.compile(r'"?(\w+)"?\."(\w+)"(?:\s+(ASC|DESC))?')
+_WHERE = re.compile(
+    r"\bWHERE\b(.*?)(?=\bGROUP BY\b|\bORDER BY\b|\bLIMIT\b|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_ORDER_BY = re.compile(
+    r"\bORDER BY\b(.*?)(?=\bLIMIT\b|\bOFFSET\b|$)", re.IGNORECASE | re.DOTALL
+)
+
+_SQLITE_SCAN = re.compile(
+    r"^SCAN (?:TABLE )?(\w+)(?!.*USING (?:COVERING )?INDEX)"
+)
+_SQLITE_SORT = re.compile(r"USE TEMP B-TREE FOR (?:ORDER BY|GROUP BY|DISTINCT)")
+_POSTGRES_SCAN = re.compile(r"Seq Scan on (\w+)")
+_POSTGRES_SORT = re.compile(r"(?:^|->\s*)Sort\b|Sort Key:")
+
+
+@dataclass
+class Finding:
+    """
+    Plan analysis of one replayed query.
+    """
+
+    sql: str
+    params: list
+    duration_ms: float
+    plan: list
+    count: int = 1
+    scans: list = field(default_factory=list)
+    sorts: bool = False
+
+
+@dataclass
+class Proposal:
+    """
+    Index suggested for a model, with the queries that would use it.
+    """
+
+    model: type
+    fields: list
+    findings: list = field(default_factory=list)
+    measured_ms: float | None = None
+
+    @property
+    def name(self):
+        index = models.Index(fields=self.fields)
+        index.set_name_with_model(self.model)
+        return index.name
+
+    @property
+    def affected_ms(self):
+        return sum(
+            finding.duration_ms * finding.count for finding in self.findings
+        )
+
+    @property
+    def benefit_ms(self):
+        """
+        Measured saving if available, otherwise the time of the affected
+            queries as an upper bound.
+        """
+        if self.measured_ms is None:
+            return self.affected_ms
+        return max(self.affected_ms - self.measured_ms, 0.0)
+
+    def as_operation(self):
+        """
+        Render the proposal as a migration operation.
+        """
+        fields = ", ".join(f'"{name}"' for name in self.fields)
+        return (
+            "migrations.AddIndex(\n"
+            f'    model_name="{self.model._meta.model_name}",\n'
+            f"    index=models.Index(fields=[{fields}], "
+            f'name="{self.name}"),\n'
+            "),"
+        )
+
+    def as_dict(self):
+        return {
+            "app_label": self.model._meta.app_label,
+            "model": self.model.__name__,
+            "table": self.model._meta.db_table,
+            "fields": self.fields,
+            "name": self.name,
+            "queries": len(self.findings),
+            "affected_ms": round(self.affected_ms, 3),
+            "measured_ms": (
+                None if self.measured_ms is None else round(self.measured_ms, 3)
+            ),
+            "benefit_ms": round(self.benefit_ms, 3),
+            "operation": self.as_operation(),
+        }
+
+
+class QueryRecorder:
+    """
+    Execute wrapper collecting read statements together with their params.
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        if not many and is_explainable(sql):
+            self.queries.append((sql, list(params or ())))
+        return execute(sql, params, many, context)
+
+
+def replay_requests(connection, entries, user=None):
+    """
+    Replay recorded GET requests and collect the queries they run.
+
+    Args:
+        connection: Database connection to record queries on.
+        entries (Iterable[dict]): Records with 'path' and optionally 'method'
+            and 'query'. Non-GET records are skipped.
+        user (User | None): User to log the replaying client in as.
+
+    Returns:
+        list[tuple[str, list]]: Recorded statements and their params.
+    """
+    client = Client(HTTP_HOST="localhost", raise_request_exception=False)
+    if user is not None:
+        client.force_login(user)
+
+    recorder = QueryRecorder()
+    with connection.execute_wrapper(recorder):
+        for entry in entries:
+            if entry.get("method", "GET").upper() != "GET":
+                continue
+            client.get(entry["path"], entry.get("query") or {})
+    return recorder.queries
+
+
+def time_query(connection, sql, params, repeat):
+    """
+    Return the median execution time of a statement in milliseconds.
+    """
+    durations = []
+    with connection.cursor() as cursor:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            cursor.execute(sql, params)
+            cursor.fetchall()
+            durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def analyze(connection, queries, repeat=3):
+    """
+    Time and explain replayed queries, keeping one finding per query shape.
+
+    Repeated shapes are only counted; the first occurrence is timed and
+    explained on behalf of all of them.
+
+    Returns:
+        list[Finding]: Findings of queries with sequential scans or sorts.
+    """
+    findings = {}
+    for sql, params in queries:
+        shape = normalize_sql(sql)
+        if shape in findings:
+            findings[shape].count += 1
+            continue
+
+        finding = Finding(
+            sql,
+            params,
+            time_query(connection, sql, params, repeat),
+            explain(connection, sql, params),
+        )
+        aliases = parse_aliases(sql)
+        for line in finding.plan:
+            if connection.vendor == "postgresql":
+                scan = _POSTGRES_SCAN.search(line)
+                sort = _POSTGRES_SORT.search(line)
+            else:
+                scan = _SQLITE_SCAN.search(line.strip())
+                sort = _SQLITE_SORT.search(line)
+            if scan:
+                finding.scans.append(aliases.get(scan.group(1), scan.group(1)))
+            finding.sorts = finding.sorts or bool(sort)
+        findings[shape] = finding
+
+    return [
+        finding
+        for finding in findings.values()
+        if finding.scans or finding.sorts
+    ]
+
+
+def parse_aliases(sql):
+    """
+    Map table aliases used in a statement to table names.
+    """
+    aliases = {}
+    for table, alias in _RELATION.findall(sql):
+        aliases[table] = table
+        if alias:
+            aliases[alias] = table
+    return aliases
+
+
+def parse_columns(sql):
+    """
+    Collect filtered and ordered columns of a statement per table.
+
+    Returns:
+        dict[str, list[str]]: Columns in index order: equality predicates,
+            then range predicates, then ORDER BY columns.
+    """
+    aliases = parse_aliases(sql)
+    equality, ranges, ordering = {}, {}, {}
+
+    where = _WHERE.search(sql)
+    if where:
+        for alias, column, operator in _PREDICATE.findall(where.group(1)):
+            target = (
+                equality if operator.upper() in ("=", "IN", "IS") else ranges
+            )
+            target.setdefault(aliases.get(alias, alias), []).append(column)
+
+    order_by = _ORDER_BY.search(sql)
+    if order_by:
+        for alias, column, _ in _ORDER_COLUMN.findall(order_by.group(1)):
+            ordering.setdefault(aliases.get(alias, alias), []).append(column)
+
+    columns = {}
+    for source in (equality, ranges, ordering):
+        for table, names in source.items():
+            table_columns = columns.setdefault(table, [])
+            table_columns.extend(
+                name for name in names if name not in table_columns
+            )
+    return columns
+
+
+def get_models_by_table():
+    return {model._meta.db_table: model for model in apps.get_models()}
+
+
+def is_indexed(model, field_names):
+    """
+    Check whether an existing index already starts with the given fields.
+    """
+    if len(field_names) == 1:
+        first = model._meta.get_field(field_names[0])
+        if first.primary_key or first.unique or first.db_index:
+            return True
+
+    existing = [list(index.fields) for index in model._meta.indexes]
+    existing += [list(fields) for fields in model._meta.unique_together]
+    for constraint in model._meta.constraints:
+        existing.append(list(getattr(constraint, "fields", ())))
+    return any(fields[: len(field_names)] == field_names for fields in existing)
+
+
+def propose(findings):
+    """
+    Turn findings into index proposals for the scanned or sorted tables.
+
+    Returns:
+        list[Proposal]: Proposals ordered by affected time, largest first.
+    """
+    models_by_table = get_models_by_table()
+    proposals = {}
+    for finding in findings:
+        columns = parse_columns(finding.sql)
+        tables = set(finding.scans)
+        if finding.sorts:
+            tables.update(columns)
+        for table in tables:
+            model = models_by_table.get(table)
+            if model is None or not columns.get(table):
+                continue
+            by_column = {
+                getattr(item, "column", None): item.name
+                for item in model._meta.concrete_fields
+            }
+            fields = [
+                by_column[column]
+                for column in columns[table]
+                if column in by_column
+            ]
+            if not fields or is_indexed(model, fields):
+                continue
+            key = (model, tuple(fields))
+            proposal = proposals.setdefault(key, Proposal(model, fields))
+            proposal.findings.append(finding)
+
+    return sorted(
+        proposals.values(), key=lambda item: item.affected_ms, reverse=True
+    )
+
+
+def measure(connection, proposal, repeat=3):
+    """
+    Create the proposed index inside a rolled back transaction and time the
+        affected queries again.
+    """
+    index = models.Index(fields=proposal.fields, name=proposal.name)
+    statement = index.create_sql(proposal.model, connection.schema_editor())
+    with transaction.atomic(using=connection.alias):
+        with connection.cursor() as cursor:
+            cursor.execute(str(statement))
+        proposal.measured_ms = sum(
+            time_query(connection, finding.sql, finding.params, repeat)
+            * finding.count
+            for finding in proposal.findings
+        )
+        transaction.set_rollback(True, using=connection.alias)
@@ -0,0 +1,121 @@
+import atexit
+import json
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from queue import SimpleQueue
+
+
+def get_jsonl_logger(name, path, max_bytes, backup_count, buffered=False):
+    """
+    Return a logger that writes one JSON document per line to a rotating file.
+
+    The handler is attached once per logger and replaced only when the target
+    path changes, so re-instantiated middleware reuses the open file.
+
+    Args:
+        name (str): Logger name (e.g., 'task_manager.slow_queries').
+        path (str | Path): Location of the active JSONL file.
+        max_bytes (int): Size after which the file is rotated.
+        backup_count (int): Number of rotated files to keep.
+        buffered (bool): Hand records to a background writer thread through
+            an in-memory queue instead of writing on the calling thread.
+
+    Returns:
+        logging.Logger: Configured logger with propagation disabled.
+    """
+    path = Path(path).resolve()
+    logger = logging.getLogger(name)
+    if getattr(logger, "jsonl_path", None) == path:
+        return logger
+
+    close_jsonl_logger(logger)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    file_handler = RotatingFileHandler(
+        path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+    )
+    file_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    if buffered:
+        queue = SimpleQueue()
+        logger.jsonl_listener = QueueListener(queue, file_handler)
+        logger.jsonl_listener.start()
+        logger.addHandler(QueueHandler(queue))
+        if not getattr(logger, "jsonl_atexit", False):
+            atexit.register(close_jsonl_logger, logger)
+            logger.jsonl_atexit = True
+    else:
+        logger.addHandler(file_handler)
+
+    logger.jsonl_path = path
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+def flush_jsonl_logger(logger):
+    """
+    Wait until the background writer of a buffered logger has written every
+        queued record.
+    """
+    listener = getattr(logger, "jsonl_listener", None)
+    if listener is not None:
+        listener.stop()
+        listener.start()
+
+
+def close_jsonl_logger(logger):
+    """
+    Flush and detach the handlers attached by `get_jsonl_logger`.
+    """
+    listener = getattr(logger, "jsonl_listener", None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        logger.jsonl_listener = None
+
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.jsonl_path = None
+
+
+def write_record(logger, record):
+    """
+    Serialize a record as a single JSON line and pass it to the logger.
+    """
+    logger.info(json.dumps(record, default=str, ensure_ascii=False))
+
+
+def read_records(path):
+    """
+    Yield records from a JSONL file and its rotated backups.
+
+    Backups ('<path>.1', '<path>.2', ...) are read oldest first, followed by
+    the active file. Lines that are not valid JSON are skipped.
+
+    Args:
+        path (str | Path): Location of the active JSONL file.
+
+    Yields:
+        dict: One parsed record per line.
+    """
+    path = Path(path)
+    backups = sorted(
+        path.parent.glob(f"{path.name}.*"),
+        key=lambda item: (
+            int(item.suffix[1:]) if item.suffix[1:].isdigit() else 0
+        ),
+        reverse=True,
+    )
+    for file_path in [*backups, path]:
+        if not file_path.is_file():
+            continue
+        with open(file_path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
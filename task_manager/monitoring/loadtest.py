@@ -0,0 +1,254 @@
+import json
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.urls import reverse
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.users.models import User
+from .http_client import HttpSession
+
+STEPS = ("login", "list", "create", "filter", "update", "delete")
+
+_SLO = re.compile(r"^(\w+):p(\d+)=(\d+(?:\.\d+)?)$")
+
+
+def seed_users(count, password):
+    """
+    Create or reset `count` load test users and the status and label their
+        tasks use.
+
+    Returns:
+        tuple[list[dict], int, int]: Credentials with user ids, status id
+            and label id.
+    """
+    credentials = []
+    for number in range(1, count + 1):
+        user, _ = User.objects.get_or_create(
+            username=f"loadtest_user_{number}",
+            defaults={"first_name": "Load", "last_name": f"Test {number}"},
+        )
+        user.set_password(password)
+        user.save()
+        credentials.append(
+            {"username": user.username, "password": password, "id": user.pk}
+        )
+    status, _ = Status.objects.get_or_create(name="loadtest status")
+    label, _ = Label.objects.get_or_create(name="loadtest label")
+    return credentials, status.pk, label.pk
+
+
+def parse_slos(values):
+    """
+    Parse SLOs given as 'step:pNN=milliseconds'.
+
+    Returns:
+        list[tuple[str, int, float]]: Step, percentile and limit.
+
+    Raises:
+        ValueError: If a value does not match the format.
+    """
+    slos = []
+    for value in values:
+        match = _SLO.match(value)
+        if match is None:
+            raise ValueError(f"Invalid SLO {value!r}, expected step:p95=300")
+        step, rank, limit = match.groups()
+        slos.append((step, int(rank), float(limit)))
+    return slos
+
+
+def check_slos(summary, slos, max_error_rate):
+    """
+    Compare a summary with the SLOs.
+
+    Returns:
+        list[str]: Human readable violations, empty if all targets are met.
+    """
+    violations = []
+    for step, rank, limit in slos:
+        value = summary.get(step, {}).get(f"p{rank}_ms")
+        if value is None:
+            violations.append(f"{step}: no p{rank} measured")
+        elif value > limit:
+            violations.append(f"{step}: p{rank} {value:.1f}ms > {limit:.1f}ms")
+    for step, row in summary.items():
+        if row["error_rate"] > max_error_rate:
+            violations.append(
+                f"{step}: error rate {row['error_rate']:.2%} > "
+                f"{max_error_rate:.2%}"
+            )
+    return violations
+
+
+class VirtualUser:
+    """
+    One closed-loop client following the task flow of the browser tests.
+
+    After logging in, each iteration lists tasks, creates a task, filters
+    the task list for it, updates and deletes it. A new iteration starts
+    only when the previous one has finished. The id of the created task is
+    looked up, untimed, in the JSON chunks of the same filter.
+    """
+
+    def __init__(self, base_url, credentials, status_id, label_id, timeout):
+        self.client = HttpSession(base_url, timeout)
+        self.credentials = credentials
+        self.status_id = status_id
+        self.label_id = label_id
+        self.results = []
+
+    def step(self, name, method, path, query=None, data=None, expected=200):
+        if data is not None:
+            data = {
+                **data,
+                "csrfmiddlewaretoken": self.client.get_cookie(
+                    settings.CSRF_COOKIE_NAME
+                ),
+            }
+        status, content, latency_ms = self.client.request(
+            method, path, query, data
+        )
+        self.results.append(
+            {
+                "name": name,
+                "status": status,
+                "latency_ms": latency_ms,
+                "error": status != expected,
+            }
+        )
+        return status == expected, content.decode(errors="replace")
+
+    def login(self):
+        self.client.request("GET", reverse("login"))
+        ok, _ = self.step(
+            "login",
+            "POST",
+            reverse("login"),
+            data={
+                "username": self.credentials["username"],
+                "password": self.credentials["password"],
+            },
+            expected=302,
+        )
+        return ok
+
+    def iterate(self):
+        task_data = {
+            "name": f"loadtest {uuid.uuid4().hex}",
+            "description": "load test",
+            "status": self.status_id,
+            "executor": self.credentials["id"],
+            "labels": [self.label_id],
+        }
+        self.step("list", "GET", reverse("tasks"))
+        ok, _ = self.step(
+            "create",
+            "POST",
+            reverse("task_create"),
+            data=task_data,
+            expected=302,
+        )
+        if not ok:
+            return
+        query = {
+            "status": self.status_id,
+            "executor": self.credentials["id"],
+            "labels": self.label_id,
+            "own_tasks": "on",
+        }
+        pk = None
+        try:
+            self.step("filter", "GET", reverse("tasks"), query)
+            pk = self.find_task(query, task_data["name"])
+            if pk is None:
+                self.results[-1]["error"] = True
+                return
+            task_data["name"] += " updated"
+            self.step(
+                "update",
+                "POST",
+                reverse("task_update", args=[pk]),
+                data=task_data,
+                expected=302,
+            )
+        finally:
+            if pk is not None:
+                self.step(
+                    "delete",
+                    "POST",
+                    reverse("task_delete", args=[pk]),
+                    data={},
+                    expected=302,
+                )
+
+    def find_task(self, query, name):
+        """
+        Return the id of the task called `name` among the tasks matching
+            `query`, following the chunks of the chunk endpoint.
+        """
+        after = 0
+        while after is not None:
+            status, content, _ = self.client.request(
+                "GET", reverse("task_chunk"), {**query, "after": after}
+            )
+            if status != 200:
+                return None
+            chunk = json.loads(content)
+            for row in chunk["rows"]:
+                task = dict(zip(chunk["fields"], row))
+                if task["name"] == name:
+                    return task["id"]
+            after = chunk["next"]
+        return None
+
+
+def run_load_test(
+    base_url,
+    credentials,
+    status_id,
+    label_id,
+    duration=None,
+    iterations=None,
+    timeout=30,
+):
+    """
+    Run one virtual user per credential until the duration elapses or each
+        user completed `iterations` loops.
+
+    Returns:
+        tuple[list[dict], float]: Results of all steps and the wall time in
+            seconds.
+    """
+    deadline = time.monotonic() + duration if duration else None
+    stop = threading.Event()
+
+    def run(user_credentials):
+        user = VirtualUser(
+            base_url, user_credentials, status_id, label_id, timeout
+        )
+        if not user.login():
+            return user.results
+        done = 0
+        while not stop.is_set():
+            if iterations is not None and done >= iterations:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            user.iterate()
+            done += 1
+        return user.results
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(credentials)) as executor:
+        try:
+            per_user = list(executor.map(run, credentials))
+        finally:
+            stop.set()
+    elapsed = time.perf_counter() - started
+    return [result for results in per_user for result in results], elapsed
@@ -0,0 +1,154 @@
+import json
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from task_manager.monitoring.index_advisor import (
+    analyze,
+    measure,
+    propose,
+    replay_requests,
+)
+from task_manager.monitoring.jsonl import read_records
+from task_manager.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay captured queries or requests against the current schema, "
+        "report sequential scans and sorts and propose indexes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--queries",
+            help="JSONL file with 'statement' and 'params' records, e.g. a "
+            "slow query log written with SLOW_QUERY_CAPTURE_PARAMS.",
+        )
+        parser.add_argument(
+            "--requests",
+            help="JSONL file with recorded requests ('path', 'query'); only "
+            "GET requests are replayed.",
+        )
+        parser.add_argument(
+            "--user", help="Username to replay the recorded requests as."
+        )
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Executions per query when timing.",
+        )
+        parser.add_argument(
+            "--measure",
+            action="store_true",
+            help="Create each proposed index in a rolled back transaction "
+            "and time the affected queries with it.",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Output JSON instead of text."
+        )
+
+    def handle(self, *args, **options):
+        if not options["queries"] and not options["requests"]:
+            raise CommandError("Pass --queries and/or --requests.")
+
+        connection = connections[options["database"]]
+        queries = []
+        if options["queries"]:
+            queries += [
+                (record["statement"], record.get("params", []))
+                for record in read_records(options["queries"])
+                if "statement" in record
+            ]
+        if options["requests"]:
+            user = None
+            if options["user"]:
+                try:
+                    user = User.objects.get(username=options["user"])
+                except User.DoesNotExist:
+                    raise CommandError(f"Unknown user {options['user']!r}.")
+            queries += replay_requests(
+                connection, read_records(options["requests"]), user
+            )
+        if not queries:
+            raise CommandError("No queries to analyze.")
+
+        findings = analyze(connection, queries, options["repeat"])
+        proposals = propose(findings)
+        if options["measure"]:
+            for proposal in proposals:
+                measure(connection, proposal, options["repeat"])
+        proposals.sort(key=lambda item: item.benefit_ms, reverse=True)
+
+        if options["json"]:
+            self.stdout.write(
+                json.dumps(
+                    {
+                        "queries": len(queries),
+                        "findings": [
+                            {
+                                "sql": finding.sql,
+                                "count": finding.count,
+                                "duration_ms": round(finding.duration_ms, 3),
+                                "scans": finding.scans,
+                                "sorts": finding.sorts,
+                                "plan": finding.plan,
+                            }
+                            for finding in findings
+                        ],
+                        "proposals": [item.as_dict() for item in proposals],
+                    },
+                    indent=2,
+                    ensure_ascii=False,
+                )
+            )
+            return
+
+        self.write_report(len(queries), findings, proposals)
+
+    def write_report(self, total, findings, proposals):
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"{total} queries replayed, {len(findings)} shapes with "
+                "sequential scans or sorts"
+            )
+        )
+        for finding in findings:
+            problems = [f"scan {table}" for table in finding.scans]
+            if finding.sorts:
+                problems.append("sort")
+            self.stdout.write(
+                f"  x{finding.count} {finding.duration_ms:.2f}ms "
+                f"[{', '.join(problems)}] {finding.sql}"
+            )
+
+        if not proposals:
+            self.stdout.write(self.style.SUCCESS("No indexes to propose."))
+            return
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Proposed indexes"))
+        by_app = defaultdict(list)
+        for proposal in proposals:
+            by_app[proposal.model._meta.app_label].append(proposal)
+            measured = (
+                ""
+                if proposal.measured_ms is None
+                else f", {proposal.measured_ms:.2f}ms with index"
+            )
+            self.stdout.write(
+                f"  {proposal.model.__name__}({', '.join(proposal.fields)}): "
+                f"~{proposal.benefit_ms:.2f}ms saved "
+                f"({proposal.affected_ms:.2f}ms affected{measured})"
+            )
+
+        for app_label, app_proposals in by_app.items():
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(
+                    f"Migration operations for '{app_label}'"
+                )
+            )
+            for proposal in app_proposals:
+                self.stdout.write(proposal.as_operation())
@@ -0,0 +1,52 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from task_manager.monitoring.compression_benchmark import run_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare response size and latency of the whole task list, read in "
+        "chunks, for every available content encoding. Seeded tasks are "
+        "rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=10000, help="Tasks to seed."
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Requests per encoding.",
+        )
+        parser.add_argument(
+            "--path",
+            help="Request this single page instead of the task list chunks.",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Output JSON instead of text."
+        )
+
+    def handle(self, *args, **options):
+        results = run_benchmark(
+            options["rows"], options["repeat"], options["path"]
+        )
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        self.stdout.write(f"Requests per encoding: {results[0]['requests']}")
+        self.stdout.write(
+            f"{'encoding':<10}{'bytes':>12}{'ratio':>8}"
+            f"{'p50 ms':>10}{'max ms':>10}{'compress ms':>13}"
+        )
+        for row in results:
+            self.stdout.write(
+                f"{row['encoding']:<10}{row['bytes']:>12}{row['ratio']:>8.3f}"
+                f"{row['p50_ms']:>10.1f}{row['max_ms']:>10.1f}"
+                f"{row['compress_ms']:>13.1f}"
+            )
@@ -0,0 +1,68 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from task_manager.monitoring.connection_benchmark import MODES, run_mode
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-request connection overhead of persistent connections, "
+        "a connection per request and the psycopg 3 pool on PostgreSQL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=8,
+            help="Concurrent request threads, like gthread workers.",
+        )
+        parser.add_argument(
+            "--requests", type=int, default=500, help="Requests per thread."
+        )
+        parser.add_argument("--pool-size", type=int, default=4)
+        parser.add_argument(
+            "--modes", default=",".join(MODES), help="Modes to compare."
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Output JSON instead of text."
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        if connection.vendor != "postgresql":
+            raise CommandError("The benchmark needs a PostgreSQL database.")
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+        modes = [mode.strip() for mode in options["modes"].split(",")]
+        if "pool" in modes and not is_psycopg3:
+            raise CommandError("The pool mode needs psycopg 3 installed.")
+
+        results = [
+            run_mode(
+                connection.settings_dict,
+                mode,
+                options["threads"],
+                options["requests"],
+                options["pool_size"],
+            )
+            for mode in modes
+        ]
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        self.stdout.write(
+            f"{'mode':<13}{'requests':>10}{'req/s':>10}"
+            f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        )
+        for row in results:
+            self.stdout.write(
+                f"{row['mode']:<13}{row['requests']:>10}"
+                f"{row['requests_per_s']:>10.1f}{row['p50_ms']:>9.2f}"
+                f"{row['p95_ms']:>9.2f}{row['p99_ms']:>9.2f}"
+            )
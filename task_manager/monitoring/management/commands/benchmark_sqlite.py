@@ -0,0 +1,44 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from task_manager.monitoring.sqlite_benchmark import run_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare concurrent write throughput and lock errors of the default "
+        "SQLite configuration and the tuning profile."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Concurrent writer processes, like gunicorn workers.",
+        )
+        parser.add_argument(
+            "--writes", type=int, default=500, help="Transactions per worker."
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Output JSON instead of text."
+        )
+
+    def handle(self, *args, **options):
+        results = run_benchmark(options["workers"], options["writes"])
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        self.stdout.write(
+            f"{'profile':<10}{'committed':>11}{'lock errors':>13}"
+            f"{'seconds':>10}{'writes/s':>11}"
+        )
+        for row in results:
+            self.stdout.write(
+                f"{row['profile']:<10}{row['committed']:>11}"
+                f"{row['lock_errors']:>13}{row['elapsed_s']:>10.2f}"
+                f"{row['writes_per_s']:>11.1f}"
+            )
@@ -0,0 +1,72 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from task_manager.monitoring.template_benchmark import (
+    measure_row_cost,
+    run_benchmark,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare render time of the task, user, status and label lists with "
+        "the Django and the Jinja2 templates."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=5000, help="Objects in each list."
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Renders per template and engine.",
+        )
+        parser.add_argument(
+            "--language", help="Language to render in (default: LANGUAGE_CODE)."
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Output JSON instead of text."
+        )
+
+    def handle(self, *args, **options):
+        results = run_benchmark(
+            options["rows"], options["repeat"], options["language"]
+        )
+        row_cost = measure_row_cost(
+            options["rows"], options["repeat"], options["language"]
+        )
+
+        if options["json"]:
+            self.stdout.write(
+                json.dumps({"templates": results, "row": row_cost}, indent=2)
+            )
+            return
+
+        self.stdout.write(
+            f"{'template':<24}{'engine':<8}{'bytes':>10}"
+            f"{'p50 ms':>10}{'min ms':>10}{'speedup':>9}"
+        )
+        for row in results:
+            speedup = f"{row['speedup']:.2f}x" if "speedup" in row else ""
+            self.stdout.write(
+                f"{row['template']:<24}{row['engine']:<8}{row['bytes']:>10}"
+                f"{row['p50_ms']:>10.1f}{row['min_ms']:>10.1f}{speedup:>9}"
+            )
+
+        self.stdout.write("")
+        self.stdout.write("Task list, microseconds per row:")
+        self.stdout.write(
+            f"  {{% url %}} x3 + |date   {row_cost['tags_us']:>8.1f}"
+        )
+        self.stdout.write(
+            f"  row view-model       {row_cost['build_us']:>8.1f}"
+        )
+        self.stdout.write(
+            f"  render, django       {row_cost['render_django_us']:>8.1f}"
+        )
+        self.stdout.write(
+            f"  render, jinja2       {row_cost['render_jinja2_us']:>8.1f}"
+        )
@@ -0,0 +1,115 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.monitoring.loadtest import (
+    STEPS,
+    check_slos,
+    parse_slos,
+    run_load_test,
+    seed_users,
+)
+from task_manager.monitoring.stats import summarize
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a closed-loop load test of the task flow (login, list, create, "
+        "filter, update, delete) and check latency SLOs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://localhost:8000")
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=4,
+            help="Number of seeded virtual users running concurrently.",
+        )
+        parser.add_argument("--password", default="loadtest-password-52")
+        parser.add_argument(
+            "--duration", type=float, help="Run for this many seconds."
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            help="Loops per virtual user (default 10 without --duration).",
+        )
+        parser.add_argument(
+            "--slo",
+            action="append",
+            default=[],
+            help="Latency target as step:pNN=ms, e.g. list:p95=300. "
+            "Repeatable.",
+        )
+        parser.add_argument(
+            "--max-error-rate",
+            type=float,
+            default=0.0,
+            help="Highest tolerated error rate per step (0..1).",
+        )
+        parser.add_argument("--timeout", type=float, default=30)
+        parser.add_argument(
+            "--json", action="store_true", help="Output JSON instead of text."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            slos = parse_slos(options["slo"])
+        except ValueError as error:
+            raise CommandError(error)
+        iterations = options["iterations"]
+        if iterations is None and options["duration"] is None:
+            iterations = 10
+
+        credentials, status_id, label_id = seed_users(
+            options["users"], options["password"]
+        )
+        results, elapsed = run_load_test(
+            options["base_url"],
+            credentials,
+            status_id,
+            label_id,
+            options["duration"],
+            iterations,
+            options["timeout"],
+        )
+        summary = summarize(results)
+        ordered = {step: summary[step] for step in STEPS if step in summary}
+        for row in ordered.values():
+            row["throughput_rps"] = row["count"] / elapsed
+        violations = check_slos(ordered, slos, options["max_error_rate"])
+
+        if options["json"]:
+            self.stdout.write(
+                json.dumps(
+                    {
+                        "elapsed_s": elapsed,
+                        "steps": ordered,
+                        "violations": violations,
+                    },
+                    indent=2,
+                )
+            )
+        else:
+            self.write_report(ordered, elapsed)
+
+        if violations:
+            raise CommandError(
+                "SLO violated: " + "; ".join(violations), returncode=2
+            )
+        if not options["json"]:
+            self.stdout.write(self.style.SUCCESS("All SLOs met."))
+
+    def write_report(self, summary, elapsed):
+        self.stdout.write(f"Elapsed: {elapsed:.1f}s")
+        self.stdout.write(
+            f"{'step':<10}{'count':>7}{'rps':>8}{'err %':>8}"
+            f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        )
+        for step, row in summary.items():
+            self.stdout.write(
+                f"{step:<10}{row['count']:>7}{row['throughput_rps']:>8.1f}"
+                f"{row['error_rate'] * 100:>8.1f}{row['p50_ms']:>10.1f}"
+                f"{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}"
+            )
@@ -0,0 +1,91 @@
+import json
+import subprocess
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.monitoring.startup import profile_startup
+
+
+class Command(BaseCommand):
+    help = (
+        "Start the project in a fresh interpreter and report the time spent "
+        "evaluating settings, populating apps, loading the ASGI application "
+        "and importing each module."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--warm-up",
+            action="store_true",
+            help="Include the worker warm-up in the profile.",
+        )
+        parser.add_argument(
+            "--min-ms",
+            type=float,
+            default=5.0,
+            help="Hide imports with a smaller cumulative time.",
+        )
+        parser.add_argument(
+            "--depth", type=int, default=4, help="Levels of the import tree."
+        )
+        parser.add_argument(
+            "--top", type=int, default=10, help="Number of packages to show."
+        )
+        parser.add_argument(
+            "--budget-ms",
+            type=float,
+            help="Fail when the cold start takes longer.",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Output JSON instead of text."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            profile = profile_startup(options["warm_up"])
+        except subprocess.CalledProcessError as error:
+            raise CommandError(f"Startup failed:\n{error.stderr[-2000:]}")
+
+        if options["json"]:
+            self.stdout.write(json.dumps(profile, indent=2))
+        else:
+            self.write_report(profile, options)
+
+        budget = options["budget_ms"]
+        if budget is not None and profile["process_ms"] > budget:
+            raise CommandError(
+                f"Cold start took {profile['process_ms']:.0f} ms, "
+                f"over the budget of {budget:.0f} ms.",
+                returncode=2,
+            )
+
+    def write_report(self, profile, options):
+        self.stdout.write(f"Cold start: {profile['process_ms']:.1f} ms")
+        for phase, ms in profile["phases"].items():
+            self.stdout.write(f"  {phase:<14}{ms:>10.1f} ms")
+
+        self.stdout.write("")
+        self.stdout.write(f"{'package':<30}{'modules':>8}{'self ms':>10}")
+        for row in profile["packages"][: options["top"]]:
+            self.stdout.write(
+                f"{row['package']:<30}{row['modules']:>8}"
+                f"{row['self_ms']:>10.1f}"
+            )
+
+        self.stdout.write("")
+        self.stdout.write(f"{'cumulative ms':>13}{'self ms':>10}  module")
+        self.write_tree(profile["imports"], options, level=0)
+
+    def write_tree(self, nodes, options, level):
+        if level >= options["depth"]:
+            return
+        for node in sorted(
+            nodes, key=lambda node: node["cumulative_ms"], reverse=True
+        ):
+            if node["cumulative_ms"] < options["min_ms"]:
+                continue
+            self.stdout.write(
+                f"{node['cumulative_ms']:>13.1f}{node['self_ms']:>10.1f}  "
+                f"{'  ' * level}{node['module']}"
+            )
+            self.write_tree(node["children"], options, level + 1)
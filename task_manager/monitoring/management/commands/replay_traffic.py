@@ -0,0 +1,81 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.monitoring.jsonl import read_records
+from task_manager.monitoring.replay import TrafficReplayer
+from task_manager.monitoring.stats import summarize
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay captured traffic against a running server and report "
+        "latency percentiles and error rates per URL name."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            default=settings.TRAFFIC_CAPTURE["PATH"],
+            help="Captured traffic (rotated backups are included).",
+        )
+        parser.add_argument("--base-url", default="http://localhost:8000")
+        parser.add_argument("--concurrency", type=int, default=4)
+        parser.add_argument(
+            "--speedup",
+            type=float,
+            default=1.0,
+            help="Divide captured gaps between requests by this factor; "
+            "0 replays as fast as possible.",
+        )
+        parser.add_argument(
+            "--methods",
+            default="GET,HEAD",
+            help="Comma-separated methods to replay. Captures hold no "
+            "bodies, so unsafe methods are skipped by default.",
+        )
+        parser.add_argument("--limit", type=int, help="Replay at most N.")
+        parser.add_argument("--timeout", type=float, default=30)
+        parser.add_argument(
+            "--json", action="store_true", help="Output JSON instead of text."
+        )
+
+    def handle(self, *args, **options):
+        methods = {
+            method.strip().upper() for method in options["methods"].split(",")
+        }
+        entries = sorted(
+            (
+                record
+                for record in read_records(options["path"])
+                if record.get("method") in methods
+            ),
+            key=lambda record: record["ts"],
+        )[: options["limit"]]
+        if not entries:
+            raise CommandError("No captured requests to replay.")
+
+        replayer = TrafficReplayer(
+            options["base_url"],
+            options["concurrency"],
+            options["speedup"],
+            options["timeout"],
+        )
+        summary = summarize(replayer.run(entries))
+
+        if options["json"]:
+            self.stdout.write(json.dumps(summary, indent=2))
+            return
+
+        self.stdout.write(
+            f"{'url name':<30}{'count':>7}{'err %':>8}"
+            f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        )
+        for name, row in summary.items():
+            self.stdout.write(
+                f"{str(name)[:29]:<30}{row['count']:>7}"
+                f"{row['error_rate'] * 100:>8.1f}"
+                f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}"
+                f"{row['p99_ms']:>10.1f}"
+            )
@@ -0,0 +1,61 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from task_manager.monitoring.jsonl import read_records
+from task_manager.monitoring.slow_queries import aggregate
+
+
+class Command(BaseCommand):
+    help = "Aggregate the slow query log and show the worst offenders."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            default=settings.SLOW_QUERY_LOG["PATH"],
+            help="Slow query log to read (rotated backups are included).",
+        )
+        parser.add_argument(
+            "--order-by",
+            choices=("total", "max", "mean", "count"),
+            default="total",
+            help="Metric used to rank the queries.",
+        )
+        parser.add_argument(
+            "--limit", type=int, default=10, help="Number of queries to show."
+        )
+        parser.add_argument(
+            "--plans", action="store_true", help="Print captured plans."
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Output JSON instead of text."
+        )
+
+    def handle(self, *args, **options):
+        groups = aggregate(read_records(options["path"]), options["order_by"])
+        groups = groups[: options["limit"]]
+
+        if options["json"]:
+            self.stdout.write(json.dumps(groups, indent=2, ensure_ascii=False))
+            return
+
+        if not groups:
+            self.stdout.write("No slow queries recorded.")
+            return
+
+        for rank, group in enumerate(groups, start=1):
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(
+                    f"#{rank} {group['fingerprint']}  "
+                    f"count={group['count']}  "
+                    f"total={group['total']:.1f}ms  "
+                    f"mean={group['mean']:.1f}ms  "
+                    f"max={group['max']:.1f}ms"
+                )
+            )
+            self.stdout.write(f"  views: {', '.join(group['views'])}")
+            self.stdout.write(f"  sql:   {group['sql']}")
+            if options["plans"]:
+                for line in group["plan"]:
+                    self.stdout.write(f"  plan:  {line}")
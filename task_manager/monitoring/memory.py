@@ -0,0 +1,84 @@
+import linecache
+import threading
+import tracemalloc
+
+_IGNORED_FILES = (tracemalloc.__file__, linecache.__file__, "<frozen *>")
+
+
+def take_snapshot():
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, pattern) for pattern in _IGNORED_FILES]
+    )
+
+
+def top_allocation_sites(start, limit, frames):
+    """
+    Return the sites that allocated the most memory since the `start`
+        snapshot and still hold it.
+
+    Sites are grouped by traceback, so the same line reached through
+    different views is reported separately when `frames` > 1.
+
+    Returns:
+        list[dict]: Size and count growth and traceback ('file:line') of
+            each site.
+    """
+    key = "traceback" if frames > 1 else "lineno"
+    stats = sorted(
+        (
+            stat
+            for stat in take_snapshot().compare_to(start, key)
+            if stat.size_diff > 0
+        ),
+        key=lambda stat: stat.size_diff,
+        reverse=True,
+    )
+    return [
+        {
+            "size": stat.size_diff,
+            "count": stat.count_diff,
+            "traceback": [
+                f"{frame.filename}:{frame.lineno}" for frame in stat.traceback
+            ],
+        }
+        for stat in stats[:limit]
+    ]
+
+
+class PeakTracker:
+    """
+    Measure the peak of traced memory during a block of code.
+
+    tracemalloc keeps one peak for the process, so one block is tracked at
+    a time: a block entered while another is tracked gets `tracked` False
+    and no peak. Allocations of other threads during a tracked block are
+    still counted, so with concurrent requests the peak is an upper bound.
+    With `snapshot`, `start_snapshot` holds the traces at the start, for
+    `top_allocation_sites`.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, snapshot=False):
+        self.snapshot = snapshot
+        self.start_snapshot = None
+        self.tracked = False
+        self.peak = 0
+
+    def __enter__(self):
+        self.tracked = self._lock.acquire(blocking=False)
+        if self.tracked:
+            if self.snapshot:
+                self.start_snapshot = take_snapshot()
+            tracemalloc.reset_peak()
+            self.start, _ = tracemalloc.get_traced_memory()
+        return self
+
+    def __exit__(self, *exc_info):
+        if not self.tracked:
+            return
+        try:
+            _, peak = tracemalloc.get_traced_memory()
+            self.peak = max(peak - self.start, 0)
+        finally:
+            self._lock.release()
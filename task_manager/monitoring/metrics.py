@@ -0,0 +1,70 @@
+import threading
+from collections import defaultdict
+
+
+class MetricsRegistry:
+    """
+    Process-local registry of labelled counters and gauges.
+
+    Values live in the memory of the current worker process; every gunicorn
+    worker exposes its own totals, which the scraper is expected to sum.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = defaultdict(float)
+        self._help = {}
+
+    def inc(self, name, value=1, help_text="", **labels):
+        """
+        Increase a counter.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._values[key] += value
+            self._help.setdefault(name, help_text)
+
+    def set_max(self, name, value, help_text="", **labels):
+        """
+        Raise a gauge to `value` if it is larger than the stored one.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._values[key] = max(self._values[key], value)
+            self._help.setdefault(name, help_text)
+
+    def get(self, name, **labels):
+        return self._values.get((name, tuple(sorted(labels.items()))), 0)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self._help.clear()
+
+    def render(self):
+        """
+        Render all values in the Prometheus text exposition format.
+        """
+        with self._lock:
+            items = sorted(self._values.items())
+            help_texts = dict(self._help)
+
+        lines = []
+        current = None
+        for (name, labels), value in items:
+            if name != current:
+                current = name
+                if help_texts.get(name):
+                    lines.append(f"# HELP {name} {help_texts[name]}")
+            label_text = ",".join(
+                f'{key}="{str(label).replace(chr(34), chr(39))}"'
+                for key, label in labels
+            )
+            label_text = f"{{{label_text}}}" if label_text else ""
+            if float(value).is_integer():
+                value = int(value)
+            lines.append(f"{name}{label_text} {value}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
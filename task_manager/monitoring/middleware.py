@@ -0,0 +1,301 @@
+import time
+import tracemalloc
+from contextlib import ExitStack
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.urls import reverse
+from rollbar.contrib.django.middleware import RollbarNotifierMiddleware
+
+from .access_log import QueryTimer, RenderTimer
+from .error_reporting import install_reporter
+from .jsonl import get_jsonl_logger, write_record
+from .memory import PeakTracker, top_allocation_sites
+from .metrics import metrics
+from .profiling import PROFILE_MODES, prune_profiles, run_profiled
+from .replay import sanitize_query
+from .slow_queries import SlowQueryLogger
+from .utils import get_view_name
+
+
+class SlowQueryLogMiddleware:
+    """
+    Log slow SQL queries of each request to a rotating JSONL file.
+
+    Opt-in through `SLOW_QUERY_LOG["ENABLED"]`. When disabled the middleware
+    removes itself from the chain at startup.
+    """
+
+    def __init__(self, get_response):
+        config = settings.SLOW_QUERY_LOG
+        if not config["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.threshold_ms = config["THRESHOLD_MS"]
+        self.with_plan = config["EXPLAIN"]
+        self.capture_params = config["CAPTURE_PARAMS"]
+        self.logger = get_jsonl_logger(
+            "task_manager.slow_queries",
+            config["PATH"],
+            config["MAX_BYTES"],
+            config["BACKUP_COUNT"],
+        )
+
+    def __call__(self, request):
+        wrapper = SlowQueryLogger(
+            request,
+            self.logger,
+            self.threshold_ms,
+            self.with_plan,
+            self.capture_params,
+        )
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(wrapper))
+            return self.get_response(request)
+
+
+class ProfilingMiddleware:
+    """
+    Profile single requests on demand for staff users.
+
+    A request is profiled when a staff user sends the `PROFILING["HEADER"]`
+    header or the `PROFILING["QUERY_PARAM"]` parameter. Its value selects
+    the profiler: 'sample' for the sampling profiler, anything else for
+    cProfile. The stored file is linked in the `X-Profile-Url` response
+    header. Other requests only pay for the trigger check.
+    """
+
+    def __init__(self, get_response):
+        config = settings.PROFILING
+        if not config["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.header = config["HEADER"]
+        self.query_param = config["QUERY_PARAM"]
+        self.directory = config["DIR"]
+        self.keep = config["KEEP"]
+        self.sample_interval = config["SAMPLE_INTERVAL_MS"] / 1000
+
+    def get_mode(self, request):
+        value = request.headers.get(self.header)
+        if value is None:
+            value = request.GET.get(self.query_param)
+        if value is None or not request.user.is_staff:
+            return None
+        return value if value in PROFILE_MODES else PROFILE_MODES[0]
+
+    def __call__(self, request):
+        mode = self.get_mode(request)
+        if mode is None:
+            return self.get_response(request)
+
+        response, name = run_profiled(
+            mode,
+            lambda: self.get_response(request),
+            self.directory,
+            f"{request.method}-{request.path}",
+            self.sample_interval,
+        )
+        prune_profiles(self.directory, self.keep)
+        response["X-Profile-Url"] = request.build_absolute_uri(
+            reverse("profile_download", kwargs={"name": name})
+        )
+        return response
+
+
+class MemoryAccountingMiddleware:
+    """
+    Record the peak memory allocated while handling each request.
+
+    Enabled with `MEMORY_ACCOUNTING["ENABLED"]`, which starts tracemalloc
+    for the whole process. Peaks are aggregated per view in the metrics
+    registry; requests above `THRESHOLD_MB` additionally log the sites
+    that allocated the most during the request to a rotating JSONL file.
+    Requests arriving while another one is measured are counted as
+    skipped (see `PeakTracker`).
+    """
+
+    def __init__(self, get_response):
+        config = settings.MEMORY_ACCOUNTING
+        if not config["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.threshold = config["THRESHOLD_MB"] * 1024 * 1024
+        self.top = config["TOP"]
+        self.frames = config["FRAMES"]
+        self.logger = get_jsonl_logger(
+            "task_manager.memory",
+            config["PATH"],
+            config["MAX_BYTES"],
+            config["BACKUP_COUNT"],
+        )
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def __call__(self, request):
+        with PeakTracker(snapshot=True) as tracker:
+            response = self.get_response(request)
+
+        view = get_view_name(request)
+        if not tracker.tracked:
+            metrics.inc(
+                "request_memory_skipped_total",
+                help_text="Requests not measured while another one was.",
+                view=view,
+            )
+            return response
+        metrics.inc(
+            "request_memory_peak_bytes_total",
+            tracker.peak,
+            "Sum of per-request peak traced memory.",
+            view=view,
+        )
+        metrics.inc(
+            "request_memory_requests_total",
+            help_text="Requests measured by memory accounting.",
+            view=view,
+        )
+        metrics.set_max(
+            "request_memory_peak_bytes_max",
+            tracker.peak,
+            "Largest per-request peak traced memory.",
+            view=view,
+        )
+
+        if tracker.peak >= self.threshold:
+            write_record(
+                self.logger,
+                {
+                    "ts": datetime.now(timezone.utc).isoformat(),
+                    "view": view,
+                    "method": request.method,
+                    "path": request.get_full_path(),
+                    "status": response.status_code,
+                    "peak_bytes": tracker.peak,
+                    "top": top_allocation_sites(
+                        tracker.start_snapshot, self.top, self.frames
+                    ),
+                },
+            )
+        return response
+
+
+class AccessLogMiddleware:
+    """
+    Write one JSON line per request with its timings.
+
+    Enabled with `ACCESS_LOG["ENABLED"]`. Each record holds the URL name,
+    status, user id, database time, template render time and total
+    latency. Records are handed to a background writer thread, so the
+    request never waits for the disk.
+    """
+
+    def __init__(self, get_response):
+        config = settings.ACCESS_LOG
+        if not config["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.logger = get_jsonl_logger(
+            "task_manager.access",
+            config["PATH"],
+            config["MAX_BYTES"],
+            config["BACKUP_COUNT"],
+            buffered=True,
+        )
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        timer = QueryTimer()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+            response = self.get_response(request)
+        total = time.perf_counter() - start
+
+        render = getattr(request, "_access_log_render", None)
+        user = getattr(request, "user", None)
+        match = request.resolver_match
+        write_record(
+            self.logger,
+            {
+                "ts": datetime.now(timezone.utc).isoformat(),
+                "method": request.method,
+                "path": request.path,
+                "url_name": match.view_name if match else None,
+                "status": response.status_code,
+                "user_id": user.pk if user and user.is_authenticated else None,
+                "db_queries": timer.count,
+                "db_ms": round(timer.duration * 1000, 3),
+                "render_ms": (
+                    round(render.duration * 1000, 3)
+                    if render and render.duration is not None
+                    else None
+                ),
+                "total_ms": round(total * 1000, 3),
+            },
+        )
+        return response
+
+    def process_template_response(self, request, response):
+        request._access_log_render = RenderTimer(response.render)
+        response.render = request._access_log_render
+        return response
+
+
+class TrafficCaptureMiddleware:
+    """
+    Record sanitized request metadata for later replay.
+
+    Enabled with `TRAFFIC_CAPTURE["ENABLED"]`. Only the method, path, URL
+    name, query parameters (without secrets such as passwords or CSRF
+    tokens) and user id are stored; bodies and cookies never are. Replay
+    the file with `python manage.py replay_traffic`.
+    """
+
+    def __init__(self, get_response):
+        config = settings.TRAFFIC_CAPTURE
+        if not config["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.logger = get_jsonl_logger(
+            "task_manager.traffic",
+            config["PATH"],
+            config["MAX_BYTES"],
+            config["BACKUP_COUNT"],
+            buffered=True,
+        )
+
+    def __call__(self, request):
+        ts = time.time()
+        response = self.get_response(request)
+
+        user = getattr(request, "user", None)
+        match = request.resolver_match
+        write_record(
+            self.logger,
+            {
+                "ts": ts,
+                "method": request.method,
+                "path": request.path,
+                "url_name": match.view_name if match else None,
+                "query": sanitize_query(request.GET),
+                "user_id": user.pk if user and user.is_authenticated else None,
+            },
+        )
+        return response
+
+
+class QueuedRollbarNotifierMiddleware(RollbarNotifierMiddleware):
+    """
+    Rollbar notifier whose reports are deduplicated and sent in batches
+        by a background thread, as configured in `ERROR_REPORTING`.
+
+    Unused without `ROLLBAR["access_token"]`, like the stock middleware.
+    """
+
+    def __init__(self, get_response=None):
+        super().__init__(get_response)
+        install_reporter(settings.ERROR_REPORTING)
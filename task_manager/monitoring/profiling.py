@@ -0,0 +1,122 @@
+import cProfile
+import sys
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+PROFILE_MODES = ("cprofile", "sample")
+
+
+class StackSampler:
+    """
+    Sampling profiler for a single thread.
+
+    A daemon thread periodically reads the stack of the profiled thread from
+    `sys._current_frames()` and counts identical stacks. The result is
+    written in the collapsed-stack format understood by flamegraph tools.
+    Overhead does not grow with the number of calls made by the view,
+    which makes it suitable for long requests.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.samples = Counter()
+        self._thread_id = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread_id = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_filename}:{code.co_name}")
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, count in self.samples.most_common():
+                file.write(f"{stack} {count}\n")
+
+
+def run_profiled(mode, func, directory, label, sample_interval):
+    """
+    Call `func` under the selected profiler and store the result.
+
+    Args:
+        mode (str): 'cprofile' for a deterministic pstats dump or 'sample'
+            for collapsed stacks.
+        func (Callable[[], Any]): Code to profile.
+        directory (str | Path): Where profile files are stored.
+        label (str): Human readable part of the file name.
+        sample_interval (float): Seconds between samples in 'sample' mode.
+
+    Returns:
+        tuple[Any, str]: Result of `func` and the name of the stored file.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    safe_label = "".join(c if c.isalnum() else "-" for c in label)[:40]
+    name = f"{stamp}-{safe_label}-{uuid.uuid4().hex[:8]}"
+
+    if mode == "sample":
+        sampler = StackSampler(sample_interval)
+        sampler.start()
+        try:
+            result = func()
+        finally:
+            sampler.stop()
+        name += ".collapsed"
+        sampler.dump(directory / name)
+        return result, name
+
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func)
+    name += ".prof"
+    profiler.dump_stats(directory / name)
+    return result, name
+
+
+def prune_profiles(directory, keep):
+    """
+    Remove the oldest stored profiles, keeping the `keep` newest ones.
+    """
+    files = sorted(
+        (
+            path
+            for path in Path(directory).iterdir()
+            if path.suffix in (".prof", ".collapsed")
+        ),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for path in files[keep:]:
+        path.unlink(missing_ok=True)
+
+
+def is_profile_name(name):
+    """
+    Check that a requested file name refers to a stored profile and does not
+        escape the profile directory.
+    """
+    return (
+        Path(name).name == name
+        and not name.startswith(".")
+        and Path(name).suffix in (".prof", ".collapsed")
+    )
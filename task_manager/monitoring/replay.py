@@ -0,0 +1,137 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+)
+
+from task_manager.users.models import User
+from .http_client import HttpSession
+
+SENSITIVE_PARAMS = frozenset(
+    {
+        "password",
+        "password1",
+        "password2",
+        "csrfmiddlewaretoken",
+        "token",
+        "access_token",
+        "api_key",
+        "secret",
+    }
+)
+
+
+def sanitize_query(query_dict):
+    """
+    Convert a QueryDict to a plain dict without sensitive parameters.
+    """
+    return {
+        key: values
+        for key, values in query_dict.lists()
+        if key.lower() not in SENSITIVE_PARAMS
+    }
+
+
+def create_sessions(user_ids):
+    """
+    Create authenticated sessions for captured users.
+
+    The replay client cannot know the users' passwords, so sessions are
+    written directly to the session store shared with the target server.
+    They are valid logins: remove them with `delete_sessions`.
+
+    Returns:
+        dict[int, str]: Session keys by user id; unknown users are skipped.
+    """
+    engine = import_module(settings.SESSION_ENGINE)
+    backend = settings.AUTHENTICATION_BACKENDS[0]
+    sessions = {}
+    for user in User.objects.filter(pk__in=user_ids):
+        session = engine.SessionStore()
+        session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+        session[BACKEND_SESSION_KEY] = backend
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.save()
+        sessions[user.pk] = session.session_key
+    return sessions
+
+
+def delete_sessions(session_keys):
+    """
+    Delete sessions created by `create_sessions`.
+    """
+    engine = import_module(settings.SESSION_ENGINE)
+    for session_key in session_keys:
+        engine.SessionStore(session_key).delete()
+
+
+class TrafficReplayer:
+    """
+    Replay captured requests against a running server.
+
+    Requests keep their captured spacing divided by `speedup` (0 sends them
+    as fast as the pool allows) and run on `concurrency` threads. Each
+    replayed request is timed individually; redirects are not followed.
+    """
+
+    def __init__(self, base_url, concurrency=4, speedup=1.0, timeout=30):
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.speedup = speedup
+        self.timeout = timeout
+
+    def run(self, entries):
+        """
+        Args:
+            entries (list[dict]): Captured records sorted by 'ts'.
+
+        Returns:
+            list[dict]: 'name', 'status', 'latency_ms' and 'error' per
+                replayed request.
+        """
+        if not entries:
+            return []
+        sessions = create_sessions(
+            {entry["user_id"] for entry in entries if entry.get("user_id")}
+        )
+        first_ts = entries[0]["ts"]
+        started = time.perf_counter()
+
+        def replay(entry):
+            if self.speedup:
+                offset = (entry["ts"] - first_ts) / self.speedup
+                delay = started + offset - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+            headers = {}
+            session_key = sessions.get(entry.get("user_id"))
+            if session_key:
+                headers["Cookie"] = (
+                    f"{settings.SESSION_COOKIE_NAME}={session_key}"
+                )
+            client = HttpSession(self.base_url, self.timeout)
+            status, _, latency_ms = client.request(
+                entry["method"],
+                entry["path"],
+                entry.get("query"),
+                None,
+                headers,
+            )
+            return {
+                "name": entry.get("url_name") or entry["path"],
+                "status": status,
+                "latency_ms": latency_ms,
+                "error": status == 0 or status >= 400,
+            }
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                return list(executor.map(replay, entries))
+        finally:
+            delete_sessions(sessions.values())
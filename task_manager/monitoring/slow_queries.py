@@ -0,0 +1,180 @@
+import hashlib
+import re
+import time
+from datetime import datetime, timezone
+
+from django.db import DatabaseError
+
+from .jsonl import write_record
+from .utils import get_view_name
+
+EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "postgresql": "EXPLAIN ",
+    "mysql": "EXPLAIN ",
+}
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\?")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql):
+    """
+    Reduce a SQL statement to its shape.
+
+    Literals and placeholders become '?', lists of values collapse to '(...)'
+    and whitespace is squeezed, so queries that differ only by parameters
+    share one fingerprint.
+    """
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _VALUE_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def fingerprint(normalized_sql):
+    """
+    Return a short stable identifier of a normalized statement.
+    """
+    return hashlib.sha1(normalized_sql.encode()).hexdigest()[:16]
+
+
+def is_explainable(sql):
+    """
+    Check whether a statement is a read that can be explained safely.
+    """
+    return sql.lstrip().split(" ", 1)[0].upper() in ("SELECT", "WITH")
+
+
+def explain(connection, sql, params):
+    """
+    Run EXPLAIN for a statement on the given connection.
+
+    SQLite uses 'EXPLAIN QUERY PLAN', whose rows keep the plan text in the
+    last column; other backends return it as whole rows.
+
+    Returns:
+        list[str]: Plan lines, or a single error line if EXPLAIN failed.
+    """
+    prefix = EXPLAIN_PREFIXES.get(connection.vendor)
+    if prefix is None:
+        return []
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(prefix + sql, params)
+            rows = cursor.fetchall()
+    except DatabaseError as error:
+        return [f"EXPLAIN failed: {error}"]
+
+    if connection.vendor == "sqlite":
+        return [str(row[-1]) for row in rows]
+    return [" | ".join(str(column) for column in row) for row in rows]
+
+
+class SlowQueryLogger:
+    """
+    Database execute wrapper that logs queries slower than a threshold.
+
+    Installed per request through `connection.execute_wrapper()`. Each slow
+    query is written with its normalized SQL, the originating view and,
+    for reads, the plan reported by the database.
+    """
+
+    def __init__(
+        self,
+        request,
+        logger,
+        threshold_ms,
+        with_plan=True,
+        capture_params=False,
+    ):
+        self.request = request
+        self.logger = logger
+        self.threshold_ms = threshold_ms
+        self.with_plan = with_plan
+        self.capture_params = capture_params
+        self._explaining = False
+
+    def __call__(self, execute, sql, params, many, context):
+        if self._explaining:
+            return execute(sql, params, many, context)
+
+        start = time.perf_counter()
+        result = execute(sql, params, many, context)
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        if duration_ms >= self.threshold_ms:
+            self.log(sql, params, many, context["connection"], duration_ms)
+        return result
+
+    def log(self, sql, params, many, connection, duration_ms):
+        normalized = normalize_sql(sql)
+        plan = []
+        if self.with_plan and not many and is_explainable(sql):
+            self._explaining = True
+            try:
+                plan = explain(connection, sql, params)
+            finally:
+                self._explaining = False
+
+        record = {
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(duration_ms, 3),
+            "fingerprint": fingerprint(normalized),
+            "sql": normalized,
+            "view": get_view_name(self.request),
+            "method": self.request.method,
+            "path": self.request.path,
+            "database": connection.alias,
+            "vendor": connection.vendor,
+            "plan": plan,
+        }
+        if self.capture_params and not many:
+            record["statement"] = sql
+            record["params"] = list(params or ())
+        write_record(self.logger, record)
+
+
+def aggregate(records, order_by="total"):
+    """
+    Group slow query records by fingerprint.
+
+    Args:
+        records (Iterable[dict]): Records read from the slow query log.
+        order_by (str): One of 'total', 'max', 'mean' or 'count'.
+
+    Returns:
+        list[dict]: One entry per fingerprint, worst offenders first. Each
+            entry keeps the plan of its slowest occurrence.
+    """
+    groups = {}
+    for record in records:
+        group = groups.setdefault(
+            record["fingerprint"],
+            {
+                "fingerprint": record["fingerprint"],
+                "sql": record["sql"],
+                "count": 0,
+                "total": 0.0,
+                "max": 0.0,
+                "views": set(),
+                "plan": [],
+            },
+        )
+        group["count"] += 1
+        group["total"] += record["duration_ms"]
+        group["views"].add(record["view"])
+        if record["duration_ms"] >= group["max"]:
+            group["max"] = record["duration_ms"]
+            group["plan"] = record.get("plan", [])
+
+    result = []
+    for group in groups.values():
+        group["mean"] = group["total"] / group["count"]
+        group["views"] = sorted(group["views"])
+        result.append(group)
+    return sorted(result, key=lambda group: group[order_by], reverse=True)
@@ -0,0 +1,104 @@
+import multiprocessing
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from task_manager.sqlite import SQLITE_BUSY_TIMEOUT, SQLITE_PRAGMAS
+
+PROFILES = {
+    # What Django does without OPTIONS: rollback journal, deferred
+    # transactions and the sqlite3 module's 5 second busy timeout.
+    "default": {"pragmas": {}, "begin": "BEGIN", "timeout": 5},
+    "tuned": {
+        "pragmas": SQLITE_PRAGMAS,
+        "begin": "BEGIN IMMEDIATE",
+        "timeout": SQLITE_BUSY_TIMEOUT,
+    },
+}
+
+
+def _connect(path, profile):
+    connection = sqlite3.connect(
+        path, timeout=profile["timeout"], isolation_level=None
+    )
+    for name, value in profile["pragmas"].items():
+        connection.execute(f"PRAGMA {name} = {value}")
+    return connection
+
+
+def _worker(path, profile_name, writes, results):
+    """
+    Run `writes` transactions shaped like a form save: check that the name
+        is free, then insert the row.
+    """
+    profile = PROFILES[profile_name]
+    connection = _connect(path, profile)
+    ok = errors = 0
+    for number in range(writes):
+        try:
+            connection.execute(profile["begin"])
+            name = f"{multiprocessing.current_process().pid}-{number}"
+            connection.execute(
+                "SELECT COUNT(*) FROM bench WHERE name = ?", (name,)
+            ).fetchone()
+            connection.execute(
+                "INSERT INTO bench (name, payload) VALUES (?, ?)",
+                (name, "x" * 200),
+            )
+            connection.execute("COMMIT")
+            ok += 1
+        except sqlite3.OperationalError:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            errors += 1
+    connection.close()
+    results.put((ok, errors))
+
+
+def run_profile(profile_name, workers, writes, directory):
+    """
+    Let `workers` processes write concurrently into a fresh database.
+
+    Returns:
+        dict: Committed writes, lock errors, wall time and write throughput.
+    """
+    path = str(Path(directory) / f"{profile_name}.sqlite3")
+    connection = _connect(path, PROFILES[profile_name])
+    connection.execute(
+        "CREATE TABLE bench (id INTEGER PRIMARY KEY, "
+        "name TEXT UNIQUE, payload TEXT)"
+    )
+    connection.close()
+
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=_worker, args=(path, profile_name, writes, results)
+        )
+        for _ in range(workers)
+    ]
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    totals = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - start
+
+    committed = sum(ok for ok, _ in totals)
+    return {
+        "profile": profile_name,
+        "workers": workers,
+        "committed": committed,
+        "lock_errors": sum(errors for _, errors in totals),
+        "elapsed_s": elapsed,
+        "writes_per_s": committed / elapsed,
+    }
+
+
+def run_benchmark(workers=4, writes=500, profiles=("default", "tuned")):
+    with tempfile.TemporaryDirectory() as directory:
+        return [
+            run_profile(name, workers, writes, directory) for name in profiles
+        ]
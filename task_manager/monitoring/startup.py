@@ -0,0 +1,141 @@
+"""
+Cold start profile of the project.
+
+A fresh interpreter started with `-X importtime` runs the steps of a worker
+boot: evaluating the settings, populating the app registry and loading the
+ASGI application. It reports the wall time of each step, and the import
+log it writes to stderr is parsed into a tree of modules.
+"""
+
+import json
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+STARTUP_SCRIPT = """
+import os
+import time
+
+start = time.perf_counter()
+phases = {}
+os.environ["DJANGO_SETTINGS_MODULE"] = "task_manager.settings"
+
+from django.conf import settings
+settings.INSTALLED_APPS
+phases["settings"] = time.perf_counter() - start
+
+import django
+django.setup()
+phases["apps"] = time.perf_counter() - start - sum(phases.values())
+
+import task_manager.asgi
+phases["application"] = time.perf_counter() - start - sum(phases.values())
+
+if WARM_UP:
+    from task_manager.warmup import warm_up
+    warm_up()
+    phases["warm_up"] = time.perf_counter() - start - sum(phases.values())
+
+import json
+print(json.dumps({phase: seconds * 1000 for phase, seconds in phases.items()}))
+"""
+
+
+def parse_importtime(lines):
+    """
+    Build the import tree from the output of `python -X importtime`.
+
+    The interpreter reports a module after all the modules it imported,
+    indented by two spaces per level of nesting.
+
+    Returns:
+        list[dict]: Top level imports, each with its name, self and
+            cumulative time in milliseconds and nested `children`.
+    """
+    pending = defaultdict(list)
+    for line in lines:
+        match = IMPORT_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = len(indent) // 2
+        pending[depth].append(
+            {
+                "module": name,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "children": pending.pop(depth + 1, []),
+            }
+        )
+    return pending[0]
+
+
+def iter_imports(nodes):
+    for node in nodes:
+        yield node
+        yield from iter_imports(node["children"])
+
+
+def aggregate_packages(nodes):
+    """
+    Sum the self time of every imported module per top level package.
+
+    Returns:
+        list[dict]: Packages with their total time and number of modules,
+            slowest first.
+    """
+    packages = defaultdict(lambda: {"self_ms": 0.0, "modules": 0})
+    for node in iter_imports(nodes):
+        package = packages[node["module"].split(".")[0]]
+        # Rounded to the microseconds reported by the interpreter.
+        package["self_ms"] = round(package["self_ms"] + node["self_ms"], 3)
+        package["modules"] += 1
+    return sorted(
+        ({"package": name, **totals} for name, totals in packages.items()),
+        key=lambda row: row["self_ms"],
+        reverse=True,
+    )
+
+
+def profile_startup(warm_up=False):
+    """
+    Start the project in a new interpreter and profile its cold start.
+
+    Args:
+        warm_up (bool): Also run `task_manager.warmup.warm_up`, as gunicorn
+            workers do before their first request.
+
+    Returns:
+        dict: `process_ms` (interpreter start to exit), `phases` with the
+            milliseconds of each boot step, the import tree and the import
+            time per package.
+    """
+    start = time.perf_counter()
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"WARM_UP = {bool(warm_up)}\n{STARTUP_SCRIPT}",
+        ],
+        cwd=settings.BASE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    process_ms = (time.perf_counter() - start) * 1000
+
+    imports = parse_importtime(process.stderr.splitlines())
+    return {
+        "process_ms": process_ms,
+        "phases": json.loads(process.stdout.splitlines()[-1]),
+        "imports": imports,
+        "packages": aggregate_packages(imports),
+    }
@@ -0,0 +1,54 @@
+import math
+from collections import defaultdict
+
+
+def percentile(values, rank):
+    """
+    Return the nearest-rank percentile of a list of numbers.
+
+    Args:
+        values (list[float]): Observations, in any order.
+        rank (float): Percentile between 0 and 100.
+
+    Returns:
+        float | None: The percentile, or None for an empty list.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(math.ceil(rank / 100 * len(ordered)) - 1, 0)
+    return ordered[index]
+
+
+def summarize(results, key="name", percentiles=(50, 95, 99)):
+    """
+    Aggregate timed results per group.
+
+    Args:
+        results (Iterable[dict]): Items with the grouping `key`,
+            'latency_ms' and 'error' (bool).
+        key (str): Field used to group the results.
+        percentiles (tuple[int]): Latency percentiles to report.
+
+    Returns:
+        dict[str, dict]: Count, error rate, mean and percentiles per group.
+    """
+    groups = defaultdict(list)
+    for result in results:
+        groups[result[key]].append(result)
+
+    summary = {}
+    for name, items in sorted(groups.items(), key=lambda item: str(item[0])):
+        latencies = [item["latency_ms"] for item in items]
+        errors = sum(1 for item in items if item["error"])
+        summary[name] = {
+            "count": len(items),
+            "errors": errors,
+            "error_rate": errors / len(items),
+            "mean_ms": sum(latencies) / len(latencies),
+            **{
+                f"p{rank}_ms": percentile(latencies, rank)
+                for rank in percentiles
+            },
+        }
+    return summary
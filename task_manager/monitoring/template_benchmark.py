@@ -0,0 +1,235 @@
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.template import engines
+from django.template.defaultfilters import date as date_filter
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils import timezone, translation
+
+from task_manager.labels.models import Label
+from task_manager.labels.views import LabelsListView
+from task_manager.statuses.models import Status
+from task_manager.statuses.views import StatusesListView
+from task_manager.tasks.filters import TaskFilter
+from task_manager.tasks.models import Task
+from task_manager.tasks.views import TasksListView
+from task_manager.users.models import User
+from task_manager.users.views import UsersListView
+from .stats import percentile
+
+LIST_TEMPLATES = (
+    "tasks/tasks.html",
+    "users/users.html",
+    "statuses/statuses.html",
+    "labels/labels.html",
+)
+
+
+def build_objects(rows):
+    """
+    Create `rows` unsaved users, statuses, labels and tasks, so rendering
+    does not query their tables.
+
+    Returns:
+        dict[str, list]: Objects by list name.
+    """
+    now = timezone.now()
+    users = [
+        User(
+            id=number,
+            username=f"benchmark_{number}",
+            first_name="Bench",
+            last_name="Mark",
+            date_joined=now,
+        )
+        for number in range(1, rows + 1)
+    ]
+    statuses = [
+        Status(id=number, name=f"Status {number}", created_at=now)
+        for number in range(1, rows + 1)
+    ]
+    labels = [
+        Label(id=number, name=f"Label {number}", created_at=now)
+        for number in range(1, rows + 1)
+    ]
+    tasks = [
+        Task(
+            id=number,
+            name=f"Benchmark task {number}",
+            status=statuses[0],
+            author=users[0],
+            executor=users[-1],
+            created_at=now,
+        )
+        for number in range(1, rows + 1)
+    ]
+    return {
+        "tasks": tasks,
+        "users": users,
+        "statuses": statuses,
+        "labels": labels,
+    }
+
+
+def build_contexts(objects, request):
+    """
+    Build the context of every list template as its view does.
+
+    Returns:
+        dict[str, dict]: Context by template name.
+    """
+    return {
+        "tasks/tasks.html": {
+            "title": "Tasks",
+            "tasks": objects["tasks"],
+            "rows": TasksListView().get_rows(objects["tasks"]),
+            "filter": TaskFilter(
+                request.GET, queryset=Task.objects.none(), request=request
+            ),
+            "button_text": "Show",
+            "events_cursor": 0,
+            "next_after": "",
+            "next_url": "",
+        },
+        "users/users.html": {
+            "title": "Users",
+            "users": objects["users"],
+            "rows": UsersListView().get_rows(objects["users"]),
+        },
+        "statuses/statuses.html": {
+            "title": "Statuses",
+            "statuses": objects["statuses"],
+            "rows": StatusesListView().get_rows(objects["statuses"]),
+        },
+        "labels/labels.html": {
+            "title": "Labels",
+            "labels": objects["labels"],
+            "rows": LabelsListView().get_rows(objects["labels"]),
+        },
+    }
+
+
+def make_request(user=None):
+    request = RequestFactory().get("/")
+    request.user = user or AnonymousUser()
+    return request
+
+
+def time_render(template, context, request, repeat):
+    """
+    Render `template` `repeat` times after one warm-up render.
+
+    Returns:
+        tuple[str, list[float]]: Output and render times in milliseconds.
+    """
+    content = template.render(dict(context), request)
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        template.render(dict(context), request)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return content, latencies
+
+
+def run_benchmark(rows=5000, repeat=5, language=None, user=None):
+    """
+    Render every list template with the Django and the Jinja2 engine.
+
+    Args:
+        rows (int): Objects in each list.
+        repeat (int): Renders per template and engine, after one warm-up
+            render that compiles the template.
+        language (str | None): Language to render in; the default one if
+            None.
+        user (User | None): User shown in the navigation bar.
+
+    Returns:
+        list[dict]: Per template and engine the output size, p50 and min
+            render time, and the speedup of Jinja2 over Django.
+    """
+    request = make_request(user)
+
+    results = []
+    with translation.override(language):
+        contexts = build_contexts(build_objects(rows), request)
+        for name in LIST_TEMPLATES:
+            timings = {}
+            for engine in ("django", "jinja2"):
+                content, latencies = time_render(
+                    engines[engine].get_template(name),
+                    contexts[name],
+                    request,
+                    repeat,
+                )
+                timings[engine] = percentile(latencies, 50)
+                results.append(
+                    {
+                        "template": name,
+                        "engine": engine,
+                        "bytes": len(content.encode()),
+                        "p50_ms": timings[engine],
+                        "min_ms": min(latencies),
+                    }
+                )
+            results[-1]["speedup"] = timings["django"] / timings["jinja2"]
+    return results
+
+
+def time_per_row(function, items, repeat):
+    """
+    Return the median time in microseconds `function(items)` spends per
+    item.
+    """
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(items)
+        latencies.append((time.perf_counter() - start) * 1e6 / len(items))
+    return percentile(latencies, 50)
+
+
+def measure_row_cost(rows=5000, repeat=5, language=None, user=None):
+    """
+    Measure what one row of the task list costs.
+
+    Returns:
+        dict: Microseconds per row of `tags` (three `{% url %}` tags and a
+            `date` filter, the work the templates did per row), `build`
+            (the row view-model built by the list view) and `render_django`
+            / `render_jinja2` (the template loop over prepared rows, without
+            the rest of the page).
+    """
+    request = make_request(user)
+
+    with translation.override(language):
+        tasks = build_objects(rows)["tasks"]
+        view = TasksListView()
+
+        def tags(tasks):
+            for task in tasks:
+                reverse("task_show", args=[task.id])
+                reverse("task_update", args=[task.id])
+                reverse("task_delete", args=[task.id])
+                date_filter(
+                    timezone.template_localtime(task.created_at), "d.m.Y H:i"
+                )
+
+        result = {
+            "rows": rows,
+            "tags_us": time_per_row(tags, tasks, repeat),
+            "build_us": time_per_row(view.get_rows, tasks, repeat),
+        }
+
+        empty = build_contexts(build_objects(0), request)["tasks/tasks.html"]
+        full = build_contexts({**build_objects(0), "tasks": tasks}, request)
+        for engine in ("django", "jinja2"):
+            template = engines[engine].get_template("tasks/tasks.html")
+            _, page = time_render(template, empty, request, repeat)
+            _, latencies = time_render(
+                template, full["tasks/tasks.html"], request, repeat
+            )
+            result[f"render_{engine}_us"] = (
+                (percentile(latencies, 50) - percentile(page, 50)) * 1000 / rows
+            )
+    return result
@@ -0,0 +1,76 @@
+import logging
+
+from django.test import override_settings
+from django.urls import reverse_lazy
+
+from task_manager.monitoring.jsonl import (
+    close_jsonl_logger,
+    flush_jsonl_logger,
+    read_records,
+)
+from .testcase import MonitoringTestCase
+
+
+class TestAccessLog(MonitoringTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.logger = logging.getLogger("task_manager.access")
+        self.addCleanup(close_jsonl_logger, self.logger)
+
+    def get_config(self, **kwargs):
+        return {
+            "ENABLED": True,
+            "PATH": self.log_dir / "access.jsonl",
+            "MAX_BYTES": 1024 * 1024,
+            "BACKUP_COUNT": 2,
+            **kwargs,
+        }
+
+    def get_records(self):
+        flush_jsonl_logger(self.logger)
+        return list(read_records(self.log_dir / "access.jsonl"))
+
+    def test_request_is_logged_with_timings(self) -> None:
+        """
+        Test that a rendered list view is logged with its URL name, user,
+            database and render time.
+        """
+        with override_settings(ACCESS_LOG=self.get_config()):
+            self.client.get(reverse_lazy("tasks"))
+
+        record = self.get_records()[0]
+
+        self.assertEqual(record["url_name"], "tasks")
+        self.assertEqual(record["status"], 200)
+        self.assertEqual(record["user_id"], self.user1.pk)
+        self.assertGreater(record["db_queries"], 0)
+        self.assertGreater(record["render_ms"], 0)
+        self.assertGreaterEqual(record["total_ms"], record["render_ms"])
+
+    def test_redirect_of_anonymous_user(self) -> None:
+        """
+        Test that responses without a template have no render time and that
+            anonymous users are logged without an id.
+        """
+        self.client.logout()
+        with override_settings(ACCESS_LOG=self.get_config()):
+            self.client.get(reverse_lazy("tasks"))
+
+        record = self.get_records()[0]
+
+        self.assertEqual(record["status"], 302)
+        self.assertIsNone(record["user_id"])
+        self.assertIsNone(record["render_ms"])
+
+    def test_log_is_rotated_by_size(self) -> None:
+        """
+        Test that the file is rotated once it exceeds MAX_BYTES.
+        """
+        with override_settings(
+            ACCESS_LOG=self.get_config(MAX_BYTES=300, BACKUP_COUNT=10)
+        ):
+            for _ in range(5):
+                self.client.get(reverse_lazy("home"))
+
+        self.assertEqual(len(self.get_records()), 5)
+        self.assertTrue((self.log_dir / "access.jsonl.1").is_file())
@@ -0,0 +1,21 @@
+from task_manager.monitoring.compression_benchmark import run_benchmark
+from task_manager.tasks.models import Task
+from .testcase import MonitoringTestCase
+
+
+class TestCompressionBenchmark(MonitoringTestCase):
+    def test_benchmark_reports_every_encoding(self) -> None:
+        """
+        Test that the benchmark measures the uncompressed page and each
+            encoding, and removes its seeded tasks.
+        """
+        tasks = Task.objects.count()
+
+        results = run_benchmark(rows=1200, repeat=1)
+
+        by_encoding = {row["encoding"]: row for row in results}
+        self.assertEqual(by_encoding["identity"]["requests"], 3)
+        self.assertEqual(results[0]["encoding"], "identity")
+        self.assertEqual(by_encoding["identity"]["ratio"], 1)
+        self.assertLess(by_encoding["gzip"]["ratio"], 0.5)
+        self.assertEqual(Task.objects.count(), tasks)
@@ -0,0 +1,114 @@
+import sys
+import time
+
+from task_manager.monitoring.error_reporting import ErrorReporter, fingerprint
+from task_manager.monitoring.metrics import metrics
+from .testcase import MonitoringTestCase
+
+
+def raise_error(message):
+    try:
+        raise ValueError(message)
+    except ValueError:
+        return sys.exc_info()
+
+
+class TestErrorReporter(MonitoringTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        metrics.clear()
+        self.sent = []
+
+    def get_reporter(self, **kwargs):
+        config = {
+            "queue_size": 10,
+            "batch_size": 2,
+            "flush_interval": 0.05,
+            "dedup_seconds": 60,
+            "send": self.sent.append,
+            **kwargs,
+        }
+        return ErrorReporter(**config)
+
+    def test_fingerprint_ignores_message(self) -> None:
+        """
+        Test that the same code path gives the same fingerprint whatever
+            the exception message.
+        """
+        self.assertEqual(
+            fingerprint(raise_error("first")),
+            fingerprint(raise_error("second")),
+        )
+        self.assertNotEqual(
+            fingerprint(raise_error("first")),
+            fingerprint((KeyError, KeyError(), None)),
+        )
+
+    def test_duplicates_are_reported_once(self) -> None:
+        """
+        Test that a repeated traceback is dropped within the window and
+            reported again after it.
+        """
+        reporter = self.get_reporter()
+        exc_info = raise_error("boom")
+
+        self.assertIs(reporter.filter_exception(exc_info), exc_info)
+        self.assertFalse(reporter.filter_exception(raise_error("boom")))
+        self.assertEqual(metrics.get("error_reports_deduplicated_total"), 1)
+
+        reporter.dedup_seconds = 0
+        self.assertIs(reporter.filter_exception(exc_info), exc_info)
+
+    def test_full_queue_drops_reports(self) -> None:
+        """
+        Test that reports beyond the queue size are dropped and counted
+            instead of blocking the request.
+        """
+        reporter = self.get_reporter(queue_size=2)
+        reporter.start = lambda: None
+
+        results = [reporter.enqueue({"id": number}) for number in range(3)]
+
+        self.assertEqual(results, [False, False, False])
+        self.assertEqual(reporter.queue.qsize(), 2)
+        self.assertEqual(metrics.get("error_reports_queued_total"), 2)
+        self.assertEqual(metrics.get("error_reports_dropped_total"), 1)
+
+    def test_batches_are_sent_in_background(self) -> None:
+        """
+        Test that queued reports are sent by the background thread.
+        """
+        reporter = self.get_reporter()
+
+        for number in range(3):
+            reporter.enqueue({"id": number})
+        deadline = time.monotonic() + 5
+        while len(self.sent) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(self.sent, [{"id": 0}, {"id": 1}, {"id": 2}])
+        self.assertEqual(metrics.get("error_reports_sent_total"), 3)
+        self.assertNotEqual(reporter.thread, None)
+
+    def test_flush_sends_pending_reports(self) -> None:
+        """
+        Test that flushing sends everything queued in batches, counts
+            failed sends and lets the sent payloads through the hook.
+        """
+
+        def send(payload):
+            if payload["id"] == 1:
+                raise OSError("Rollbar is down")
+            self.sent.append(reporter.enqueue(payload))
+
+        reporter = self.get_reporter(send=send)
+        reporter.start = lambda: None
+        for number in range(3):
+            reporter.enqueue({"id": number})
+
+        with self.assertLogs("task_manager.monitoring", "ERROR"):
+            reporter.flush()
+
+        self.assertEqual(self.sent, [{"id": 0}, {"id": 2}])
+        self.assertEqual(metrics.get("error_reports_failed_total"), 1)
+        self.assertTrue(reporter.queue.empty())
@@ -0,0 +1,124 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+
+from task_manager.monitoring.index_advisor import (
+    QueryRecorder,
+    analyze,
+    parse_columns,
+    propose,
+)
+from task_manager.tasks.models import Task
+from .testcase import MonitoringTestCase
+
+
+class TestIndexAdvisor(MonitoringTestCase):
+    def record(self, queryset):
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            list(queryset)
+        return recorder.queries
+
+    def test_parse_columns(self) -> None:
+        """
+        Test that equality columns precede ORDER BY columns.
+        """
+        sql, _ = self.record(
+            Task.objects.filter(description="x").order_by("created_at")
+        )[0]
+
+        self.assertEqual(
+            parse_columns(sql)["tasks_task"], ["description", "created_at"]
+        )
+
+    def test_scan_on_unindexed_filter(self) -> None:
+        """
+        Test that filtering on an unindexed column is reported as a scan and
+            produces a composite index proposal.
+        """
+        queries = self.record(
+            Task.objects.filter(description="x").order_by("created_at")
+        )
+        findings = analyze(connection, queries, repeat=1)
+        proposals = propose(findings)
+
+        self.assertIn("tasks_task", findings[0].scans)
+        self.assertEqual(proposals[0].model, Task)
+        self.assertEqual(proposals[0].fields, ["description", "created_at"])
+        self.assertIn("migrations.AddIndex(", proposals[0].as_operation())
+
+    def test_indexed_lookup_is_not_proposed(self) -> None:
+        """
+        Test that lookups by primary key yield no proposals.
+        """
+        findings = analyze(
+            connection, self.record(Task.objects.filter(pk=1)), repeat=1
+        )
+
+        self.assertEqual(propose(findings), [])
+
+    def test_command_replays_queries_and_requests(self) -> None:
+        """
+        Test that the command reads captured statements and recorded
+            requests and measures proposals without leaving the index behind.
+        """
+        queries_path = self.log_dir / "queries.jsonl"
+        queries_path.write_text(
+            "\n".join(
+                json.dumps({"statement": sql, "params": params})
+                for sql, params in self.record(
+                    Task.objects.filter(description="x")
+                )
+            )
+        )
+        requests_path = self.log_dir / "requests.jsonl"
+        requests_path.write_text(
+            json.dumps({"path": "/tasks/", "query": {"status": "1"}})
+        )
+
+        out = StringIO()
+        call_command(
+            "advise_indexes",
+            queries=queries_path,
+            requests=requests_path,
+            user=self.user1.username,
+            measure=True,
+            repeat=1,
+            json=True,
+            stdout=out,
+        )
+        report = json.loads(out.getvalue())
+        proposal = report["proposals"][0]
+
+        self.assertGreater(report["queries"], 1)
+        self.assertEqual(proposal["fields"], ["description"])
+        self.assertIsNotNone(proposal["measured_ms"])
+        with connection.cursor() as cursor:
+            indexes = connection.introspection.get_constraints(
+                cursor, "tasks_task"
+            )
+        self.assertNotIn(proposal["name"], indexes)
+
+    def test_command_text_report(self) -> None:
+        """
+        Test that the text report lists findings and migration operations.
+        """
+        queries_path = self.log_dir / "queries.jsonl"
+        queries_path.write_text(
+            "\n".join(
+                json.dumps({"statement": sql, "params": params})
+                for sql, params in self.record(
+                    Task.objects.filter(description="x")
+                )
+            )
+        )
+
+        out = StringIO()
+        call_command(
+            "advise_indexes", queries=queries_path, repeat=1, stdout=out
+        )
+
+        self.assertIn("scan tasks_task", out.getvalue())
+        self.assertIn('model_name="task"', out.getvalue())
@@ -0,0 +1,99 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import LiveServerTestCase
+
+from task_manager.monitoring.loadtest import (
+    check_slos,
+    parse_slos,
+    seed_users,
+)
+from task_manager.tasks.views import TaskChunkView
+from task_manager.tasks.models import Task
+from task_manager.utils import remove_rollbar, test_english
+
+
+@test_english
+@remove_rollbar
+class TestLoadTest(LiveServerTestCase):
+    def run_command(self, *slos, users=2):
+        out = StringIO()
+        call_command(
+            "load_test",
+            base_url=self.live_server_url,
+            users=users,
+            iterations=2,
+            slo=list(slos),
+            json=True,
+            stdout=out,
+        )
+        return json.loads(out.getvalue())
+
+    def test_flow_is_exercised(self) -> None:
+        """
+        Test that every step of the task flow runs without errors and that
+            the created tasks are deleted again.
+        """
+        report = self.run_command("list:p99=60000")
+
+        self.assertEqual(
+            list(report["steps"]),
+            ["login", "list", "create", "filter", "update", "delete"],
+        )
+        self.assertEqual(report["steps"]["delete"]["count"], 4)
+        for row in report["steps"].values():
+            self.assertEqual(row["errors"], 0)
+            self.assertGreater(row["throughput_rps"], 0)
+        self.assertEqual(report["violations"], [])
+        self.assertEqual(Task.objects.count(), 0)
+
+    def test_task_is_found_beyond_first_chunk(self) -> None:
+        """
+        Test that the created task is found and deleted when more tasks
+            than one chunk match the filter.
+        """
+        (credentials,), status_id, label_id = seed_users(1, "unused")
+        tasks = Task.objects.bulk_create(
+            Task(
+                name=f"leftover {number}",
+                status_id=status_id,
+                author_id=credentials["id"],
+                executor_id=credentials["id"],
+            )
+            for number in range(TaskChunkView.default_limit + 1)
+        )
+        for task in Task.objects.filter(name__startswith="leftover"):
+            task.labels.add(label_id)
+
+        report = self.run_command(users=1)
+
+        self.assertEqual(report["steps"]["filter"]["errors"], 0)
+        self.assertEqual(report["steps"]["delete"]["count"], 2)
+        self.assertEqual(Task.objects.count(), len(tasks))
+
+    def test_violated_slo_fails(self) -> None:
+        """
+        Test that the command fails when a latency target is missed.
+        """
+        with self.assertRaises(CommandError):
+            self.run_command("list:p50=0.0001")
+
+    def test_check_slos(self) -> None:
+        """
+        Test parsing of SLOs and detection of latency and error violations.
+        """
+        summary = {
+            "list": {"p95_ms": 120.0, "error_rate": 0.0},
+            "create": {"p95_ms": 80.0, "error_rate": 0.5},
+        }
+        slos = parse_slos(["list:p95=100", "create:p95=100"])
+
+        violations = check_slos(summary, slos, max_error_rate=0.1)
+
+        self.assertEqual(len(violations), 2)
+        self.assertTrue(violations[0].startswith("list: p95"))
+        self.assertTrue(violations[1].startswith("create: error rate"))
+        with self.assertRaises(ValueError):
+            parse_slos(["list<100"])
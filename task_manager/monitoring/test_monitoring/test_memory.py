@@ -0,0 +1,134 @@
+import tracemalloc
+
+from django.test import override_settings
+from django.urls import reverse_lazy
+
+from task_manager.monitoring.jsonl import read_records
+from task_manager.monitoring.memory import PeakTracker
+from task_manager.monitoring.metrics import metrics
+from .testcase import MonitoringTestCase
+
+
+class TestMemoryAccounting(MonitoringTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        metrics.clear()
+        self.addCleanup(metrics.clear)
+        self.addCleanup(tracemalloc.stop)
+
+    def get_config(self, **kwargs):
+        return {
+            "ENABLED": True,
+            "THRESHOLD_MB": 0,
+            "TOP": 3,
+            "FRAMES": 1,
+            "PATH": self.log_dir / "memory.jsonl",
+            "MAX_BYTES": 1024 * 1024,
+            "BACKUP_COUNT": 1,
+            **kwargs,
+        }
+
+    def test_peak_is_recorded_per_view(self) -> None:
+        """
+        Test that the peak allocation of a request is aggregated per view and
+            that requests above the threshold log their allocation sites.
+        """
+        with override_settings(MEMORY_ACCOUNTING=self.get_config()):
+            self.client.get(reverse_lazy("tasks"))
+            self.client.get(reverse_lazy("tasks"))
+
+        records = list(read_records(self.log_dir / "memory.jsonl"))
+
+        self.assertEqual(
+            metrics.get("request_memory_requests_total", view="tasks"), 2
+        )
+        self.assertGreater(
+            metrics.get("request_memory_peak_bytes_max", view="tasks"), 0
+        )
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]["view"], "tasks")
+        self.assertEqual(len(records[0]["top"]), 3)
+
+    def test_sites_are_allocations_of_the_request(self) -> None:
+        """
+        Test that the logged sites hold memory allocated during the request,
+            not memory the process held before.
+        """
+        with override_settings(MEMORY_ACCOUNTING=self.get_config(TOP=50)):
+            held = bytearray(1024 * 1024)
+            self.client.get(reverse_lazy("tasks"))
+
+        (record,) = read_records(self.log_dir / "memory.jsonl")
+
+        self.assertEqual(len(held), 1024 * 1024)
+        self.assertTrue(record["top"])
+        for site in record["top"]:
+            self.assertGreater(site["size"], 0)
+            self.assertFalse(site["traceback"][0].startswith(__file__))
+
+    def test_concurrent_request_is_skipped(self) -> None:
+        """
+        Test that a request arriving while another is measured does not
+            reset its peak and is counted as skipped.
+        """
+        with override_settings(MEMORY_ACCOUNTING=self.get_config()):
+            with PeakTracker() as tracker:
+                self.client.get(reverse_lazy("users"))
+
+        self.assertTrue(tracker.tracked)
+        self.assertEqual(
+            metrics.get("request_memory_skipped_total", view="users"), 1
+        )
+        self.assertEqual(
+            metrics.get("request_memory_requests_total", view="users"), 0
+        )
+        self.assertEqual(list(read_records(self.log_dir / "memory.jsonl")), [])
+
+    def test_requests_below_threshold_are_not_logged(self) -> None:
+        """
+        Test that only totals are kept for requests under the threshold.
+        """
+        config = self.get_config(THRESHOLD_MB=1024)
+        with override_settings(MEMORY_ACCOUNTING=config):
+            self.client.get(reverse_lazy("users"))
+
+        self.assertEqual(list(read_records(self.log_dir / "memory.jsonl")), [])
+        self.assertEqual(
+            metrics.get("request_memory_requests_total", view="users"), 1
+        )
+
+
+class TestMetricsView(MonitoringTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        metrics.clear()
+        self.addCleanup(metrics.clear)
+        metrics.inc("requests_total", 3, "Handled requests.", view="tasks")
+
+    def test_staff_can_read_metrics(self) -> None:
+        """
+        Test that staff users get the Prometheus text format.
+        """
+        self.user1.is_staff = True
+        self.user1.save()
+
+        response = self.client.get(reverse_lazy("metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "# HELP requests_total Handled requests.")
+        self.assertContains(response, 'requests_total{view="tasks"} 3')
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_scraper_token(self) -> None:
+        """
+        Test that a bearer token grants access and other users get a 404.
+        """
+        self.client.logout()
+
+        denied = self.client.get(reverse_lazy("metrics"))
+        allowed = self.client.get(
+            reverse_lazy("metrics"), headers={"Authorization": "Bearer secret"}
+        )
+
+        self.assertEqual(denied.status_code, 404)
+        self.assertEqual(allowed.status_code, 200)
@@ -0,0 +1,46 @@
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+from task_manager.monitoring.connection_benchmark import build_settings
+
+
+class TestConnectionPool(SimpleTestCase):
+    base = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": "tm_db",
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {"sslmode": "prefer"},
+    }
+
+    def test_pool_mode_settings(self) -> None:
+        """
+        Test that the pool mode disables persistent connections and health
+            checks and keeps other options.
+        """
+        settings_dict = build_settings(self.base, "pool", pool_size=3)
+
+        self.assertEqual(settings_dict["CONN_MAX_AGE"], 0)
+        self.assertFalse(settings_dict["CONN_HEALTH_CHECKS"])
+        self.assertEqual(settings_dict["OPTIONS"]["sslmode"], "prefer")
+        self.assertEqual(settings_dict["OPTIONS"]["pool"]["max_size"], 3)
+        self.assertEqual(self.base["CONN_MAX_AGE"], 600)
+
+    def test_persistent_mode_drops_pool(self) -> None:
+        """
+        Test that other modes run without the pool.
+        """
+        base = build_settings(self.base, "pool", pool_size=3)
+
+        settings_dict = build_settings(base, "persistent", pool_size=3)
+
+        self.assertNotIn("pool", settings_dict["OPTIONS"])
+        self.assertTrue(settings_dict["CONN_HEALTH_CHECKS"])
+
+    def test_benchmark_requires_postgresql(self) -> None:
+        """
+        Test that the benchmark refuses to run on other databases.
+        """
+        with self.assertRaises(CommandError):
+            call_command("benchmark_connections")
@@ -0,0 +1,81 @@
+import pstats
+
+from django.test import override_settings
+from django.urls import reverse_lazy
+
+from task_manager.users.models import User
+from .testcase import MonitoringTestCase
+
+
+class TestProfiling(MonitoringTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.user1.is_staff = True
+        self.user1.save()
+
+        self.settings_override = override_settings(
+            PROFILING={
+                "ENABLED": True,
+                "HEADER": "X-Profile",
+                "QUERY_PARAM": "_profile",
+                "DIR": self.log_dir,
+                "SAMPLE_INTERVAL_MS": 1,
+                "KEEP": 2,
+            }
+        )
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+
+    def test_staff_request_is_profiled(self) -> None:
+        """
+        Test that a staff request with the query parameter stores a pstats
+            file and links it in the response header.
+        """
+        response = self.client.get(reverse_lazy("tasks"), {"_profile": "1"})
+        url = response["X-Profile-Url"]
+        name = url.rstrip("/").rsplit("/", 1)[-1]
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(name.endswith(".prof"))
+        stats = pstats.Stats(str(self.log_dir / name))
+        self.assertGreater(stats.total_calls, 0)
+
+        download = self.client.get(url)
+        self.assertEqual(download.status_code, 200)
+        self.assertEqual(
+            b"".join(download.streaming_content),
+            (self.log_dir / name).read_bytes(),
+        )
+
+    def test_sampling_profiler_via_header(self) -> None:
+        """
+        Test that the header selects the sampling profiler.
+        """
+        response = self.client.get(
+            reverse_lazy("tasks"), headers={"X-Profile": "sample"}
+        )
+
+        self.assertTrue(response["X-Profile-Url"].endswith(".collapsed/"))
+
+    def test_non_staff_is_not_profiled(self) -> None:
+        """
+        Test that the trigger is ignored for non-staff users and that they
+            cannot download profiles.
+        """
+        profiled = self.client.get(reverse_lazy("tasks"), {"_profile": "1"})
+        self.client.force_login(User.objects.get(pk=2))
+
+        response = self.client.get(reverse_lazy("tasks"), {"_profile": "1"})
+        download = self.client.get(profiled["X-Profile-Url"])
+
+        self.assertNotIn("X-Profile-Url", response)
+        self.assertEqual(download.status_code, 302)
+
+    def test_old_profiles_are_pruned(self) -> None:
+        """
+        Test that only the newest KEEP profiles are stored.
+        """
+        for _ in range(3):
+            self.client.get(reverse_lazy("home"), {"_profile": "1"})
+
+        self.assertEqual(len(list(self.log_dir.iterdir())), 2)
@@ -0,0 +1,109 @@
+import json
+import logging
+import shutil
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.test import LiveServerTestCase, override_settings
+from django.urls import reverse_lazy
+
+from task_manager.monitoring.jsonl import (
+    close_jsonl_logger,
+    flush_jsonl_logger,
+    read_records,
+)
+from task_manager.monitoring.stats import percentile
+from task_manager.utils import remove_rollbar, test_english
+from .testcase import MonitoringTestCase
+
+
+class TestTrafficCapture(MonitoringTestCase):
+    def test_capture_is_sanitized(self) -> None:
+        """
+        Test that captured requests keep filters and the user id but drop
+            secrets and bodies.
+        """
+        logger = logging.getLogger("task_manager.traffic")
+        self.addCleanup(close_jsonl_logger, logger)
+        config = {
+            "ENABLED": True,
+            "PATH": self.log_dir / "traffic.jsonl",
+            "MAX_BYTES": 1024 * 1024,
+            "BACKUP_COUNT": 1,
+        }
+        with override_settings(TRAFFIC_CAPTURE=config):
+            self.client.get(
+                reverse_lazy("tasks"), {"status": 1, "token": "secret"}
+            )
+            self.client.post(
+                reverse_lazy("login"), {"username": "x", "password": "hunter2"}
+            )
+        flush_jsonl_logger(logger)
+
+        get, post = read_records(self.log_dir / "traffic.jsonl")
+
+        self.assertEqual(get["url_name"], "tasks")
+        self.assertEqual(get["query"], {"status": ["1"]})
+        self.assertEqual(get["user_id"], self.user1.pk)
+        self.assertEqual(post["method"], "POST")
+        self.assertNotIn("hunter2", json.dumps(post))
+
+    def test_percentile(self) -> None:
+        """
+        Test nearest-rank percentiles.
+        """
+        values = list(range(1, 101))
+
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([3], 95), 3)
+        self.assertIsNone(percentile([], 50))
+
+
+@test_english
+@remove_rollbar
+class TestTrafficReplay(LiveServerTestCase):
+    fixtures = ["user.json", "status.json", "task.json", "label.json"]
+
+    def setUp(self) -> None:
+        self.log_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.log_dir, ignore_errors=True)
+
+    def test_replay_reports_per_url_name(self) -> None:
+        """
+        Test that captured requests are replayed with the captured user's
+            session and summarized per URL name.
+        """
+        path = self.log_dir / "traffic.jsonl"
+        entries = [
+            {"ts": 0.0, "method": "GET", "path": "/tasks/",
+             "url_name": "tasks", "query": {"status": ["1"]}, "user_id": 1},
+            {"ts": 0.01, "method": "GET", "path": "/tasks/",
+             "url_name": "tasks", "query": {}, "user_id": 1},
+            {"ts": 0.02, "method": "GET", "path": "/tasks/999/",
+             "url_name": "task_show", "query": {}, "user_id": 1},
+            {"ts": 0.03, "method": "POST", "path": "/logout/",
+             "url_name": "logout", "query": {}, "user_id": 1},
+        ]  # fmt: skip
+        path.write_text("\n".join(json.dumps(entry) for entry in entries))
+
+        out = StringIO()
+        call_command(
+            "replay_traffic",
+            path=path,
+            base_url=self.live_server_url,
+            concurrency=2,
+            speedup=0,
+            json=True,
+            stdout=out,
+        )
+        summary = json.loads(out.getvalue())
+
+        self.assertEqual(set(summary), {"tasks", "task_show"})
+        self.assertEqual(summary["tasks"]["count"], 2)
+        self.assertEqual(summary["tasks"]["errors"], 0)
+        self.assertEqual(summary["task_show"]["error_rate"], 1.0)
+        self.assertFalse(Session.objects.exists())
@@ -0,0 +1,117 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import RequestFactory, override_settings
+from django.urls import ResolverMatch, reverse_lazy
+
+from task_manager.monitoring.jsonl import read_records
+from task_manager.monitoring.slow_queries import aggregate, normalize_sql
+from task_manager.monitoring.utils import get_view_name
+from task_manager.tasks.views import TasksListView
+from .testcase import MonitoringTestCase
+
+
+class TestNormalizeSql(MonitoringTestCase):
+    def test_literals_are_replaced(self) -> None:
+        """
+        Test that parameters and literals do not affect the normalized SQL.
+        """
+        first = normalize_sql(
+            "SELECT * FROM t WHERE id = 1 AND name = 'a''b' AND x IN (%s, %s)"
+        )
+        second = normalize_sql(
+            "SELECT *  FROM t\nWHERE id = 25 AND name = 'c' AND x IN (%s)"
+        )
+
+        self.assertEqual(first, second)
+        self.assertEqual(
+            first, "SELECT * FROM t WHERE id = ? AND name = ? AND x IN (...)"
+        )
+
+
+class TestGetViewName(MonitoringTestCase):
+    def test_view_name_fallbacks(self) -> None:
+        """
+        Test that requests are named by URL name, else by view path, else
+            by request path.
+        """
+        request = RequestFactory().get("/somewhere/")
+        self.assertEqual(get_view_name(request), "/somewhere/")
+
+        view = TasksListView.as_view()
+        request.resolver_match = ResolverMatch(view, (), {}, url_name="tasks")
+        self.assertEqual(get_view_name(request), "tasks")
+
+        request.resolver_match = ResolverMatch(view, (), {})
+        self.assertEqual(
+            get_view_name(request), "task_manager.tasks.views.TasksListView"
+        )
+
+
+class TestSlowQueryLog(MonitoringTestCase):
+    def get_config(self, **kwargs):
+        return {
+            "ENABLED": True,
+            "THRESHOLD_MS": 0,
+            "EXPLAIN": True,
+            "CAPTURE_PARAMS": False,
+            "PATH": self.log_dir / "slow.jsonl",
+            "MAX_BYTES": 1024 * 1024,
+            "BACKUP_COUNT": 1,
+            **kwargs,
+        }
+
+    def test_queries_are_logged_with_plan(self) -> None:
+        """
+        Test that queries of the tasks list are logged with the view name and
+            the EXPLAIN QUERY PLAN output.
+        """
+        with override_settings(SLOW_QUERY_LOG=self.get_config()):
+            self.client.get(reverse_lazy("tasks"), {"status": 1})
+
+        records = list(read_records(self.log_dir / "slow.jsonl"))
+        task_records = [
+            record
+            for record in records
+            if record["view"] == "tasks" and "tasks_task" in record["sql"]
+        ]
+
+        self.assertTrue(task_records)
+        self.assertTrue(all(record["plan"] for record in task_records))
+        self.assertEqual(task_records[0]["vendor"], "sqlite")
+
+    def test_fast_queries_are_skipped(self) -> None:
+        """
+        Test that nothing is written when no query exceeds the threshold.
+        """
+        config = self.get_config(THRESHOLD_MS=60_000)
+        with override_settings(SLOW_QUERY_LOG=config):
+            self.client.get(reverse_lazy("tasks"))
+
+        self.assertEqual(list(read_records(self.log_dir / "slow.jsonl")), [])
+
+    def test_command_aggregates_records(self) -> None:
+        """
+        Test that the slow_queries command groups records by fingerprint and
+            ranks them by the chosen metric.
+        """
+        path = self.log_dir / "slow.jsonl"
+        records = [
+            {"fingerprint": "a", "sql": "A", "duration_ms": 5, "view": "x"},
+            {"fingerprint": "b", "sql": "B", "duration_ms": 50, "view": "y"},
+            {"fingerprint": "a", "sql": "A", "duration_ms": 7, "view": "z"},
+        ]
+        path.write_text("\n".join(json.dumps(record) for record in records))
+
+        groups = aggregate(read_records(path), order_by="count")
+        self.assertEqual(groups[0]["fingerprint"], "a")
+        self.assertEqual(groups[0]["count"], 2)
+        self.assertEqual(groups[0]["views"], ["x", "z"])
+
+        out = StringIO()
+        call_command("slow_queries", path=path, json=True, stdout=out)
+        result = json.loads(out.getvalue())
+
+        self.assertEqual(result[0]["fingerprint"], "b")
+        self.assertEqual(result[1]["total"], 12)
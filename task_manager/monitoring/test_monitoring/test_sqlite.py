@@ -0,0 +1,48 @@
+from django.db import connection
+from django.test import TestCase
+
+from task_manager.monitoring.sqlite_benchmark import run_benchmark
+from task_manager.sqlite import sqlite_init_command, sqlite_options
+
+
+class TestSqliteTuning(TestCase):
+    def test_options(self) -> None:
+        """
+        Test that the profile uses IMMEDIATE transactions, a busy timeout
+            and one PRAGMA statement per setting.
+        """
+        options = sqlite_options(busy_timeout=3)
+
+        self.assertEqual(options["timeout"], 3)
+        self.assertEqual(options["transaction_mode"], "IMMEDIATE")
+        self.assertEqual(
+            sqlite_init_command({"synchronous": "NORMAL", "cache_size": -10}),
+            "PRAGMA synchronous = NORMAL;PRAGMA cache_size = -10",
+        )
+
+    def test_connection_is_tuned(self) -> None:
+        """
+        Test that the settings apply the profile to new SQLite connections.
+        """
+        if connection.vendor != "sqlite":
+            self.skipTest("SQLite only")
+
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA synchronous")
+            synchronous = cursor.fetchone()[0]
+            cursor.execute("PRAGMA busy_timeout")
+            busy_timeout = cursor.fetchone()[0]
+
+        self.assertEqual(synchronous, 1)
+        self.assertGreaterEqual(busy_timeout, 1000)
+        self.assertEqual(connection.transaction_mode, "IMMEDIATE")
+
+    def test_benchmark_tuned_profile_has_no_lock_errors(self) -> None:
+        """
+        Test that concurrent writers commit every transaction with the
+            tuning profile.
+        """
+        (result,) = run_benchmark(workers=3, writes=50, profiles=("tuned",))
+
+        self.assertEqual(result["lock_errors"], 0)
+        self.assertEqual(result["committed"], 150)
@@ -0,0 +1,66 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+from task_manager.monitoring.startup import aggregate_packages, parse_importtime
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     django.utils.version
+import time:       200 |        300 |   django.utils
+import time:       500 |        800 | django
+import time:      1000 |       1000 | dotenv
+unrelated output
+"""
+
+
+class TestStartupProfile(SimpleTestCase):
+    def test_import_tree(self) -> None:
+        """
+        Test that nested imports are attached to the module importing them.
+        """
+        tree = parse_importtime(IMPORTTIME.splitlines())
+
+        self.assertEqual(
+            [node["module"] for node in tree], ["django", "dotenv"]
+        )
+        self.assertEqual(tree[0]["cumulative_ms"], 0.8)
+        utils = tree[0]["children"][0]
+        self.assertEqual(utils["module"], "django.utils")
+        self.assertEqual(utils["children"][0]["module"], "django.utils.version")
+
+    def test_packages_are_aggregated(self) -> None:
+        """
+        Test that the self time of modules is summed per top level package.
+        """
+        packages = aggregate_packages(parse_importtime(IMPORTTIME.splitlines()))
+
+        self.assertEqual(
+            packages,
+            [
+                {"package": "dotenv", "self_ms": 1.0, "modules": 1},
+                {"package": "django", "self_ms": 0.8, "modules": 3},
+            ],
+        )
+
+    def test_command_profiles_fresh_interpreter(self) -> None:
+        """
+        Test that the command reports every boot phase and the project
+            imports, and fails when over the budget.
+        """
+        out = StringIO()
+
+        call_command("profile_startup", "--json", stdout=out)
+        profile = json.loads(out.getvalue())
+
+        self.assertEqual(
+            list(profile["phases"]), ["settings", "apps", "application"]
+        )
+        self.assertIn(
+            "task_manager", [row["package"] for row in profile["packages"]]
+        )
+        with self.assertRaisesMessage(CommandError, "over the budget"):
+            call_command("profile_startup", "--budget-ms", "1", stdout=out)
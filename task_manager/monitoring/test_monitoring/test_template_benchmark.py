@@ -0,0 +1,38 @@
+from task_manager.monitoring.template_benchmark import (
+    LIST_TEMPLATES,
+    measure_row_cost,
+    run_benchmark,
+)
+from .testcase import MonitoringTestCase
+
+
+class TestTemplateBenchmark(MonitoringTestCase):
+    def test_benchmark_renders_every_list_with_both_engines(self) -> None:
+        """
+        Test that each list template is rendered by both engines with the
+            requested rows and a speedup is reported.
+        """
+        results = run_benchmark(rows=20, repeat=1, user=self.user1)
+
+        self.assertEqual(len(results), 2 * len(LIST_TEMPLATES))
+        for django, jinja in zip(results[::2], results[1::2]):
+            self.assertEqual(django["template"], jinja["template"])
+            self.assertEqual(
+                (django["engine"], jinja["engine"]), ("django", "jinja2")
+            )
+            self.assertGreater(jinja["speedup"], 0)
+            self.assertAlmostEqual(
+                jinja["bytes"], django["bytes"], delta=django["bytes"] * 0.02
+            )
+
+    def test_row_cost(self) -> None:
+        """
+        Test that the per-row costs of the task list are reported.
+        """
+        cost = measure_row_cost(rows=20, repeat=1, user=self.user1)
+
+        self.assertEqual(cost["rows"], 20)
+        for key in ("tags_us", "build_us"):
+            self.assertGreater(cost[key], 0)
+        self.assertIn("render_django_us", cost)
+        self.assertIn("render_jinja2_us", cost)
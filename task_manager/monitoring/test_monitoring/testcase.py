@@ -0,0 +1,22 @@
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase, Client
+
+from task_manager.utils import test_english, remove_rollbar
+from task_manager.users.models import User
+
+
+@test_english
+@remove_rollbar
+class MonitoringTestCase(TestCase):
+    fixtures = ["user.json", "status.json", "task.json", "label.json"]
+
+    def setUp(self) -> None:
+        self.log_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.log_dir, ignore_errors=True)
+
+        self.client = Client()
+        self.user1 = User.objects.get(pk=1)
+        self.client.force_login(self.user1)
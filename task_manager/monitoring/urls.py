@@ -0,0 +1,12 @@
+from django.urls import path
+
+from task_manager.monitoring.views import metrics_view, profile_download_view
+
+urlpatterns = [
+    path("metrics/", metrics_view, name="metrics"),
+    path(
+        "profiles/<str:name>/",
+        profile_download_view,
+        name="profile_download",
+    ),
+]
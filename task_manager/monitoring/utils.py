@@ -0,0 +1,16 @@
+def get_view_name(request):
+    """
+    Return the URL name of the view handling a request.
+
+    Falls back to the dotted path of the view for unnamed URLs, and to the
+    request path if the URL has not been resolved (yet).
+    """
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return request.path
+    if match.view_name:
+        return match.view_name
+    view = getattr(match.func, "view_class", match.func)
+    if not hasattr(view, "__qualname__"):
+        view = type(view)
+    return f"{view.__module__}.{view.__qualname__}"
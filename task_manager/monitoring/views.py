@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
+
+from .metrics import metrics
+from .profiling import is_profile_name
+
+
+@staff_member_required
+def profile_download_view(request, name):
+    """
+    Download a stored request profile.
+
+    Restricted to staff users. '.prof' files are pstats dumps (open with
+    `python -m pstats` or snakeviz), '.collapsed' files are collapsed
+    stacks for flamegraph tools.
+    """
+    path = Path(settings.PROFILING["DIR"]) / name
+    if not is_profile_name(name) or not path.is_file():
+        raise Http404
+    return FileResponse(open(path, "rb"), as_attachment=True, filename=name)
+
+
+def metrics_view(request):
+    """
+    Expose the metrics of the current worker in the Prometheus format.
+
+    Available to staff users and to scrapers sending
+    `Authorization: Bearer <METRICS_TOKEN>`.
+    """
+    token = settings.METRICS_TOKEN
+    authorization = request.headers.get("Authorization", "")
+    is_scraper = bool(token) and constant_time_compare(
+        authorization, f"Bearer {token}"
+    )
+    if not (is_scraper or request.user.is_staff):
+        raise Http404
+    return HttpResponse(
+        metrics.render(), content_type="text/plain; version=0.0.4"
+    )
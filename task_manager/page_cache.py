@@ -0,0 +1,90 @@
+import hashlib
+import re
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+
+from task_manager import invalidation
+
+CSRF_VALUE = re.compile(rb'(name="csrfmiddlewaretoken" value=")[^"]*(")')
+CSRF_PLACEHOLDER = b"__csrf_token__"
+
+
+class AnonymousPageCacheMixin:
+    """
+    Serve GET requests of anonymous visitors from a shared page cache.
+
+    Pages are cached per URL and active language, and stay valid until a
+    table of `page_cache_models` changes on any node (see
+    `task_manager.invalidation`). Visitors with pending flash messages get
+    a freshly rendered page, so the messages are shown and consumed. CSRF
+    tokens are stored as a placeholder and filled with the visitor's own
+    token on every hit.
+    """
+
+    page_cache_models = ()
+
+    def is_page_cacheable(self, request):
+        return (
+            settings.PAGE_CACHE["ENABLED"]
+            and request.method in ("GET", "HEAD")
+            and not request.user.is_authenticated
+            and not len(get_messages(request))
+        )
+
+    def get_page_cache_key(self, request):
+        path = hashlib.md5(
+            request.get_full_path().encode(), usedforsecurity=False
+        ).hexdigest()
+        language = getattr(request, "LANGUAGE_CODE", "")
+        return invalidation.versioned_key(
+            f"page:{language}:{path}",
+            [model._meta.db_table for model in self.page_cache_models],
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        if not self.is_page_cacheable(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        invalidation.get_bus()
+        key = self.get_page_cache_key(request)
+        entry = cache.get(key)
+        if entry is None:
+            response = super().dispatch(request, *args, **kwargs)
+            entry = self.make_page_cache_entry(response)
+            if entry is None:
+                return response
+            cache.set(key, entry, settings.PAGE_CACHE["TIMEOUT"])
+
+        content = entry["content"]
+        if entry["csrf"]:
+            content = content.replace(
+                CSRF_PLACEHOLDER, get_token(request).encode()
+            )
+        response = HttpResponse(content, status=entry["status"])
+        for header, value in entry["headers"]:
+            response[header] = value
+        return response
+
+    def make_page_cache_entry(self, response):
+        """
+        Return the cacheable parts of a rendered response, or None if it
+            must not be shared.
+        """
+        if hasattr(response, "render"):
+            response.render()
+        cookies = set(response.cookies) - {settings.CSRF_COOKIE_NAME}
+        if response.status_code != 200 or response.streaming or cookies:
+            return None
+        content, csrf = CSRF_VALUE.subn(
+            rb"\1" + CSRF_PLACEHOLDER + rb"\2", response.content
+        )
+        return {
+            "status": response.status_code,
+            "headers": list(response.items()),
+            "content": content,
+            "csrf": bool(csrf),
+        }
@@ -0,0 +1,41 @@
+"""
+Connection pooling for PostgreSQL through psycopg 3.
+
+With persistent connections every gunicorn thread keeps its own
+connection and `CONN_HEALTH_CHECKS` pings it at the start of each
+request. Django's native pool (psycopg_pool) shares a bounded set of
+connections between the threads of a worker instead and validates them
+inside the pool, so a request only borrows and returns a connection.
+"""
+
+
+def postgres_pool_options(
+    min_size=2,
+    max_size=10,
+    max_lifetime=3600.0,
+    max_idle=600.0,
+    timeout=30.0,
+):
+    """
+    Return the `DATABASES[...]["OPTIONS"]` enabling the connection pool.
+
+    Args:
+        min_size (int): Connections kept open by each worker process.
+        max_size (int): Upper bound of connections per worker process.
+        max_lifetime (float): Seconds after which a connection is replaced.
+        max_idle (float): Seconds an unused connection above `min_size`
+            is kept.
+        timeout (float): Seconds a request waits for a free connection.
+
+    Returns:
+        dict: Options for Django's PostgreSQL backend.
+    """
+    return {
+        "pool": {
+            "min_size": min_size,
+            "max_size": max_size,
+            "max_lifetime": max_lifetime,
+            "max_idle": max_idle,
+            "timeout": timeout,
+        }
+    }
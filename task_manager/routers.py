@@ -0,0 +1,87 @@
+import random
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+# Apps whose rows must be read right after they are written by the same
+# request, e.g. the session created by a login.
+PRIMARY_ONLY_APPS = frozenset({"sessions"})
+
+
+@dataclass
+class RoutingState:
+    """
+    Routing decision of the current request.
+    """
+
+    replica: str | None
+    wrote: bool = False
+
+
+_state = ContextVar("replica_routing", default=None)
+
+
+def begin_request(use_replica):
+    """
+    Start routing a request, choosing one replica for all of its reads.
+
+    Returns:
+        contextvars.Token: Token to pass to `end_request`.
+    """
+    replicas = settings.DATABASE_REPLICAS
+    replica = random.choice(replicas) if use_replica and replicas else None
+    return _state.set(RoutingState(replica))
+
+
+def end_request(token):
+    """
+    Stop routing a request.
+
+    Returns:
+        RoutingState: Final state, telling whether the request wrote.
+    """
+    state = _state.get()
+    _state.reset(token)
+    return state
+
+
+class ReplicaRouter:
+    """
+    Send reads of safe requests to a replica and everything else to the
+        primary.
+
+    Reads go to a replica only inside a request marked by
+    `ReplicaRoutingMiddleware` and before that request wrote anything
+    (Django routes `select_for_update()` as a write). Management commands,
+    shells and tests without the middleware always use the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if (
+            state is None
+            or state.replica is None
+            or state.wrote
+            or model._meta.app_label in PRIMARY_ONLY_APPS
+        ):
+            return DEFAULT_DB_ALIAS
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
@@ -11,14 +11,23 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import tempfile
 
 from django.conf.global_settings import DATABASES
 import dj_database_url
 from dotenv import load_dotenv
 from pathlib import Path
 
+from task_manager.postgres import postgres_pool_options
+from task_manager.sqlite import sqlite_options
 
 load_dotenv()
+
+
+def env_bool(name, default=False):
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes", "on")
+
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -65,18 +74,27 @@ INSTALLED_APPS = [
     "task_manager.statuses",
     "task_manager.tasks",
     "task_manager.labels",
+    "task_manager.monitoring",
+    "task_manager.jobs",
 ]
 
 MIDDLEWARE = [
+    "task_manager.monitoring.middleware.AccessLogMiddleware",
+    "task_manager.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "task_manager.middleware.ReplicaRoutingMiddleware",
+    "task_manager.monitoring.middleware.SlowQueryLogMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "task_manager.monitoring.middleware.ProfilingMiddleware",
+    "task_manager.monitoring.middleware.MemoryAccountingMiddleware",
+    "task_manager.monitoring.middleware.TrafficCaptureMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.middleware.locale.LocaleMiddleware",
-    "rollbar.contrib.django.middleware.RollbarNotifierMiddleware",
+    "task_manager.monitoring.middleware.QueuedRollbarNotifierMiddleware",
 ]
 
 ROOT_URLCONF = "task_manager.urls"
@@ -85,8 +103,18 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Compiled templates are kept for the life of the process and
+            # filled before the first request by `task_manager.warmup`.
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
@@ -94,22 +122,111 @@ TEMPLATES = [
             ],
         },
     },
+    {
+        # Jinja2 versions of the list pages, in the jinja2/ directory of
+        # the app, used when LIST_TEMPLATE_ENGINE is "jinja2".
+        "BACKEND": "django.template.backends.jinja2.Jinja2",
+        "APP_DIRS": True,
+        "OPTIONS": {
+            "environment": "task_manager.jinja.environment",
+            "context_processors": [
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+            ],
+        },
+    },
 ]
 
+# Engine rendering the task, user, status and label lists: "django" or
+# "jinja2" (compare them with `python manage.py benchmark_templates`).
+LIST_TEMPLATE_ENGINE = os.getenv("LIST_TEMPLATE_ENGINE", "django")
+
 WSGI_APPLICATION = "task_manager.wsgi.application"
 
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# The ASGI server (`make render-start`) runs the sync code of each request
+# in a new thread, and persistent connections are per thread: they would
+# never be reused and pile up to the database's connection limit. So
+# connections are closed after every request unless DATABASE_CONN_MAX_AGE
+# is set for a WSGI deployment; reuse under ASGI comes from DATABASE_POOL.
+
+CONN_MAX_AGE = int(os.getenv("DATABASE_CONN_MAX_AGE", "0"))
+
 DATABASES = {  # noqa
     "default": dj_database_url.config(
         default="sqlite:///db.sqlite3",
-        conn_max_age=600,
+        conn_max_age=CONN_MAX_AGE,
         conn_health_checks=True,
     ),
 }
 
+# SQLite tuning profile: WAL journal, synchronous=NORMAL, busy timeout,
+# mmap and cache sizes and IMMEDIATE write transactions, so several
+# gunicorn workers can write without "database is locked" errors.
+# Compare with `python manage.py benchmark_sqlite`.
+
+if DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3" and env_bool(
+    "SQLITE_TUNING", True
+):
+    DATABASES["default"]["OPTIONS"] = sqlite_options(
+        busy_timeout=float(os.getenv("SQLITE_BUSY_TIMEOUT", "20"))
+    )
+
+# Live server tests handle requests in several threads. With the default
+# in-memory test database Django shares one connection between them, and
+# the concurrent task writes of the load test, each taking a sync version
+# in a transaction, fail. Tests use a file instead, one per test run.
+
+if DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+    DATABASES["default"]["TEST"] = {
+        "NAME": Path(tempfile.gettempdir())
+        / f"task_manager_test_{os.getpid()}.sqlite3"
+    }
+
+# PostgreSQL connection pool (psycopg 3). The pool replaces persistent
+# connections and their per-request health checks, so both are disabled.
+# Compare with `python manage.py benchmark_connections`.
+
+if DATABASES["default"][
+    "ENGINE"
+] == "django.db.backends.postgresql" and env_bool("DATABASE_POOL"):
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = False
+    DATABASES["default"].setdefault("OPTIONS", {}).update(
+        postgres_pool_options(
+            min_size=int(os.getenv("DATABASE_POOL_MIN_SIZE", "2")),
+            max_size=int(os.getenv("DATABASE_POOL_MAX_SIZE", "10")),
+            max_lifetime=float(os.getenv("DATABASE_POOL_MAX_LIFETIME", "3600")),
+            max_idle=float(os.getenv("DATABASE_POOL_MAX_IDLE", "600")),
+            timeout=float(os.getenv("DATABASE_POOL_TIMEOUT", "30")),
+        )
+    )
+
+# Read replicas
+# Comma-separated DATABASE_REPLICA_URLS become the "replica_N" aliases.
+# Safe requests read from a replica unless the browser wrote within the
+# last REPLICA_STICKY_SECONDS; writes always go to "default".
+
+DATABASE_REPLICAS = []
+for number, url in enumerate(
+    filter(None, os.getenv("DATABASE_REPLICA_URLS", "").split(",")), start=1
+):
+    DATABASES[f"replica_{number}"] = {
+        **dj_database_url.parse(
+            url.strip(), conn_max_age=CONN_MAX_AGE, conn_health_checks=True
+        ),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica_{number}")
+
+DATABASE_ROUTERS = ["task_manager.routers.ReplicaRouter"]
+
+REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", "15"))
+REPLICA_STICKY_COOKIE_NAME = "primary_until"
+
 AUTH_USER_MODEL = "users.User"
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -157,6 +274,38 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+# Response compression
+# HTML and JSON responses of at least MIN_SIZE bytes are compressed with the
+# first of ENCODINGS the client accepts. zstd is skipped unless Python 3.14
+# or the backports.zstd package provides it. BREACH_PROTECTION leaves pages
+# with a CSRF token uncompressed when the request carries input.
+# Compare encodings with `python manage.py benchmark_compression`.
+
+RESPONSE_COMPRESSION = {
+    "ENABLED": env_bool("RESPONSE_COMPRESSION", True),
+    "MIN_SIZE": int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "1024")),
+    "ENCODINGS": ("zstd", "br", "gzip"),
+    "LEVELS": {"zstd": 3, "br": 4, "gzip": 6},
+    "CONTENT_TYPES": ("text/html", "application/json"),
+    "BREACH_PROTECTION": True,
+}
+
+# Bootstrap is bundled in task_manager/static instead of loaded from a CDN.
+# `collectstatic` writes content-hashed copies with gzip and brotli
+# variants to STATIC_ROOT, served in front of Django by
+# `task_manager.static_files.StaticFilesApp` (see asgi.py) or by Caddy.
+
+STATIC_ROOT = BASE_DIR / "staticfiles"
+
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "task_manager.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -168,4 +317,180 @@ ROLLBAR = {
     "access_token": os.getenv("ROLLBAR_ACCESS_TOKEN"),
     "environment": "production",
     "root": BASE_DIR,
+    # Used by the background thread of ERROR_REPORTING, which already
+    # keeps the network off the request path.
+    "handler": "blocking",
+}
+
+# Error reporting
+# Rollbar payloads are queued in-process and sent in batches by one thread
+# per worker. Reports beyond QUEUE_SIZE are dropped and counted, repeated
+# tracebacks within DEDUP_SECONDS are reported once.
+
+ERROR_REPORTING = {
+    "QUEUE_SIZE": 1000,
+    "BATCH_SIZE": 20,
+    "FLUSH_INTERVAL": 1.0,
+    "DEDUP_SECONDS": float(os.getenv("ERROR_REPORTING_DEDUP_SECONDS", "60")),
+}
+
+# Slow query log
+# Queries slower than THRESHOLD_MS are written to a rotating JSONL file
+# together with the originating view and the EXPLAIN output.
+# Inspect with `python manage.py slow_queries`.
+
+SLOW_QUERY_LOG = {
+    "ENABLED": env_bool("SLOW_QUERY_LOG"),
+    "THRESHOLD_MS": float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "100")),
+    "EXPLAIN": env_bool("SLOW_QUERY_EXPLAIN", True),
+    # Keep raw statements and params so `advise_indexes` can replay them.
+    "CAPTURE_PARAMS": env_bool("SLOW_QUERY_CAPTURE_PARAMS"),
+    "PATH": os.getenv(
+        "SLOW_QUERY_LOG_PATH", BASE_DIR / "logs" / "slow_queries.jsonl"
+    ),
+    "MAX_BYTES": int(os.getenv("SLOW_QUERY_LOG_MAX_BYTES", 10 * 1024 * 1024)),
+    "BACKUP_COUNT": int(os.getenv("SLOW_QUERY_LOG_BACKUP_COUNT", "5")),
+}
+
+# On-demand profiling
+# Staff users get a profile of a request by sending the HEADER header or
+# the QUERY_PARAM parameter ('sample' selects the sampling profiler).
+# The download link is returned in the X-Profile-Url response header.
+
+PROFILING = {
+    "ENABLED": env_bool("PROFILING"),
+    "HEADER": "X-Profile",
+    "QUERY_PARAM": "_profile",
+    "DIR": os.getenv("PROFILING_DIR", BASE_DIR / "logs" / "profiles"),
+    "SAMPLE_INTERVAL_MS": float(os.getenv("PROFILING_SAMPLE_INTERVAL_MS", "5")),
+    "KEEP": int(os.getenv("PROFILING_KEEP", "50")),
+}
+
+# Per-request memory accounting
+# Starts tracemalloc and records the peak allocation of every request per
+# view. Requests above THRESHOLD_MB log their TOP allocation sites.
+
+MEMORY_ACCOUNTING = {
+    "ENABLED": env_bool("MEMORY_ACCOUNTING"),
+    "THRESHOLD_MB": float(os.getenv("MEMORY_ACCOUNTING_THRESHOLD_MB", "50")),
+    "TOP": int(os.getenv("MEMORY_ACCOUNTING_TOP", "10")),
+    "FRAMES": int(os.getenv("MEMORY_ACCOUNTING_FRAMES", "1")),
+    "PATH": os.getenv(
+        "MEMORY_ACCOUNTING_LOG_PATH", BASE_DIR / "logs" / "memory.jsonl"
+    ),
+    "MAX_BYTES": 10 * 1024 * 1024,
+    "BACKUP_COUNT": 5,
+}
+
+# Metrics of the current worker are served at /monitoring/metrics/ to staff
+# users and to scrapers sending "Authorization: Bearer <METRICS_TOKEN>".
+
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Access log
+# One JSON line per request with URL name, status, user id, DB, render and
+# total time, written by a background thread to a size-rotated file.
+
+ACCESS_LOG = {
+    "ENABLED": env_bool("ACCESS_LOG"),
+    "PATH": os.getenv("ACCESS_LOG_PATH", BASE_DIR / "logs" / "access.jsonl"),
+    "MAX_BYTES": int(os.getenv("ACCESS_LOG_MAX_BYTES", 50 * 1024 * 1024)),
+    "BACKUP_COUNT": int(os.getenv("ACCESS_LOG_BACKUP_COUNT", "5")),
+}
+
+# Traffic capture
+# Sanitized request metadata (method, path, query, user id) for
+# `python manage.py replay_traffic`.
+
+TRAFFIC_CAPTURE = {
+    "ENABLED": env_bool("TRAFFIC_CAPTURE"),
+    "PATH": os.getenv(
+        "TRAFFIC_CAPTURE_PATH", BASE_DIR / "logs" / "traffic.jsonl"
+    ),
+    "MAX_BYTES": int(os.getenv("TRAFFIC_CAPTURE_MAX_BYTES", 50 * 1024 * 1024)),
+    "BACKUP_COUNT": int(os.getenv("TRAFFIC_CAPTURE_BACKUP_COUNT", "5")),
+}
+
+# Task sync
+# Tombstones of deleted tasks are kept TOMBSTONE_KEEP_DAYS for sync clients
+# (`python manage.py prune_tombstones`); clients with an older cursor start
+# over from a snapshot.
+
+TASK_SYNC = {
+    "TOMBSTONE_KEEP_DAYS": int(
+        os.getenv("TASK_SYNC_TOMBSTONE_KEEP_DAYS", "30")
+    ),
+}
+
+# Task events
+# Server-sent events at /tasks/events/, polled once per worker process.
+# Needs the ASGI server (`make render-start`), where open streams do not
+# hold a worker each.
+
+TASK_EVENTS = {
+    "POLL_INTERVAL": float(os.getenv("TASK_EVENTS_POLL_INTERVAL", "1")),
+    "BATCH_SIZE": 500,
+    "QUEUE_SIZE": 100,
+    "KEEPALIVE_SECONDS": 15,
+    "RETRY_MS": 3000,
+}
+
+# Cache invalidation
+# Every process caches in its own memory. Writes to tasks, statuses,
+# labels and users are broadcast with PostgreSQL LISTEN/NOTIFY ("auto" on
+# PostgreSQL) or Unix sockets in SOCKET_DIR between the workers of one
+# host ("auto" elsewhere); "local" disables the broadcast.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+CACHE_INVALIDATION = {
+    "BACKEND": os.getenv("CACHE_INVALIDATION_BACKEND", "auto"),
+    "CHANNEL": "cache_invalidation",
+    "SOCKET_DIR": os.getenv(
+        "CACHE_INVALIDATION_SOCKET_DIR",
+        Path(tempfile.gettempdir()) / "task_manager-cache-bus",
+    ),
+    "TIMEOUT": 300,
+}
+
+# Anonymous page cache
+# Public pages (home, login, users) rendered for anonymous visitors without
+# pending messages are kept in the default cache per URL and language, and
+# dropped through CACHE_INVALIDATION when the tables they show change.
+
+PAGE_CACHE = {
+    "ENABLED": env_bool("PAGE_CACHE", True),
+    "TIMEOUT": 600,
+}
+
+# Background jobs
+# Stored by `task_manager.jobs.queue.enqueue` in the transaction of the
+# triggering change and run by `python manage.py run_worker`. Workers
+# refresh the lock of a running job every HEARTBEAT_SECONDS; jobs without
+# a heartbeat for STALE_AFTER_SECONDS are requeued, or failed once they
+# used up their attempts.
+
+JOBS = {
+    "POLL_INTERVAL": float(os.getenv("JOBS_POLL_INTERVAL", "1")),
+    "BATCH_SIZE": 10,
+    "MAX_ATTEMPTS": 5,
+    "BACKOFF_SECONDS": 10,
+    "MAX_BACKOFF_SECONDS": 3600,
+    "HEARTBEAT_SECONDS": 30,
+    "STALE_AFTER_SECONDS": 120,
+    "KEEP_DAYS": 7,
+}
+
+# Warm-up
+# Run in every gunicorn worker before it accepts requests (gunicorn.conf.py)
+# and by `python manage.py warm_up`: compiles the templates of these apps,
+# builds the URL resolvers and loads the catalogs of all LANGUAGES.
+
+WARMUP = {
+    "ENABLED": env_bool("WARMUP", True),
+    "TEMPLATE_APPS": ("task_manager", "django_bootstrap5"),
 }
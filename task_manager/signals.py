@@ -0,0 +1,27 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from task_manager.conditional import TRACKED_MODELS, bump_table_version
+from task_manager.invalidation import invalidate
+from task_manager.tasks.models import Task
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def bump_version_on_write(sender, using, **kwargs):
+    """
+    Invalidate cached pages and values built from the table that changed.
+    """
+    if sender in TRACKED_MODELS:
+        bump_table_version(sender, using)
+        invalidate([sender._meta.db_table], using)
+
+
+@receiver(m2m_changed, sender=Task.labels.through)
+def bump_version_on_labels_change(sender, action, using, **kwargs):
+    """
+    Invalidate cached task pages and values when task labels change.
+    """
+    if action in ("post_add", "post_remove", "post_clear"):
+        bump_table_version(Task, using)
+        invalidate([Task._meta.db_table], using)
@@ -0,0 +1,150 @@
+"""
+Serving collected static files in front of Django.
+
+`StaticFilesApp` wraps the ASGI application and answers requests under
+`STATIC_URL` from `STATIC_ROOT` itself, so assets never go through the
+Django request handler or middleware. Files listed in the manifest under
+their hashed names are cached by browsers for a year; precompressed
+variants written by `CompressedManifestStaticFilesStorage` are sent to
+clients accepting them.
+"""
+
+import asyncio
+import json
+import mimetypes
+from pathlib import Path
+
+IMMUTABLE = b"public, max-age=31536000, immutable"
+REVALIDATE = b"no-cache"
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class StaticFile:
+    """
+    A collected file with its precompressed variants.
+    """
+
+    def __init__(self, path, immutable):
+        self.immutable = immutable
+        content_type, _ = mimetypes.guess_type(path.name)
+        content_type = content_type or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in (
+            "application/javascript",
+            "application/json",
+            "image/svg+xml",
+        ):
+            content_type += "; charset=utf-8"
+        self.content_type = content_type.encode()
+        self.variants = {None: self.describe(path, "")}
+        for encoding, suffix in ENCODINGS:
+            variant = path.with_name(path.name + suffix)
+            if variant.is_file():
+                self.variants[encoding] = self.describe(variant, suffix)
+
+    @staticmethod
+    def describe(path, suffix):
+        stat = path.stat()
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{suffix}"'
+        return path, stat.st_size, etag.encode()
+
+    def choose(self, accept_encoding):
+        """
+        Return the variant for an `Accept-Encoding` header value.
+        """
+        accepted = {
+            part.split(";")[0].strip()
+            for part in accept_encoding.lower().split(",")
+        }
+        for encoding, _ in ENCODINGS:
+            if encoding in accepted and encoding in self.variants:
+                return encoding, self.variants[encoding]
+        return None, self.variants[None]
+
+
+def scan_static_root(root):
+    """
+    Index the files of `root` by URL path, without compressed variants.
+
+    Returns:
+        dict[str, StaticFile]: Files by path relative to `root`.
+    """
+    root = Path(root)
+    hashed = set()
+    manifest = root / "staticfiles.json"
+    if manifest.is_file():
+        hashed = set(json.loads(manifest.read_text())["paths"].values())
+
+    files = {}
+    for path in root.rglob("*"):
+        if not path.is_file() or path.suffix in (".br", ".gz"):
+            continue
+        name = path.relative_to(root).as_posix()
+        files[name] = StaticFile(path, name in hashed)
+    return files
+
+
+class StaticFilesApp:
+    """
+    ASGI application serving `root` under `prefix` and passing other
+        requests to `application`.
+
+    The directory is indexed once at start, as it only changes with
+    `collectstatic` on deploy; requests for paths outside the index get a
+    404 without a file system lookup.
+    """
+
+    def __init__(self, application, root, prefix):
+        self.application = application
+        self.prefix = "/" + prefix.strip("/") + "/"
+        self.files = scan_static_root(root) if Path(root).is_dir() else {}
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not self.files
+            or not scope["path"].startswith(self.prefix)
+        ):
+            return await self.application(scope, receive, send)
+
+        if scope["method"] not in ("GET", "HEAD"):
+            return await self.respond(send, 405, [(b"allow", b"GET, HEAD")])
+        static_file = self.files.get(scope["path"][len(self.prefix) :])
+        if static_file is None:
+            return await self.respond(send, 404)
+
+        request_headers = dict(scope["headers"])
+        encoding, (path, size, etag) = static_file.choose(
+            request_headers.get(b"accept-encoding", b"").decode("latin-1")
+        )
+        headers = [
+            (
+                b"cache-control",
+                IMMUTABLE if static_file.immutable else REVALIDATE,
+            ),
+            (b"etag", etag),
+        ]
+        if len(static_file.variants) > 1:
+            headers.append((b"vary", b"Accept-Encoding"))
+        if request_headers.get(b"if-none-match") == etag:
+            return await self.respond(send, 304, headers)
+
+        headers += [
+            (b"content-type", static_file.content_type),
+            (b"content-length", str(size).encode()),
+        ]
+        if encoding:
+            headers.append((b"content-encoding", encoding.encode()))
+        body = b""
+        if scope["method"] == "GET":
+            body = await asyncio.to_thread(path.read_bytes)
+        await self.respond(send, 200, headers, body)
+
+    async def respond(self, send, status, headers=(), body=b""):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": list(headers),
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
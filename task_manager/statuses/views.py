@@ -4,12 +4,25 @@ from django.views.generic import ListView, CreateView, UpdateView, DeleteView
 from django.utils.translation import gettext_lazy as _
 from django.contrib.messages.views import SuccessMessageMixin
 
-from task_manager.mixins import AuthRequiredMixin, DeleteProtectionMixin
+from task_manager.conditional import ConditionalGetMixin
+from task_manager.rows import ListRowsMixin
+from task_manager.mixins import (
+    AuthRequiredMixin,
+    DeleteProtectionMixin,
+    ListTemplateEngineMixin,
+)
+from task_manager.users.models import User
 from .models import Status
 from .forms import StatusForm
 
 
-class StatusesListView(AuthRequiredMixin, ListView):
+class StatusesListView(
+    AuthRequiredMixin,
+    ConditionalGetMixin,
+    ListTemplateEngineMixin,
+    ListRowsMixin,
+    ListView,
+):
     """
     Show all statuses.
 
@@ -19,6 +32,12 @@ class StatusesListView(AuthRequiredMixin, ListView):
     template_name = "statuses/statuses.html"
     model = Status
     context_object_name = "statuses"
+    conditional_models = (Status, User)
+    row_urls = {"update_url": "status_update", "delete_url": "status_delete"}
+    row_dates = {"created": "created_at"}
+
+    def get_row(self, status):
+        return {"id": status.pk, "name": status.name}
 
     def get_context_data(self, **kwargs):
         context = {
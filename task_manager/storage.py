@@ -0,0 +1,72 @@
+import gzip
+
+import brotli
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+COMPRESSIBLE_EXTENSIONS = (
+    ".css",
+    ".js",
+    ".map",
+    ".svg",
+    ".json",
+    ".txt",
+    ".html",
+    ".xml",
+)
+
+
+def compress_variants(content):
+    """
+    Return the gzip and brotli encodings of `content` worth keeping.
+
+    Variants saving less than 5% are left out, so small or incompressible
+    files are only served as they are.
+
+    Returns:
+        dict[str, bytes]: Compressed content by file suffix.
+    """
+    variants = {
+        ".gz": gzip.compress(content, compresslevel=9, mtime=0),
+        ".br": brotli.compress(content, quality=11),
+    }
+    return {
+        suffix: data
+        for suffix, data in variants.items()
+        if len(data) < len(content) * 0.95
+    }
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Manifest storage that also writes `.gz` and `.br` siblings of hashed
+        text files during `collectstatic`.
+
+    Hashed names change with the content, so they are served with far
+    future immutable cache headers, by `static_files.StaticFilesApp` or
+    Caddy's `file_server { precompressed br gzip }`.
+    """
+
+    def stored_name(self, name):
+        # Without a manifest, as in development and tests where
+        # collectstatic has not run, use the files found by the finders.
+        if not self.hashed_files:
+            return name
+        return super().stored_name(name)
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+
+        # Pages only link the hashed names, the unhashed copies are left
+        # uncompressed.
+        for name in sorted(set(self.hashed_files.values())):
+            if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+                continue
+            with self.open(name) as file:
+                content = file.read()
+            for suffix, data in compress_variants(content).items():
+                if self.exists(name + suffix):
+                    self.delete(name + suffix)
+                self._save(name + suffix, ContentFile(data))
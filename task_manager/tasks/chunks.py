@@ -0,0 +1,68 @@
+from task_manager.rows import local_date_formatter
+
+# Names of the values in every chunk row, as the task list shows them.
+CHUNK_FIELDS = (
+    "id",
+    "name",
+    "status_name",
+    "author_name",
+    "executor_name",
+    "created",
+)
+
+CHUNK_COLUMNS = (
+    "id",
+    "name",
+    "status__name",
+    "author__first_name",
+    "author__last_name",
+    "executor__first_name",
+    "executor__last_name",
+    "created_at",
+)
+
+
+def get_chunk(queryset, after=0, limit=100, date_format="d.m.Y H:i"):
+    """
+    Return the tasks of `queryset` with ids above `after` in id order.
+
+    Rows are projected with `values_list`, so no model instance is built,
+    and sent as lists of the `fields` values. One task more than `limit`
+    is fetched to tell whether another chunk follows, so the filtered
+    tasks are never counted.
+
+    Returns:
+        dict: `fields`, `rows` and `next`, the id to pass as `after` for
+            the next chunk, or None if this chunk is the last.
+    """
+    items = list(
+        queryset.filter(pk__gt=after)
+        .order_by("pk")
+        .values_list(*CHUNK_COLUMNS)[: limit + 1]
+    )
+    format_date = local_date_formatter(date_format)
+    rows = [
+        [
+            pk,
+            name,
+            status,
+            f"{author_first} {author_last}".strip(),
+            f"{executor_first} {executor_last}".strip(),
+            format_date(created_at),
+        ]
+        for (
+            pk,
+            name,
+            status,
+            author_first,
+            author_last,
+            executor_first,
+            executor_last,
+            created_at,
+        ) in items[:limit]
+    ]
+    return {
+        "fields": CHUNK_FIELDS,
+        "rows": rows,
+        "next": rows[-1][0] if len(items) > limit else None,
+    }
@@ -0,0 +1,215 @@
+import asyncio
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.utils import dateformat, timezone
+
+from .filters import TaskFilter
+from .models import Task
+from .sync import get_changes, get_cursor, serialize_task
+
+logger = logging.getLogger(__name__)
+
+
+def close_broken_connections():
+    """
+    Close database connections that stopped working, so the next query
+    reconnects.
+    """
+    for connection in connections.all(initialized_only=True):
+        if (
+            connection.connection is not None
+            and not connection.in_atomic_block
+            and not connection.is_usable()
+        ):
+            connection.close()
+
+
+def serialize_event(task):
+    """
+    Return a changed task with the values the task list shows.
+    """
+    return {
+        **serialize_task(task),
+        "status_name": str(task.status),
+        "author_name": str(task.author),
+        "executor_name": str(task.executor),
+        "created": dateformat.format(
+            timezone.localtime(task.created_at), "d.m.Y H:i"
+        ),
+    }
+
+
+def get_criteria(params, user):
+    """
+    Turn `TaskFilter` parameters into values compared with task events.
+
+    Returns:
+        dict | None: Required ids by field, None values match anything.
+            None if the parameters are invalid.
+    """
+    form = TaskFilter(params, queryset=Task.objects.none()).form
+    if not form.is_valid():
+        return None
+    data = form.cleaned_data
+    return {
+        "status": data["status"].pk if data["status"] else None,
+        "executor": data["executor"].pk if data["executor"] else None,
+        "labels": data["labels"].pk if data["labels"] else None,
+        "author": user.pk if data["own_tasks"] else None,
+    }
+
+
+def matches(task, criteria):
+    """
+    Check whether a serialized task passes the subscribed filter.
+    """
+    return (
+        criteria["status"] in (None, task["status"])
+        and criteria["executor"] in (None, task["executor"])
+        and criteria["author"] in (None, task["author"])
+        and (criteria["labels"] is None or criteria["labels"] in task["labels"])
+    )
+
+
+def format_changes(changes, criteria):
+    """
+    Render a batch from `get_changes` as server-sent events.
+
+    Tasks passing the filter are sent as 'task' events, deleted tasks and
+    tasks that no longer pass it as 'remove' events. Only the last event
+    carries the batch cursor as id, so a reconnecting client resumes after
+    the whole batch.
+    """
+    events = []
+    for task in changes["changed"]:
+        if matches(task, criteria):
+            events.append(("task", task))
+        else:
+            events.append(("remove", {"id": task["id"]}))
+    events.extend(("remove", {"id": pk}) for pk in changes["deleted"])
+    if not events:
+        return ""
+
+    lines = []
+    for number, (event, data) in enumerate(events, start=1):
+        if number == len(events):
+            lines.append(f"id: {changes['cursor']}")
+        lines.append(f"event: {event}")
+        lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+class Subscription:
+    """
+    Bounded queue of change batches for one open stream.
+    """
+
+    def __init__(self, size):
+        self.queue = asyncio.Queue(size)
+        self.overflowed = False
+
+
+class TaskEventBroker:
+    """
+    Poll task changes once per process and fan them out to open streams.
+
+    A single coroutine reads the changes after the last seen version every
+    `TASK_EVENTS["POLL_INTERVAL"]` seconds, however many clients listen,
+    and stops when the last stream closes. A failed poll is logged and
+    retried from the same cursor, so no change is lost. A stream that falls
+    `QUEUE_SIZE` batches behind is closed; the browser reconnects with
+    `Last-Event-ID` and catches up from the database.
+    """
+
+    def __init__(self):
+        self.subscriptions = set()
+        self.cursor = None
+        self._loop = None
+        self._task = None
+
+    async def subscribe(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self.subscriptions = set()
+            self._loop = loop
+            self._task = None
+        subscription = Subscription(settings.TASK_EVENTS["QUEUE_SIZE"])
+        self.subscriptions.add(subscription)
+        if self._task is None or self._task.done():
+            self.cursor = await sync_to_async(get_cursor)()
+            self._task = loop.create_task(self.run())
+        return subscription
+
+    def unsubscribe(self, subscription):
+        self.subscriptions.discard(subscription)
+
+    async def run(self):
+        config = settings.TASK_EVENTS
+        while self.subscriptions:
+            await asyncio.sleep(config["POLL_INTERVAL"])
+            try:
+                changes = await sync_to_async(get_changes)(
+                    self.cursor, config["BATCH_SIZE"], serialize_event
+                )
+            except Exception:
+                logger.exception("Polling task changes failed")
+                await sync_to_async(close_broken_connections)()
+                continue
+            if not (changes["changed"] or changes["deleted"]):
+                continue
+            self.cursor = changes["cursor"]
+            self.publish(changes)
+
+    def publish(self, changes):
+        for subscription in list(self.subscriptions):
+            try:
+                subscription.queue.put_nowait(changes)
+            except asyncio.QueueFull:
+                subscription.overflowed = True
+                self.unsubscribe(subscription)
+
+
+broker = TaskEventBroker()
+
+
+async def stream_events(criteria, cursor):
+    """
+    Yield server-sent events for task changes after `cursor`.
+
+    Changes missed before the stream was opened are read from the database
+    first, then the stream follows the broker. Comment lines keep idle
+    connections open through proxies.
+    """
+    config = settings.TASK_EVENTS
+    subscription = await broker.subscribe()
+    try:
+        yield f"retry: {config['RETRY_MS']}\n\n"
+        has_more = cursor is not None
+        while has_more:
+            changes = await sync_to_async(get_changes)(
+                cursor, config["BATCH_SIZE"], serialize_event
+            )
+            if text := format_changes(changes, criteria):
+                yield text
+            cursor, has_more = changes["cursor"], changes["has_more"]
+
+        while not subscription.overflowed:
+            try:
+                changes = await asyncio.wait_for(
+                    subscription.queue.get(), config["KEEPALIVE_SECONDS"]
+                )
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            # Batches already replayed from the database are skipped.
+            if cursor is not None and changes["cursor"] <= cursor:
+                continue
+            if text := format_changes(changes, criteria):
+                yield text
+    finally:
+        broker.unsubscribe(subscription)
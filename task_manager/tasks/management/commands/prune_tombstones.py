@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from task_manager.tasks.sync import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete tombstones of tasks deleted longer ago than sync clients "
+        "are expected to stay offline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TASK_SYNC["TOMBSTONE_KEEP_DAYS"],
+            help="Keep tombstones of tasks deleted within this many days.",
+        )
+
+    def handle(self, *args, **options):
+        deleted = prune_tombstones(options["days"])
+        self.stdout.write(f"Tombstones deleted: {deleted}")
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:34
+
+from django.db import migrations, models
+
+
+def number_existing_tasks(apps, schema_editor):
+    """
+    Give existing tasks distinct versions so the first sync returns them.
+    """
+    Task = apps.get_model("tasks", "Task")
+    SyncCounter = apps.get_model("tasks", "SyncCounter")
+    db = schema_editor.connection.alias
+    version = 0
+    for pk in (
+        Task.objects.using(db).order_by("pk").values_list("pk", flat=True)
+    ):
+        version += 1
+        Task.objects.using(db).filter(pk=pk).update(version=version)
+    SyncCounter.objects.using(db).create(pk=1, value=version)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("value", models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="TaskTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("task_id", models.PositiveBigIntegerField()),
+                ("version", models.PositiveBigIntegerField(db_index=True)),
+                ("deleted_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, verbose_name="Modification date"
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="version",
+            field=models.PositiveBigIntegerField(
+                db_index=True, default=0, editable=False
+            ),
+        ),
+        migrations.RunPython(number_existing_tasks, migrations.RunPython.noop),
+    ]
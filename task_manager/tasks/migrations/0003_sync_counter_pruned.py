@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0002_task_sync"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="synccounter",
+            name="pruned",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models import F
 from django.utils.translation import gettext_lazy as _
 
 from task_manager.users.models import User
@@ -6,6 +7,32 @@ from task_manager.statuses.models import Status
 from task_manager.labels.models import Label
 
 
+class SyncCounter(models.Model):
+    """
+    Single-row counter handing out versions to changed and deleted tasks.
+
+    `pruned` is the newest version of a deleted tombstone: clients with an
+    older cursor may have missed deletions.
+    """
+
+    value = models.PositiveBigIntegerField(default=0)
+    pruned = models.PositiveBigIntegerField(default=0)
+
+
+def next_version(using):
+    """
+    Increment the sync counter and return its new value.
+
+    Must run in the transaction that writes the versioned row: the counter
+    row stays locked until that transaction ends, so versions become
+    visible in increasing order and a client's cursor never skips one.
+    """
+    counter = SyncCounter.objects.using(using)
+    if not counter.filter(pk=1).update(value=F("value") + 1):
+        counter.create(pk=1, value=1)
+    return counter.values_list("value", flat=True).get(pk=1)
+
+
 class Task(models.Model):
     name = models.CharField(
         max_length=150, blank=False, unique=True, verbose_name=_("Name")
@@ -16,6 +43,12 @@ class Task(models.Model):
     created_at = models.DateTimeField(
         auto_now_add=True, verbose_name=_("Creation date")
     )
+    updated_at = models.DateTimeField(
+        auto_now=True, verbose_name=_("Modification date")
+    )
+    version = models.PositiveBigIntegerField(
+        default=0, db_index=True, editable=False
+    )
     author = models.ForeignKey(
         User,
         on_delete=models.PROTECT,
@@ -46,11 +79,37 @@ class Task(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        """
+        Give the task a new sync version on every save.
+        """
+        using = kwargs.get("using") or router.db_for_write(Task, instance=self)
+        with transaction.atomic(using=using):
+            self.version = next_version(using)
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {
+                    *update_fields,
+                    "version",
+                    "updated_at",
+                }
+            super().save(*args, **kwargs)
+
     class Meta:
         verbose_name = _("Task")
         verbose_name_plural = _("Tasks")
 
 
+class TaskTombstone(models.Model):
+    """
+    Record of a deleted task kept for incremental sync clients.
+    """
+
+    task_id = models.PositiveBigIntegerField()
+    version = models.PositiveBigIntegerField(db_index=True)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+
 class TaskLabelRelation(models.Model):
     task = models.ForeignKey(Task, on_delete=models.CASCADE)
     label = models.ForeignKey(Label, on_delete=models.PROTECT)
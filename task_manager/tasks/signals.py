@@ -0,0 +1,48 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Task, TaskTombstone, next_version
+
+
+@receiver(post_delete, sender=Task)
+def create_tombstone(sender, instance, using, **kwargs):
+    """
+    Leave a tombstone so sync clients learn about the deletion.
+    """
+    with transaction.atomic(using=using):
+        TaskTombstone.objects.using(using).create(
+            task_id=instance.pk, version=next_version(using)
+        )
+
+
+@receiver(m2m_changed, sender=Task.labels.through)
+def bump_version_on_labels_change(
+    sender, instance, action, reverse, pk_set, using, **kwargs
+):
+    """
+    Give tasks a new version when their labels change.
+
+    The form saves labels after the task itself, so without this a client
+    polling in between would keep the old labels. Clearing the tasks of a
+    label sends no ids, so they are collected before the clear.
+    """
+    if action == "pre_clear" and reverse:
+        instance._cleared_task_ids = list(
+            sender.objects.using(using)
+            .filter(label=instance)
+            .values_list("task_id", flat=True)
+        )
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if action == "post_clear" and reverse:
+        task_ids = instance.__dict__.pop("_cleared_task_ids", ())
+    else:
+        task_ids = pk_set if reverse else [instance.pk]
+    for task_id in task_ids or ():
+        with transaction.atomic(using=using):
+            Task.objects.using(using).filter(pk=task_id).update(
+                version=next_version(using), updated_at=timezone.now()
+            )
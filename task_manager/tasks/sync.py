@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import SyncCounter, Task, TaskTombstone
+
+
+def serialize_task(task):
+    """
+    Return the fields of a task sent to sync clients.
+    """
+    return {
+        "id": task.pk,
+        "name": task.name,
+        "description": task.description,
+        "status": task.status_id,
+        "author": task.author_id,
+        "executor": task.executor_id,
+        "labels": [label.pk for label in task.labels.all()],
+        "created_at": task.created_at.isoformat(),
+        "updated_at": task.updated_at.isoformat(),
+        "version": task.version,
+    }
+
+
+def get_cursor():
+    """
+    Return the latest version handed out, a cursor for "from now on".
+    """
+    counter = SyncCounter.objects.filter(pk=1).values_list("value", flat=True)
+    return counter.first() or 0
+
+
+def get_changes(cursor, limit, serialize=serialize_task):
+    """
+    Collect tasks changed or deleted after `cursor`, oldest change first.
+
+    Both queries walk the index on `version`, so the cost depends on the
+    number of changes rather than on the number of tasks. Without a cursor
+    the client gets a snapshot of all tasks and no tombstones. So does a
+    cursor older than the pruned tombstones, with `reset` set: the client
+    must drop the tasks it has.
+
+    Args:
+        cursor (int | None): Version returned by the previous call.
+        limit (int): Maximum number of changes returned.
+        serialize (Callable[[Task], dict]): Converts changed tasks.
+
+    Returns:
+        dict: 'changed' tasks, 'deleted' task ids, the next 'cursor',
+            whether 'has_more' changes are waiting and whether the client
+            must 'reset'.
+    """
+    reset = (
+        cursor is not None
+        and SyncCounter.objects.filter(pk=1, pruned__gt=cursor).exists()
+    )
+    if reset:
+        cursor = None
+    after = -1 if cursor is None else cursor
+    tasks = list(
+        Task.objects.filter(version__gt=after)
+        .order_by("version")
+        .select_related("status", "author", "executor")
+        .prefetch_related("labels")[: limit + 1]
+    )
+    tombstones = []
+    if cursor is not None:
+        tombstones = list(
+            TaskTombstone.objects.filter(version__gt=after)
+            .order_by("version")
+            .values("task_id", "version")[: limit + 1]
+        )
+
+    changes = sorted(
+        [(task.version, task) for task in tasks]
+        + [(row["version"], row["task_id"]) for row in tombstones],
+        key=lambda change: change[0],
+    )
+    page = changes[:limit]
+    return {
+        "changed": [
+            serialize(item) for _, item in page if isinstance(item, Task)
+        ],
+        "deleted": [item for _, item in page if isinstance(item, int)],
+        "cursor": page[-1][0] if page else max(after, 0),
+        "has_more": len(changes) > limit,
+        "reset": reset,
+    }
+
+
+def prune_tombstones(days):
+    """
+    Delete tombstones of tasks deleted more than `days` days ago.
+
+    Clients whose cursor predates the deleted tombstones get a snapshot
+    with `reset` from `get_changes` on their next poll.
+
+    Returns:
+        int: Number of deleted tombstones.
+    """
+    deadline = timezone.now() - timedelta(days=days)
+    with transaction.atomic():
+        tombstones = TaskTombstone.objects.filter(deleted_at__lt=deadline)
+        newest = tombstones.aggregate(newest=Max("version"))["newest"]
+        if newest is None:
+            return 0
+        deleted, _ = TaskTombstone.objects.filter(version__lte=newest).delete()
+        SyncCounter.objects.filter(pk=1, pruned__lt=newest).update(
+            pruned=newest
+        )
+    return deleted
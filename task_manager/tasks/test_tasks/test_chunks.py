@@ -0,0 +1,131 @@
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from task_manager.tasks.models import Task
+from task_manager.tasks.views import TasksListView
+from .testcase import TaskTestCase
+
+
+class TestTaskChunks(TaskTestCase):
+    def chunk(self, **params):
+        response = self.client.get(reverse_lazy("task_chunk"), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_chunks_continue_after_last_id(self) -> None:
+        """
+        Test that following `next` returns every task once, in id order.
+        """
+        ids = []
+        data = self.chunk(limit=1)
+        while True:
+            ids.extend(row[0] for row in data["rows"])
+            if data["next"] is None:
+                break
+            self.assertEqual(data["next"], ids[-1])
+            data = self.chunk(limit=1, after=data["next"])
+
+        self.assertEqual(
+            ids, list(Task.objects.order_by("pk").values_list("pk", flat=True))
+        )
+
+    def test_chunk_rows_match_list_rows(self) -> None:
+        """
+        Test that chunk rows hold the values the task list shows.
+        """
+        data = self.chunk()
+        row = dict(zip(data["fields"], data["rows"][0]))
+
+        self.assertEqual(
+            row,
+            {
+                "id": self.task1.pk,
+                "name": self.task1.name,
+                "status_name": str(self.task1.status),
+                "author_name": str(self.task1.author),
+                "executor_name": str(self.task1.executor),
+                "created": self.task1.created_at.strftime("%d.%m.%Y %H:%M"),
+            },
+        )
+
+    def test_chunk_applies_filter(self) -> None:
+        """
+        Test that a chunk holds only the tasks passing the filter.
+        """
+        data = self.chunk(status=self.status1.pk)
+
+        self.assertEqual(
+            [row[0] for row in data["rows"]],
+            list(
+                Task.objects.filter(status=self.status1)
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            ),
+        )
+
+    def test_chunk_runs_one_query(self) -> None:
+        """
+        Test that a chunk is one query, without counting the filtered tasks.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.chunk(labels=self.label2.pk, own_tasks="on", limit=1)
+
+        selects = [
+            query["sql"]
+            for query in queries.captured_queries
+            if "tasks_task" in query["sql"]
+        ]
+        self.assertEqual(len(selects), 1)
+        self.assertNotIn("COUNT(", selects[0])
+
+    def test_page_shows_first_chunk(self) -> None:
+        """
+        Test that the task list renders only the first chunk and where the
+            next one starts.
+        """
+        first = Task.objects.order_by("pk").first()
+        TasksListView.chunk_size, size = 1, TasksListView.chunk_size
+        try:
+            response = self.client.get(reverse_lazy("tasks"))
+        finally:
+            TasksListView.chunk_size = size
+
+        self.assertEqual(response.context["tasks"], [first])
+        self.assertContains(response, f'data-next="{first.pk}"')
+
+    def test_next_link_without_scripts(self) -> None:
+        """
+        Test that the page links to the tasks after its chunk, keeping the
+            filter, for browsers without scripts.
+        """
+        ids = list(Task.objects.order_by("pk").values_list("pk", flat=True))
+        TasksListView.chunk_size, size = 1, TasksListView.chunk_size
+        try:
+            first = self.client.get(reverse_lazy("tasks"), {"executor": ""})
+            second = self.client.get(
+                reverse_lazy("tasks"), {"executor": "", "after": ids[0]}
+            )
+        finally:
+            TasksListView.chunk_size = size
+
+        self.assertContains(first, f'href="?executor=&amp;after={ids[0]}"')
+        self.assertEqual(second.context["tasks"], [Task.objects.get(pk=ids[1])])
+
+    def test_invalid_parameters(self) -> None:
+        """
+        Test that bad `after`, `limit` or filter values are rejected.
+        """
+        for params in ({"after": "x"}, {"limit": 0}, {"status": "x"}):
+            with self.subTest(params=params):
+                response = self.client.get(reverse_lazy("task_chunk"), params)
+                self.assertEqual(response.status_code, 400)
+
+    def test_anonymous_request(self) -> None:
+        """
+        Test that a chunk requires authentication.
+        """
+        response = Client().get(reverse_lazy("task_chunk"))
+
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,149 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.db import OperationalError
+from django.test import override_settings
+from django.urls import reverse_lazy
+
+from task_manager.tasks import events
+from task_manager.tasks.events import format_changes, get_criteria
+from task_manager.tasks.models import Task
+from .testcase import TaskTestCase
+
+EVENTS = {
+    "POLL_INTERVAL": 0.01,
+    "BATCH_SIZE": 500,
+    "QUEUE_SIZE": 100,
+    "KEEPALIVE_SECONDS": 15,
+    "RETRY_MS": 3000,
+}
+
+
+@override_settings(TASK_EVENTS=EVENTS)
+class TestTaskEvents(TaskTestCase):
+    async def open_stream(self, **params):
+        await self.async_client.aforce_login(self.user1)
+        response = await self.async_client.get(
+            reverse_lazy("task_events"), params
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        self.assertTrue((await anext(stream)).startswith(b"retry:"))
+        return stream
+
+    async def test_stream_pushes_created_task(self) -> None:
+        """
+        Test that a task created after the stream opened is pushed.
+        """
+        stream = await self.open_stream()
+        task_data = self.test_task["create"]["valid"]
+
+        await sync_to_async(Task.objects.create)(
+            name=task_data["name"],
+            author=self.user1,
+            executor=self.user2,
+            status=self.status1,
+        )
+
+        chunk = await asyncio.wait_for(anext(stream), 5)
+        self.assertIn(b"event: task", chunk)
+        self.assertIn(task_data["name"].encode(), chunk)
+        await stream.aclose()
+
+    async def test_failed_poll_is_retried(self) -> None:
+        """
+        Test that a failing poll does not stop the broker and that the
+            change made meanwhile is still pushed.
+        """
+        get_changes, failures = events.get_changes, []
+
+        def fail_once(*args, **kwargs):
+            if not failures:
+                failures.append(args)
+                raise OperationalError("database is locked")
+            return get_changes(*args, **kwargs)
+
+        events.get_changes = fail_once
+        self.addCleanup(setattr, events, "get_changes", get_changes)
+        stream = await self.open_stream()
+        task_data = self.test_task["create"]["valid"]
+
+        with self.assertLogs("task_manager.tasks.events", "ERROR"):
+            await sync_to_async(Task.objects.create)(
+                name=task_data["name"],
+                author=self.user1,
+                executor=self.user2,
+                status=self.status1,
+            )
+            chunk = await asyncio.wait_for(anext(stream), 5)
+
+        self.assertEqual(len(failures), 1)
+        self.assertIn(task_data["name"].encode(), chunk)
+        await stream.aclose()
+
+    async def test_stream_resumes_after_cursor(self) -> None:
+        """
+        Test that changes after the given cursor are replayed, with deleted
+            and filtered out tasks sent as removals.
+        """
+        deleted_pk, filtered_pk = self.task1.pk, self.task2.pk
+        await sync_to_async(self.task1.delete)()
+        await sync_to_async(self.task2.save)()
+
+        stream = await self.open_stream(cursor=0, executor=self.user2.pk)
+
+        chunk = (await asyncio.wait_for(anext(stream), 5)).decode()
+        self.assertIn(f'event: remove\ndata: {{"id": {filtered_pk}}}', chunk)
+        self.assertIn(f'event: remove\ndata: {{"id": {deleted_pk}}}', chunk)
+        await stream.aclose()
+
+    async def test_anonymous_and_wsgi_requests(self) -> None:
+        """
+        Test that anonymous clients get 401 and WSGI requests get 204.
+        """
+        url = reverse_lazy("task_events")
+
+        self.assertEqual((await self.async_client.get(url)).status_code, 401)
+        self.assertEqual(
+            (await sync_to_async(self.client.get)(url)).status_code, 204
+        )
+
+
+class TestEventFormatting(TaskTestCase):
+    def test_filter_criteria_match_events(self) -> None:
+        """
+        Test that events are split by the subscribed filter and that only
+            the last event carries the cursor.
+        """
+        criteria = get_criteria(
+            {"status": self.status1.pk, "own_tasks": "on"}, self.user1
+        )
+        changes = {
+            "changed": [
+                {
+                    "id": 1,
+                    "status": self.status1.pk,
+                    "executor": 2,
+                    "author": self.user1.pk,
+                    "labels": [],
+                },
+                {
+                    "id": 2,
+                    "status": self.status1.pk,
+                    "executor": 2,
+                    "author": self.user2.pk,
+                    "labels": [],
+                },
+            ],
+            "deleted": [3],
+            "cursor": 7,
+        }
+
+        text = format_changes(changes, criteria)
+
+        self.assertEqual(text.count("event: task"), 1)
+        self.assertEqual(text.count("event: remove"), 2)
+        self.assertEqual(text.count("id: 7"), 1)
+        self.assertTrue(text.rstrip().endswith('{"id": 3}'))
+        self.assertIsNone(get_criteria({"status": "x"}, self.user1))
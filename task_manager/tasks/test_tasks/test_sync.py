@@ -0,0 +1,135 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from task_manager.tasks.models import Task, TaskTombstone
+from .testcase import TaskTestCase
+
+
+class TestTaskSync(TaskTestCase):
+    def sync(self, **params):
+        response = self.client.get(reverse_lazy("task_sync"), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_initial_sync_returns_all_tasks(self) -> None:
+        """
+        Test that a sync without cursor returns every task and no deletions.
+        """
+        data = self.sync()
+
+        self.assertEqual(len(data["changed"]), self.count)
+        self.assertEqual(data["deleted"], [])
+        self.assertFalse(data["has_more"])
+
+    def test_sync_returns_only_changes_since_cursor(self) -> None:
+        """
+        Test that created, updated and deleted tasks after a cursor are the
+            only ones returned.
+        """
+        cursor = self.sync()["cursor"]
+        task_data = self.test_task["create"]["valid"].copy()
+        self.client.post(reverse_lazy("task_create"), data=task_data)
+        self.client.post(
+            reverse_lazy("task_update", kwargs={"pk": self.task2.pk}),
+            data=self.test_task["update"],
+        )
+        self.client.post(
+            reverse_lazy("task_delete", kwargs={"pk": self.task1.pk})
+        )
+
+        data = self.sync(cursor=cursor)
+
+        self.assertEqual(
+            [task["name"] for task in data["changed"]],
+            [task_data["name"], self.test_task["update"]["name"]],
+        )
+        self.assertEqual(data["deleted"], [self.task1.pk])
+        self.assertEqual(self.sync(cursor=data["cursor"])["changed"], [])
+
+    def test_labels_change_bumps_version(self) -> None:
+        """
+        Test that changing only the labels of a task reports the task again.
+        """
+        cursor = self.sync()["cursor"]
+
+        self.task3.labels.set(self.labels)
+
+        data = self.sync(cursor=cursor)
+        self.assertEqual(
+            [(task["id"], task["labels"]) for task in data["changed"]],
+            [(self.task3.pk, [self.label2.pk])],
+        )
+
+    def test_label_clear_bumps_version(self) -> None:
+        """
+        Test that clearing the tasks of a label reports those tasks again.
+        """
+        label_tasks = sorted(self.label2.labels.values_list("pk", flat=True))
+        cursor = self.sync()["cursor"]
+
+        self.label2.labels.clear()
+
+        data = self.sync(cursor=cursor)
+        self.assertTrue(label_tasks)
+        self.assertEqual(
+            sorted(task["id"] for task in data["changed"]), label_tasks
+        )
+        for task in data["changed"]:
+            self.assertNotIn(self.label2.pk, task["labels"])
+
+    def test_sync_pages_with_limit(self) -> None:
+        """
+        Test that a small limit splits the changes into pages.
+        """
+        for task in Task.objects.order_by("pk"):
+            task.save()
+
+        first = self.sync(cursor=0, limit=2)
+        second = self.sync(cursor=first["cursor"], limit=2)
+
+        self.assertTrue(first["has_more"])
+        self.assertFalse(second["has_more"])
+        self.assertEqual(
+            len(first["changed"]) + len(second["changed"]), self.count
+        )
+
+    def test_pruned_tombstones_reset_old_cursors(self) -> None:
+        """
+        Test that pruning old tombstones sends clients with an older cursor
+            a snapshot with `reset`, while newer cursors sync as before.
+        """
+        first, second = self.task1.pk, self.task2.pk
+        old_cursor = self.sync()["cursor"]
+        self.task1.delete()
+        new_cursor = self.sync(cursor=old_cursor)["cursor"]
+        self.task2.delete()
+        TaskTombstone.objects.filter(task_id=first).update(
+            deleted_at=timezone.now() - timedelta(days=2)
+        )
+
+        out = StringIO()
+        call_command("prune_tombstones", days=1, stdout=out)
+
+        self.assertIn("Tombstones deleted: 1", out.getvalue())
+        old = self.sync(cursor=old_cursor)
+        self.assertTrue(old["reset"])
+        self.assertEqual(old["deleted"], [])
+        self.assertEqual(len(old["changed"]), self.count - 2)
+        new = self.sync(cursor=new_cursor)
+        self.assertFalse(new["reset"])
+        self.assertEqual(new["deleted"], [second])
+
+    def test_sync_invalid_params_and_anonymous(self) -> None:
+        """
+        Test that invalid parameters and anonymous users are rejected.
+        """
+        url = reverse_lazy("task_sync")
+
+        self.assertEqual(self.client.get(url, {"cursor": "x"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"limit": 0}).status_code, 400)
+        self.assertEqual(Client().get(url).status_code, 401)
@@ -66,7 +66,7 @@ class TestFilterTasks(TaskTestCase):
             reverse_lazy("tasks"), {"status": self.status1.pk}
         )
 
-        self.assertEqual(response.context["tasks"].count(), 2)
+        self.assertEqual(len(response.context["tasks"]), 2)
         self.assertContains(response, self.task1.name)
         self.assertContains(response, self.task2.name)
         self.assertNotContains(response, self.task3.name)
@@ -81,7 +81,7 @@ class TestFilterTasks(TaskTestCase):
             reverse_lazy("tasks"), {"executor": self.user1.pk}
         )
 
-        self.assertEqual(response.context["tasks"].count(), 1)
+        self.assertEqual(len(response.context["tasks"]), 1)
         self.assertNotContains(response, self.task1.name)
         self.assertContains(response, self.task2.name)
 
@@ -94,7 +94,7 @@ class TestFilterTasks(TaskTestCase):
             reverse_lazy("tasks"), {"labels": self.label2.pk}
         )
 
-        self.assertEqual(response.context["tasks"].count(), 1)
+        self.assertEqual(len(response.context["tasks"]), 1)
         self.assertNotContains(response, self.task1.name)
         self.assertNotContains(response, self.task2.name)
         self.assertContains(response, self.task3.name)
@@ -107,7 +107,7 @@ class TestFilterTasks(TaskTestCase):
         """
         response = self.client.get(reverse_lazy("tasks"), {"own_tasks": "on"})
 
-        self.assertEqual(response.context["tasks"].count(), 2)
+        self.assertEqual(len(response.context["tasks"]), 2)
         self.assertContains(response, self.task1.name)
         self.assertContains(response, self.task2.name)
         self.assertNotContains(response, self.task3.name)
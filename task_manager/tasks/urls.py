@@ -6,13 +6,18 @@ from .views import (
     TaskCreateView,
     TaskUpdateView,
     TaskDeleteView,
+    TaskSyncView,
+    TaskChunkView,
+    TaskEventsView,
 )
 
-
 urlpatterns = [
     path("", TasksListView.as_view(), name="tasks"),
     path("<int:pk>/", TaskDetailView.as_view(), name="task_show"),
     path("create/", TaskCreateView.as_view(), name="task_create"),
     path("<int:pk>/update/", TaskUpdateView.as_view(), name="task_update"),
     path("<int:pk>/delete/", TaskDeleteView.as_view(), name="task_delete"),
+    path("sync/", TaskSyncView.as_view(), name="task_sync"),
+    path("chunk/", TaskChunkView.as_view(), name="task_chunk"),
+    path("events/", TaskEventsView.as_view(), name="task_events"),
 ]
@@ -1,36 +1,108 @@
+from asgiref.sync import sync_to_async
+from django.core.handlers.wsgi import WSGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.urls import reverse_lazy
+from django.views import View
 from django.views.generic import CreateView, UpdateView, DeleteView, DetailView
 from django.utils.translation import gettext_lazy as _
 from django.contrib.messages.views import SuccessMessageMixin
 from django_filters.views import FilterView
 
-from task_manager.mixins import AuthRequiredMixin, AuthorDeletionMixin
+from task_manager.conditional import ConditionalGetMixin
+from task_manager.fragments import FragmentMixin
+from task_manager.rows import ListRowsMixin
+from task_manager.mixins import (
+    AuthRequiredMixin,
+    AuthorDeletionMixin,
+    ListTemplateEngineMixin,
+)
 from .models import Task
 from .forms import TaskForm
 from .filters import TaskFilter
+from .chunks import get_chunk
+from .events import get_criteria, stream_events
+from .sync import get_changes, get_cursor
 
 
-class TasksListView(AuthRequiredMixin, FilterView):
+class TasksListView(
+    AuthRequiredMixin,
+    FragmentMixin,
+    ConditionalGetMixin,
+    ListTemplateEngineMixin,
+    ListRowsMixin,
+    FilterView,
+):
     template_name = "tasks/tasks.html"
     model = Task
     filterset_class = TaskFilter
     context_object_name = "tasks"
+    fragment_templates = {"rows": "tasks/tasks_body.html"}
+    row_urls = {
+        "show_url": "task_show",
+        "update_url": "task_update",
+        "delete_url": "task_delete",
+    }
+    row_dates = {"created": "created_at"}
+    chunk_size = 100
+
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .select_related("status", "author", "executor")
+        )
+
+    def get_row(self, task):
+        return {
+            "id": task.pk,
+            "name": task.name,
+            "status": str(task.status),
+            "author": str(task.author),
+            "executor": str(task.executor),
+        }
 
     def get_filterset(self, filterset_class):
         return filterset_class(
             self.request.GET, queryset=self.get_queryset(), request=self.request
         )
 
+    def get_after(self):
+        try:
+            return max(int(self.request.GET.get("after", 0)), 0)
+        except ValueError:
+            return 0
+
     def get_context_data(self, **kwargs):
+        """
+        Show the first `chunk_size` filtered tasks after `after`; the page
+        script loads the rest from `TaskChunkView` after `next_after` while
+        scrolling, and `next_url` links to them without scripts.
+        """
+        tasks = list(
+            kwargs.pop("object_list")
+            .filter(pk__gt=self.get_after())
+            .order_by("pk")[: self.chunk_size + 1]
+        )
+        next_after = next_url = ""
+        if len(tasks) > self.chunk_size:
+            next_after = tasks[self.chunk_size - 1].pk
+            params = self.request.GET.copy()
+            params["after"] = next_after
+            next_url = f"?{params.urlencode()}"
         context = {
-            **super().get_context_data(**kwargs),
+            **super().get_context_data(
+                object_list=tasks[: self.chunk_size], **kwargs
+            ),
             "title": _("Tasks"),
             "button_text": _("Show"),
+            "events_cursor": get_cursor(),
+            "next_after": next_after,
+            "next_url": next_url,
         }
         return context
 
 
-class TaskDetailView(AuthRequiredMixin, DetailView):
+class TaskDetailView(AuthRequiredMixin, ConditionalGetMixin, DetailView):
     """
     Show one task details.
 
@@ -124,3 +196,119 @@ class TaskDeleteView(
             "button_text": _("Yes, delete"),
         }
         return context
+
+
+class TaskSyncView(View):
+    """
+    Return tasks created, changed or deleted since a cursor as JSON.
+
+    Clients start without `cursor` to get every task, then pass the
+    returned `cursor` back and repeat while `has_more` is true. Deleted
+    tasks are reported by id in `deleted`. When `reset` is true the cursor
+    was too old and the response starts over with every task.
+
+    Authorisation required.
+    """
+
+    default_limit = 500
+    max_limit = 1000
+
+    def get(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return JsonResponse(
+                {"error": "Authentication required"}, status=401
+            )
+        try:
+            cursor = request.GET.get("cursor")
+            cursor = None if cursor in (None, "") else int(cursor)
+            limit = int(request.GET.get("limit", self.default_limit))
+        except ValueError:
+            return JsonResponse(
+                {"error": "cursor and limit must be integers"}, status=400
+            )
+        if (cursor is not None and cursor < 0) or limit < 1:
+            return JsonResponse(
+                {"error": "cursor and limit must be positive"}, status=400
+            )
+        return JsonResponse(get_changes(cursor, min(limit, self.max_limit)))
+
+
+class TaskChunkView(View):
+    """
+    Return the next chunk of the filtered task list as JSON.
+
+    Accepts the `TaskFilter` parameters of the task list, `after`, the id
+    of the last task shown, and `limit`. Rows are lists of the values
+    named by `fields`; pass `next` back as `after` while it is not null.
+
+    Authorisation required.
+    """
+
+    default_limit = 100
+    max_limit = 500
+
+    def get(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return JsonResponse(
+                {"error": "Authentication required"}, status=401
+            )
+        try:
+            after = int(request.GET.get("after", 0))
+            limit = int(request.GET.get("limit", self.default_limit))
+        except ValueError:
+            return JsonResponse(
+                {"error": "after and limit must be integers"}, status=400
+            )
+        if after < 0 or limit < 1:
+            return JsonResponse(
+                {"error": "after and limit must be positive"}, status=400
+            )
+        filterset = TaskFilter(
+            request.GET, queryset=Task.objects.all(), request=request
+        )
+        if not filterset.is_valid():
+            return JsonResponse({"error": "Invalid filter"}, status=400)
+        return JsonResponse(
+            get_chunk(filterset.qs, after, min(limit, self.max_limit))
+        )
+
+
+class TaskEventsView(View):
+    """
+    Stream task changes as server-sent events.
+
+    Accepts the `TaskFilter` parameters of the task list and resumes after
+    `Last-Event-ID` (or `cursor`) when given. Streams are served on the
+    ASGI stack, where an idle connection costs no worker; under WSGI the
+    view answers 204, which tells EventSource not to reconnect.
+
+    Authorisation required.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        if isinstance(request, WSGIRequest):
+            return HttpResponse(status=204)
+        user = await request.auser()
+        if not user.is_authenticated:
+            return JsonResponse(
+                {"error": "Authentication required"}, status=401
+            )
+        criteria = await sync_to_async(get_criteria)(request.GET, user)
+        if criteria is None:
+            return JsonResponse({"error": "Invalid filter"}, status=400)
+        cursor = request.headers.get("Last-Event-ID") or request.GET.get(
+            "cursor"
+        )
+        try:
+            cursor = int(cursor) if cursor else None
+        except ValueError:
+            return JsonResponse(
+                {"error": "cursor must be an integer"}, status=400
+            )
+
+        response = StreamingHttpResponse(
+            stream_events(criteria, cursor), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
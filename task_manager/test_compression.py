@@ -0,0 +1,152 @@
+import gzip
+import zlib
+
+import brotli
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse_lazy
+
+from task_manager import compression
+from task_manager.users.models import User
+from task_manager.utils import remove_rollbar, test_english
+
+BODY = b"<tr><td>Task</td><td>Status</td></tr>\n" * 500
+
+
+def decompress(encoding, data):
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "br":
+        return brotli.decompress(data)
+    return compression.zstd.decompress(data)
+
+
+class TestEncoders(SimpleTestCase):
+    def test_choose_encoding(self) -> None:
+        """
+        Test that the first preferred encoding allowed by the client is
+            chosen and that q=0 excludes an encoding.
+        """
+        preferred = ["zstd", "br", "gzip"]
+
+        for header, expected in [
+            ("gzip, deflate, br", "br"),
+            ("gzip;q=1.0, br;q=0", "gzip"),
+            ("zstd, br", "zstd"),
+            ("*", "zstd"),
+            ("deflate", None),
+            ("", None),
+        ]:
+            with self.subTest(header=header):
+                self.assertEqual(
+                    compression.choose_encoding(header, preferred), expected
+                )
+
+    def test_round_trip(self) -> None:
+        """
+        Test that every available encoding decompresses to the original,
+            whole and streamed.
+        """
+        for encoding in compression.COMPRESSORS:
+            with self.subTest(encoding=encoding):
+                compressed = compression.compress(encoding, 5, BODY)
+                streamed = b"".join(
+                    compression.compress_stream(encoding, 5, [BODY, BODY])
+                )
+
+                self.assertLess(len(compressed), len(BODY) / 10)
+                self.assertEqual(decompress(encoding, compressed), BODY)
+                self.assertEqual(decompress(encoding, streamed), BODY + BODY)
+
+    def test_stream_flushes_every_chunk(self) -> None:
+        """
+        Test that each streamed chunk can be decoded as soon as it arrives.
+        """
+        decoder = zlib.decompressobj(31)
+        stream = compression.compress_stream("gzip", 6, [b"first", b"second"])
+
+        self.assertEqual(decoder.decompress(next(stream)), b"first")
+        self.assertEqual(decoder.decompress(next(stream)), b"second")
+
+
+@test_english
+@remove_rollbar
+class CompressionTestCase(TestCase):
+    fixtures = ["user.json", "status.json", "task.json", "label.json"]
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.user1 = User.objects.get(pk=1)
+        self.client.force_login(self.user1)
+
+
+@override_settings(
+    RESPONSE_COMPRESSION={
+        "ENABLED": True,
+        "MIN_SIZE": 200,
+        "ENCODINGS": ("br", "gzip"),
+        "LEVELS": {"br": 4, "gzip": 6},
+        "CONTENT_TYPES": ("text/html", "application/json"),
+        "BREACH_PROTECTION": True,
+    }
+)
+class TestCompressionMiddleware(CompressionTestCase):
+    def test_html_is_compressed(self) -> None:
+        """
+        Test that the task list is sent with the preferred accepted
+            encoding and a weak validator.
+        """
+        response = self.client.get(
+            reverse_lazy("tasks"), headers={"Accept-Encoding": "gzip, br"}
+        )
+
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(response["Content-Length"], str(len(response.content)))
+        self.assertTrue(response["ETag"].startswith('W/"'))
+        self.assertIn(
+            "Call to my mother", brotli.decompress(response.content).decode()
+        )
+
+    def test_json_is_compressed(self) -> None:
+        """
+        Test that JSON responses are compressed as well.
+        """
+        response = self.client.get(
+            reverse_lazy("task_sync"), headers={"Accept-Encoding": "gzip"}
+        )
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn(b'"changed"', gzip.decompress(response.content))
+
+    def test_small_and_unaccepted_responses(self) -> None:
+        """
+        Test that responses below the threshold, or for clients without a
+            supported encoding, are sent as they are.
+        """
+        small = Client().get(
+            reverse_lazy("task_sync"), headers={"Accept-Encoding": "gzip"}
+        )
+        deflate = self.client.get(
+            reverse_lazy("tasks"), headers={"Accept-Encoding": "deflate"}
+        )
+
+        self.assertEqual(small.status_code, 401)
+        self.assertFalse(small.has_header("Content-Encoding"))
+        self.assertFalse(deflate.has_header("Content-Encoding"))
+        self.assertIn("Accept-Encoding", deflate["Vary"])
+
+    def test_breach_exposed_pages_are_not_compressed(self) -> None:
+        """
+        Test that a page with a CSRF token reflecting a query string is
+            left uncompressed, while the same page without input is not.
+        """
+        url = reverse_lazy("tasks")
+
+        filtered = self.client.get(
+            url, {"status": 1}, headers={"Accept-Encoding": "gzip"}
+        )
+        unfiltered = self.client.get(url, headers={"Accept-Encoding": "gzip"})
+
+        self.assertContains(filtered, "csrfmiddlewaretoken")
+        self.assertFalse(filtered.has_header("Content-Encoding"))
+        self.assertEqual(unfiltered["Content-Encoding"], "gzip")
@@ -0,0 +1,120 @@
+from django.test import Client, TestCase
+from django.urls import reverse_lazy
+
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+from task_manager.utils import remove_rollbar, test_english
+
+
+@test_english
+@remove_rollbar
+class ConditionalGetTestCase(TestCase):
+    fixtures = ["user.json", "status.json", "task.json", "label.json"]
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.user1 = User.objects.get(pk=1)
+        self.client.force_login(self.user1)
+
+
+class TestConditionalGet(ConditionalGetTestCase):
+    def revalidate(self, url, response):
+        return self.client.get(url, headers={"If-None-Match": response["ETag"]})
+
+    def test_unchanged_pages_are_not_modified(self) -> None:
+        """
+        Test that revalidating unchanged pages returns 304 without content.
+        """
+        for url in [
+            reverse_lazy("tasks"),
+            reverse_lazy("task_show", kwargs={"pk": 1}),
+            reverse_lazy("statuses"),
+            reverse_lazy("labels"),
+        ]:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response["ETag"].startswith('W/"'))
+
+                revalidated = self.revalidate(url, response)
+                self.assertEqual(revalidated.status_code, 304)
+                self.assertEqual(revalidated.content, b"")
+                for page in (response, revalidated):
+                    self.assertIn("private", page["Cache-Control"])
+                    self.assertIn("no-cache", page["Cache-Control"])
+                self.assertFalse(response.has_header("Last-Modified"))
+
+    def test_change_invalidates_page(self) -> None:
+        """
+        Test that a change to a shown table produces a new validator.
+        """
+        url = reverse_lazy("tasks")
+        response = self.client.get(url)
+
+        task = Task.objects.get(pk=1)
+        task.name = "Renamed task"
+        task.save()
+
+        revalidated = self.revalidate(url, response)
+        self.assertEqual(revalidated.status_code, 200)
+        self.assertContains(revalidated, "Renamed task")
+
+    def test_unrelated_change_keeps_page(self) -> None:
+        """
+        Test that the labels page stays valid when only a status changed.
+        """
+        url = reverse_lazy("labels")
+        response = self.client.get(url)
+
+        Status.objects.create(name="New status")
+
+        self.assertEqual(self.revalidate(url, response).status_code, 304)
+
+    def test_validator_depends_on_user(self) -> None:
+        """
+        Test that another user does not get the first user's validator
+            accepted.
+        """
+        url = reverse_lazy("statuses")
+        response = self.client.get(url)
+
+        self.client.force_login(User.objects.get(pk=2))
+
+        self.assertEqual(
+            self.client.get(
+                url, headers={"If-None-Match": response["ETag"]}
+            ).status_code,
+            200,
+        )
+
+    def test_modified_since_alone_is_not_trusted(self) -> None:
+        """
+        Test that a date validator does not get another user's page
+            answered with 304.
+        """
+        url = reverse_lazy("statuses")
+        self.client.get(url)
+
+        self.client.force_login(User.objects.get(pk=2))
+        response = self.client.get(
+            url, headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_pending_messages_are_rendered(self) -> None:
+        """
+        Test that a page with a flash message is rendered even when the
+            client's validator matches.
+        """
+        url = reverse_lazy("statuses")
+        response = self.client.get(url)
+
+        self.client.post(reverse_lazy("status_delete", kwargs={"pk": 1}))
+
+        revalidated = self.revalidate(url, response)
+        self.assertEqual(revalidated.status_code, 200)
+        self.assertEqual(Status.objects.filter(pk=1).count(), 1)
+        self.assertEqual(len(revalidated.context["messages"]), 1)
+        self.assertIn("no-cache", revalidated["Cache-Control"])
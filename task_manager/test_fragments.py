@@ -0,0 +1,86 @@
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse_lazy
+
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+from task_manager.utils import remove_rollbar, test_english
+
+ROWS = {"X-Fragment": "rows"}
+
+
+@test_english
+@remove_rollbar
+class TestTaskListFragments(TestCase):
+    fixtures = ["user.json", "status.json", "task.json", "label.json"]
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+        self.url = reverse_lazy("tasks")
+
+    def test_fragment_holds_only_filtered_rows(self) -> None:
+        """
+        Test that a fragment request gets the filtered table body alone.
+        """
+        shown = Task.objects.filter(status=1)
+        hidden = Task.objects.exclude(status=1)
+
+        response = self.client.get(self.url, {"status": 1}, headers=ROWS)
+        content = response.content.decode().strip()
+
+        self.assertTrue(content.startswith("<tbody data-cursor="))
+        self.assertNotIn("<nav", content)
+        self.assertNotIn("<select", content)
+        for task in shown:
+            self.assertIn(f'data-task-id="{task.pk}"', content)
+        for task in hidden:
+            self.assertNotIn(f'data-task-id="{task.pk}"', content)
+        self.assertIn("X-Fragment", response["Vary"])
+
+    def test_fragment_is_part_of_page(self) -> None:
+        """
+        Test that the fragment is the body of the full page, much smaller
+            than the page, with both template engines.
+        """
+        for engine in ("django", "jinja2"):
+            with (
+                self.subTest(engine=engine),
+                override_settings(LIST_TEMPLATE_ENGINE=engine),
+            ):
+                page = self.client.get(self.url).content.decode()
+                fragment = self.client.get(self.url, headers=ROWS)
+
+                self.assertIn(fragment.content.decode().strip(), page)
+                self.assertLess(len(fragment.content), len(page) / 3)
+
+    def test_fragment_and_page_have_own_validators(self) -> None:
+        """
+        Test that the ETag of the page does not validate the fragment.
+        """
+        page = self.client.get(self.url)
+        fragment = self.client.get(
+            self.url, headers={**ROWS, "If-None-Match": page["ETag"]}
+        )
+        cached = self.client.get(
+            self.url, headers={**ROWS, "If-None-Match": fragment["ETag"]}
+        )
+
+        self.assertEqual(fragment.status_code, 200)
+        self.assertNotEqual(fragment["ETag"], page["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_unknown_fragment_gets_page(self) -> None:
+        """
+        Test that an unknown fragment name is answered with the full page.
+        """
+        response = self.client.get(self.url, headers={"X-Fragment": "form"})
+
+        self.assertTemplateUsed(response, "tasks/tasks.html")
+
+    def test_anonymous_fragment_request_is_redirected(self) -> None:
+        """
+        Test that a fragment request without a session is sent to login.
+        """
+        response = Client().get(self.url, headers=ROWS)
+
+        self.assertRedirects(response, reverse_lazy("login"))
@@ -0,0 +1,110 @@
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from task_manager import invalidation
+from task_manager.statuses.models import Status
+
+
+class TestSocketBus(TestCase):
+    def setUp(self) -> None:
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def test_publish_reaches_other_processes(self) -> None:
+        """
+        Test that an invalidation reaches the other socket but not the
+            sender, and that sockets of dead processes are removed.
+        """
+        received = []
+        delivered = threading.Event()
+
+        def on_message(tables):
+            received.append(tables)
+            delivered.set()
+
+        sender = invalidation.SocketBus(self.directory)
+        listener = invalidation.SocketBus(self.directory)
+        sender.start(lambda tables: received.append(("sender", tables)))
+        listener.start(on_message)
+        self.addCleanup(sender.close)
+        self.addCleanup(listener.close)
+        stale = self.directory / "0-dead.sock"
+        stale.touch()
+
+        sender.publish(["tasks_task"])
+
+        self.assertTrue(delivered.wait(5))
+        self.assertEqual(received, [["tasks_task"]])
+        self.assertFalse(stale.exists())
+
+
+class TestVersionedCache(TestCase):
+    fixtures = ["status.json"]
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.calls = 0
+
+    def cached(self):
+        def compute():
+            self.calls += 1
+            return self.calls
+
+        return invalidation.get_or_set(
+            "test_statuses", [Status._meta.db_table], compute
+        )
+
+    def test_write_invalidates_value(self) -> None:
+        """
+        Test that a cached value is recomputed after its table changed.
+        """
+        self.assertEqual(self.cached(), 1)
+        self.assertEqual(self.cached(), 1)
+
+        Status.objects.create(name="Fresh status")
+
+        self.assertEqual(self.cached(), 2)
+
+    def test_broadcast_invalidates_value(self) -> None:
+        """
+        Test that invalidations from other nodes drop the value, and that a
+            reconnect of the listener drops everything.
+        """
+        self.cached()
+
+        invalidation.bump_generations(["other_table"])
+        self.assertEqual(self.cached(), 1)
+
+        invalidation.bump_generations([Status._meta.db_table])
+        self.assertEqual(self.cached(), 2)
+
+        invalidation.bump_generations(None)
+        self.assertEqual(self.cached(), 3)
+
+    def test_backend_selection(self) -> None:
+        """
+        Test that 'auto' uses sockets on SQLite and 'local' disables the
+            broadcast.
+        """
+        config = {
+            "BACKEND": "auto",
+            "CHANNEL": "cache_invalidation",
+            "SOCKET_DIR": "/tmp/unused",
+        }
+
+        self.assertIsInstance(
+            invalidation.create_bus(config), invalidation.SocketBus
+        )
+        self.assertIsInstance(
+            invalidation.create_bus({**config, "BACKEND": "local"}),
+            invalidation.LocalBus,
+        )
+        self.assertIsInstance(
+            invalidation.create_bus({**config, "BACKEND": "postgres"}),
+            invalidation.PostgresBus,
+        )
@@ -0,0 +1,90 @@
+import re
+
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse_lazy
+
+from task_manager.users.models import User
+from task_manager.utils import remove_rollbar, test_english
+
+LIST_PAGES = ("tasks", "users", "statuses", "labels")
+
+
+def normalize(content):
+    """
+    Drop the whitespace and per-response CSRF tokens of a page.
+    """
+    text = re.sub(r'name="csrfmiddlewaretoken" value="[^"]+"', "", content)
+    text = re.sub(r"\s+", " ", text)
+    return re.sub(r"> <", "><", text).strip()
+
+
+@remove_rollbar
+class JinjaTestCase(TestCase):
+    fixtures = ["user.json", "status.json", "task.json", "label.json"]
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+
+    def render(self, page, engine, **params):
+        with override_settings(LIST_TEMPLATE_ENGINE=engine):
+            response = self.client.get(reverse_lazy(page), params)
+        self.assertEqual(response.status_code, 200)
+        return response.content.decode()
+
+
+@test_english
+class TestJinjaListTemplates(JinjaTestCase):
+    def test_pages_match_django_templates(self) -> None:
+        """
+        Test that every list page renders the same markup with both engines.
+        """
+        for page in LIST_PAGES:
+            with self.subTest(page=page):
+                self.assertEqual(
+                    normalize(self.render(page, "jinja2")),
+                    normalize(self.render(page, "django")),
+                )
+
+    def test_filter_form_and_rows(self) -> None:
+        """
+        Test that the task filter keeps its values and row links point to
+            the filtered tasks.
+        """
+        content = self.render("tasks", "jinja2", status=1, own_tasks="on")
+
+        self.assertIn('id="id_own_tasks" checked', content)
+        self.assertIn('href="/tasks/1/update/"', content)
+        self.assertEqual(
+            normalize(content),
+            normalize(self.render("tasks", "django", status=1, own_tasks="on")),
+        )
+
+    def test_messages_are_shown(self) -> None:
+        """
+        Test that the message of a completed action is shown on the list.
+        """
+        with override_settings(LIST_TEMPLATE_ENGINE="jinja2"):
+            response = self.client.post(
+                reverse_lazy("label_create"), {"name": "jinja"}, follow=True
+            )
+
+        self.assertContains(response, "Label successfully created")
+        self.assertContains(response, "alert-success")
+
+
+@override_settings(LANGUAGE_CODE="ru-ru")
+class TestJinjaTranslations(JinjaTestCase):
+    def test_pages_are_translated(self) -> None:
+        """
+        Test that texts and dates follow the active language.
+        """
+        content = self.render("tasks", "jinja2")
+
+        self.assertIn('<html lang="ru-ru">', content)
+        self.assertIn("Создать задачу", content)
+        self.assertEqual(
+            normalize(content), normalize(self.render("tasks", "django"))
+        )
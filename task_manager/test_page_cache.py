@@ -0,0 +1,117 @@
+import re
+
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse_lazy
+
+from task_manager.users.models import User
+from task_manager.utils import remove_rollbar, test_english
+
+
+@remove_rollbar
+class PageCacheTestCase(TestCase):
+    fixtures = ["user.json"]
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client = Client()
+
+
+@test_english
+class TestAnonymousPageCache(PageCacheTestCase):
+    def test_repeated_visit_is_served_from_cache(self) -> None:
+        """
+        Test that the users page is rendered once for anonymous visitors.
+        """
+        first = self.client.get(reverse_lazy("users"))
+
+        with self.assertNumQueries(0):
+            second = Client().get(reverse_lazy("users"))
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+
+    def test_user_change_invalidates_users_page(self) -> None:
+        """
+        Test that a new user appears on the cached users page.
+        """
+        self.client.get(reverse_lazy("users"))
+
+        User.objects.create(username="new_visitor_user")
+        response = self.client.get(reverse_lazy("users"))
+
+        self.assertContains(response, "new_visitor_user")
+
+    def test_authenticated_users_bypass_cache(self) -> None:
+        """
+        Test that signed-in users get their own page.
+        """
+        self.client.get(reverse_lazy("users"))
+        self.client.force_login(User.objects.get(pk=1))
+
+        response = self.client.get(reverse_lazy("users"))
+
+        self.assertContains(response, reverse_lazy("logout"))
+
+    def test_pending_messages_bypass_cache(self) -> None:
+        """
+        Test that a flash message is shown once and not stored in the
+            shared page.
+        """
+        self.client.get(reverse_lazy("home"))
+        self.client.force_login(User.objects.get(pk=1))
+
+        after_logout = self.client.post(reverse_lazy("logout"), follow=True)
+        next_visit = self.client.get(reverse_lazy("home"))
+
+        self.assertContains(after_logout, "You are logged out")
+        self.assertNotContains(next_visit, "You are logged out")
+        self.assertNotContains(Client().get(reverse_lazy("home")), "logged out")
+
+    def test_cached_login_page_has_valid_csrf_token(self) -> None:
+        """
+        Test that every visitor of the cached login page gets a token
+            matching their own CSRF cookie.
+        """
+        Client().get(reverse_lazy("login"))
+        client = Client(enforce_csrf_checks=True)
+
+        page = client.get(reverse_lazy("login"))
+        token = re.search(
+            r'name="csrfmiddlewaretoken" value="([^"]+)"',
+            page.content.decode(),
+        ).group(1)
+        response = client.post(
+            reverse_lazy("login"),
+            {
+                "username": "ValentinaLux",
+                "password": "wrong password",
+                "csrfmiddlewaretoken": token,
+            },
+        )
+
+        self.assertNotEqual(token, "__csrf_token__")
+        self.assertIn("csrftoken", page.cookies)
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(
+    LANGUAGE_CODE="ru-ru",
+    LANGUAGES=(("en-us", "English"), ("ru-ru", "Russian")),
+)
+class TestPageCacheLanguages(PageCacheTestCase):
+    def test_page_is_cached_per_language(self) -> None:
+        """
+        Test that visitors choosing different languages get the page in
+            their language.
+        """
+        russian = self.client.get(
+            reverse_lazy("users"), headers={"Accept-Language": "ru"}
+        )
+        english = Client().get(
+            reverse_lazy("users"), headers={"Accept-Language": "en-us"}
+        )
+
+        self.assertContains(russian, "Пользователи")
+        self.assertContains(english, "Users")
+        self.assertNotContains(english, "Пользователи")
@@ -0,0 +1,117 @@
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from django.db import connections
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse_lazy
+
+from task_manager import routers
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+from task_manager.utils import load_data, remove_rollbar, test_english
+
+
+@test_english
+@remove_rollbar
+@override_settings(DATABASE_REPLICAS=["replica"], REPLICA_STICKY_SECONDS=15)
+class ReplicaRoutingTestCase(TestCase):
+    """
+    Test case with a second SQLite database acting as a lagging replica.
+
+    The replica gets the schema of the primary but only the users, so
+    pages served from it show no tasks while the primary has the fixtures.
+    """
+
+    fixtures = ["user.json", "status.json", "task.json", "label.json"]
+    test_task = load_data("test_task.json")
+
+    @classmethod
+    def setUpClass(cls):
+        cls.replica_dir = Path(tempfile.mkdtemp())
+        replica_path = cls.replica_dir / "replica.sqlite3"
+
+        primary = connections["default"]
+        primary.ensure_connection()
+        with sqlite3.connect(replica_path) as replica:
+            primary.connection.backup(replica)
+
+        connections.settings["replica"] = {
+            **primary.settings_dict,
+            "NAME": str(replica_path),
+        }
+        # Declared here because the alias does not exist when the test
+        # runner checks the configured databases.
+        cls.databases = {"default", "replica"}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections["replica"].close()
+        del connections["replica"]
+        del connections.settings["replica"]
+        shutil.rmtree(cls.replica_dir, ignore_errors=True)
+
+    def setUp(self) -> None:
+        User.objects.using("replica").bulk_create(User.objects.all())
+
+        self.client = Client()
+        self.user1 = User.objects.get(pk=1)
+        self.client.force_login(self.user1)
+
+
+class TestReplicaRouting(ReplicaRoutingTestCase):
+    def test_safe_request_reads_from_replica(self) -> None:
+        """
+        Test that a GET without recent writes is served from the replica.
+        """
+        response = self.client.get(reverse_lazy("tasks"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["tasks"]), 0)
+        self.assertNotIn("primary_until", response.cookies)
+
+    def test_read_your_writes_after_create(self) -> None:
+        """
+        Test that the list shown after creating a task comes from the
+            primary and contains the new task.
+        """
+        task_data = self.test_task["create"]["valid"].copy()
+
+        response = self.client.post(
+            reverse_lazy("task_create"), data=task_data, follow=True
+        )
+
+        self.assertIn("primary_until", self.client.cookies)
+        self.assertEqual(len(response.context["tasks"]), Task.objects.count())
+        self.assertContains(response, task_data["name"])
+
+    def test_replica_is_used_after_sticky_window(self) -> None:
+        """
+        Test that reads return to the replica once the cookie expired.
+        """
+        self.client.post(
+            reverse_lazy("task_create"),
+            data=self.test_task["create"]["valid"].copy(),
+        )
+        self.client.cookies["primary_until"] = "0"
+
+        response = self.client.get(reverse_lazy("tasks"))
+
+        self.assertEqual(len(response.context["tasks"]), 0)
+
+    def test_reads_outside_requests_use_primary(self) -> None:
+        """
+        Test that code running outside of a request, like management
+            commands, reads from the primary.
+        """
+        router = routers.ReplicaRouter()
+        token = routers.begin_request(use_replica=True)
+        in_request = router.db_for_read(Task)
+        routers.end_request(token)
+
+        self.assertEqual(router.db_for_read(Task), "default")
+        self.assertEqual(in_request, "replica")
+        self.assertFalse(router.allow_migrate("replica", "tasks"))
@@ -0,0 +1,96 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import connection
+from django.template.defaultfilters import date as date_filter
+from django.test import Client, SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse, reverse_lazy
+from django.utils import timezone, translation
+
+from task_manager.rows import get_date_formatter, url_builder
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+from task_manager.utils import remove_rollbar, test_english
+
+MOMENT = datetime(2025, 3, 7, 9, 5, 2, tzinfo=dt_timezone.utc)
+
+
+class TestRowHelpers(SimpleTestCase):
+    def test_url_builder_matches_reverse(self) -> None:
+        """
+        Test that built URLs equal the reversed ones.
+        """
+        build = url_builder("task_update")
+
+        for pk in (1, 42, 100500):
+            with self.subTest(pk=pk):
+                self.assertEqual(build(pk), reverse("task_update", args=[pk]))
+
+    def test_date_formatter_matches_date_filter(self) -> None:
+        """
+        Test that numeric and language dependent formats give the output of
+            the date filter in each language.
+        """
+        for language in ("en-us", "ru-ru"):
+            for format_string in ("d.m.Y H:i", "y-m-d s%", "j F Y", r"\Y Y"):
+                with (
+                    self.subTest(language=language, format=format_string),
+                    translation.override(language),
+                ):
+                    self.assertEqual(
+                        get_date_formatter(format_string, language)(MOMENT),
+                        date_filter(MOMENT, format_string),
+                    )
+
+
+@test_english
+@remove_rollbar
+class TestListRows(TestCase):
+    fixtures = ["user.json", "status.json", "task.json", "label.json"]
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.client.force_login(User.objects.get(pk=1))
+
+    def test_task_rows(self) -> None:
+        """
+        Test that the task list gets one prepared row per task.
+        """
+        response = self.client.get(reverse_lazy("tasks"))
+        task = Task.objects.get(pk=1)
+        row = next(row for row in response.context["rows"] if row["id"] == 1)
+
+        self.assertEqual(len(response.context["rows"]), Task.objects.count())
+        self.assertEqual(
+            row,
+            {
+                "id": 1,
+                "name": task.name,
+                "status": str(task.status),
+                "author": str(task.author),
+                "executor": str(task.executor),
+                "show_url": "/tasks/1/",
+                "update_url": "/tasks/1/update/",
+                "delete_url": "/tasks/1/delete/",
+                "created": timezone.localtime(task.created_at).strftime(
+                    "%d.%m.%Y %H:%M"
+                ),
+            },
+        )
+
+    def test_task_list_queries_do_not_grow_with_rows(self) -> None:
+        """
+        Test that the related objects of the rows are loaded with the tasks.
+        """
+        with CaptureQueriesContext(connection) as before:
+            self.client.get(reverse_lazy("tasks"))
+        task = Task.objects.get(pk=1)
+        for number in range(5):
+            task.pk = None
+            task.name = f"Copy {number}"
+            task.save()
+
+        with CaptureQueriesContext(connection) as after:
+            self.client.get(reverse_lazy("tasks"))
+
+        self.assertEqual(len(after), len(before))
@@ -0,0 +1,179 @@
+import gzip
+import shutil
+import tempfile
+from pathlib import Path
+
+import brotli
+from asgiref.testing import ApplicationCommunicator
+from django.core.files.base import ContentFile
+from django.test import Client, SimpleTestCase, TestCase
+from django.urls import reverse_lazy
+
+from task_manager.static_files import StaticFilesApp
+from task_manager.storage import CompressedManifestStaticFilesStorage
+from task_manager.utils import remove_rollbar, test_english
+
+STYLESHEET = b"body { color: #333; }\n" * 200
+
+
+async def downstream(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"django"})
+
+
+class StaticFilesTestCase(SimpleTestCase):
+    """
+    Test case with a small collected static root.
+    """
+
+    def setUp(self) -> None:
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+
+        self.storage = CompressedManifestStaticFilesStorage(
+            location=self.root, base_url="/static/"
+        )
+        paths = {}
+        for name, content in (
+            ("css/app.css", STYLESHEET),
+            ("img/logo.png", b"\x89PNG"),
+        ):
+            self.storage.save(name, ContentFile(content))
+            paths[name] = (self.storage, name)
+        list(self.storage.post_process(paths))
+        self.hashed_css = self.storage.hashed_files["css/app.css"]
+
+    async def request(self, path, method="GET", headers=()):
+        app = StaticFilesApp(downstream, self.root, "static/")
+        communicator = ApplicationCommunicator(
+            app,
+            {
+                "type": "http",
+                "method": method,
+                "path": path,
+                "headers": list(headers),
+            },
+        )
+        await communicator.send_input({"type": "http.request"})
+        start = await communicator.receive_output()
+        body = await communicator.receive_output()
+        return start["status"], dict(start["headers"]), body["body"]
+
+
+class TestCompressedManifestStorage(StaticFilesTestCase):
+    def test_hashed_text_files_are_precompressed(self) -> None:
+        """
+        Test that collectstatic writes gzip and brotli variants of hashed
+            text files that decompress to the original.
+        """
+        path = self.root / self.hashed_css
+
+        self.assertRegex(self.hashed_css, r"^css/app\.[0-9a-f]{12}\.css$")
+        self.assertEqual(
+            gzip.decompress(Path(f"{path}.gz").read_bytes()), STYLESHEET
+        )
+        self.assertEqual(
+            brotli.decompress(Path(f"{path}.br").read_bytes()), STYLESHEET
+        )
+        self.assertFalse((self.root / "css/app.css.gz").exists())
+        hashed_png = self.storage.hashed_files["img/logo.png"]
+        self.assertFalse((self.root / f"{hashed_png}.gz").exists())
+
+    def test_url_without_manifest(self) -> None:
+        """
+        Test that names are used as they are before collectstatic ran.
+        """
+        storage = CompressedManifestStaticFilesStorage(
+            location=self.root / "empty", base_url="/static/"
+        )
+
+        self.assertEqual(storage.url("css/app.css"), "/static/css/app.css")
+        self.assertEqual(
+            self.storage.url("css/app.css"), f"/static/{self.hashed_css}"
+        )
+
+
+class TestStaticFilesApp(StaticFilesTestCase):
+    async def test_hashed_file_is_immutable_and_compressed(self) -> None:
+        """
+        Test that a hashed file is sent brotli encoded to clients that
+            accept it, with far future cache headers.
+        """
+        status, headers, body = await self.request(
+            f"/static/{self.hashed_css}",
+            headers=[(b"accept-encoding", b"gzip, deflate, br")],
+        )
+
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b"content-encoding"], b"br")
+        self.assertEqual(headers[b"vary"], b"Accept-Encoding")
+        self.assertIn(b"immutable", headers[b"cache-control"])
+        self.assertEqual(headers[b"content-type"], b"text/css; charset=utf-8")
+        self.assertEqual(brotli.decompress(body), STYLESHEET)
+
+    async def test_identity_and_unhashed_files(self) -> None:
+        """
+        Test that clients without compression get the plain file and that
+            unhashed names are revalidated.
+        """
+        status, headers, body = await self.request("/static/css/app.css")
+
+        self.assertEqual(status, 200)
+        self.assertNotIn(b"content-encoding", headers)
+        self.assertEqual(headers[b"cache-control"], b"no-cache")
+        self.assertEqual(body, STYLESHEET)
+
+    async def test_not_modified(self) -> None:
+        """
+        Test that a matching If-None-Match is answered with 304.
+        """
+        path = f"/static/{self.hashed_css}"
+        _, headers, _ = await self.request(
+            path, headers=[(b"accept-encoding", b"gzip")]
+        )
+
+        status, _, body = await self.request(
+            path,
+            headers=[
+                (b"accept-encoding", b"gzip"),
+                (b"if-none-match", headers[b"etag"]),
+            ],
+        )
+
+        self.assertEqual(status, 304)
+        self.assertEqual(body, b"")
+
+    async def test_other_requests(self) -> None:
+        """
+        Test that unknown static paths get 404 without reaching Django,
+            while other paths are passed through.
+        """
+        missing, _, _ = await self.request("/static/css/missing.css")
+        escaped, _, _ = await self.request("/static/../manage.py")
+        post, _, _ = await self.request("/static/css/app.css", "POST")
+        status, _, body = await self.request("/tasks/")
+
+        self.assertEqual((missing, escaped, post), (404, 404, 405))
+        self.assertEqual((status, body), (200, b"django"))
+
+
+@test_english
+@remove_rollbar
+class TestBundledAssets(TestCase):
+    fixtures = ["user.json"]
+
+    def test_pages_use_bundled_bootstrap(self) -> None:
+        """
+        Test that pages link the bundled Bootstrap instead of a CDN.
+        """
+        response = Client().get(reverse_lazy("login"))
+        content = response.content.decode()
+
+        # Hashed names are used once collectstatic has run.
+        self.assertRegex(
+            content, r"/static/vendor/bootstrap/css/bootstrap\.min\.(\w+\.)?css"
+        )
+        self.assertRegex(
+            content, r"/static/vendor/bootstrap/js/bootstrap\.min\.(\w+\.)?js"
+        )
+        self.assertNotIn("cdn.jsdelivr.net", content)
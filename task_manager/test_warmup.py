@@ -0,0 +1,59 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.template import engines
+from django.test import SimpleTestCase
+
+from task_manager import warmup
+
+
+class TestWarmUp(SimpleTestCase):
+    def setUp(self) -> None:
+        self.loader = engines["django"].engine.template_loaders[0]
+        self.loader.reset()
+
+    def test_templates_are_compiled_into_cached_loader(self) -> None:
+        """
+        Test that the project and form templates are cached, so the first
+            request does not compile them, and the Jinja2 lists compiled.
+        """
+        count = warmup.compile_templates()
+
+        self.assertIn("tasks/tasks.html", self.loader.get_template_cache)
+        self.assertIn(
+            "django_bootstrap5/field_errors.html",
+            self.loader.get_template_cache,
+        )
+        self.assertEqual(
+            count,
+            len(self.loader.get_template_cache)
+            + len(warmup.template_names("task_manager", "jinja2")),
+        )
+
+    def test_urls_are_resolved_in_every_language(self) -> None:
+        """
+        Test that named URLs, with and without parameters, are reversed for
+            both languages.
+        """
+        names = dict(warmup.url_names())
+
+        self.assertEqual(names["task_show"], ["pk"])
+        self.assertEqual(names["profile_download"], ["name"])
+        self.assertIn("admin:index", names)
+        self.assertGreater(warmup.resolve_urls(), len(names))
+
+    def test_command_reports_every_phase(self) -> None:
+        """
+        Test that the command runs every phase and reports its timing.
+        """
+        out = StringIO()
+
+        call_command("warm_up", "--json", stdout=out)
+        results = json.loads(out.getvalue())
+
+        self.assertEqual(
+            [row["phase"] for row in results],
+            ["templates", "urls", "translations", "models"],
+        )
+        self.assertTrue(all(row["count"] > 0 for row in results))
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase, Client
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
@@ -17,6 +18,8 @@ class HomeTestCase(TestCase):
     """
 
     def setUp(self) -> None:
+        # Pages of anonymous visitors are cached across tests.
+        cache.clear()
         self.client = Client()
 
         self.credentials = {
@@ -30,5 +30,6 @@ urlpatterns = [
     path("statuses/", include("task_manager.statuses.urls")),
     path("tasks/", include("task_manager.tasks.urls")),
     path("labels/", include("task_manager.labels.urls")),
+    path("monitoring/", include("task_manager.monitoring.urls")),
     path("test-rollbar/", views.test_rollbar_view),
 ]
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase, Client
 
 from task_manager.utils import load_data, test_english, remove_rollbar
@@ -11,6 +12,8 @@ class UserTestCase(TestCase):
     test_user = load_data("test_user.json")
 
     def setUp(self) -> None:
+        # Pages of anonymous visitors are cached across tests.
+        cache.clear()
         self.client = Client()
 
         self.user1 = User.objects.get(pk=1)
@@ -4,16 +4,21 @@ from django.views.generic import ListView, CreateView, UpdateView, DeleteView
 from django.utils.translation import gettext_lazy as _
 from django.contrib.messages.views import SuccessMessageMixin
 
+from task_manager.page_cache import AnonymousPageCacheMixin
+from task_manager.rows import ListRowsMixin
 from task_manager.mixins import (
     AuthRequiredMixin,
     UserPermissionMixin,
     DeleteProtectionMixin,
+    ListTemplateEngineMixin,
 )
 from .models import User
 from .forms import UserForm
 
 
-class UsersListView(ListView):
+class UsersListView(
+    AnonymousPageCacheMixin, ListTemplateEngineMixin, ListRowsMixin, ListView
+):
     """
     Display a list of all registered users.
 
@@ -24,6 +29,16 @@ class UsersListView(ListView):
     template_name = "users/users.html"
     model = User
     context_object_name = "users"
+    page_cache_models = (User,)
+    row_urls = {"update_url": "user_update", "delete_url": "user_delete"}
+    row_dates = {"joined": "date_joined"}
+
+    def get_row(self, user):
+        return {
+            "id": user.pk,
+            "username": user.username,
+            "full_name": f"{user.first_name} {user.last_name}",
+        }
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
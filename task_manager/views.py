@@ -6,8 +6,10 @@ from django.utils.translation import gettext_lazy as _
 
 from django.views.generic import TemplateView
 
+from task_manager.page_cache import AnonymousPageCacheMixin
 
-class IndexView(TemplateView):
+
+class IndexView(AnonymousPageCacheMixin, TemplateView):
     """
     Display the homepage of the task manager.
 
@@ -23,7 +25,7 @@ class IndexView(TemplateView):
         return context
 
 
-class UserLoginView(SuccessMessageMixin, LoginView):
+class UserLoginView(AnonymousPageCacheMixin, SuccessMessageMixin, LoginView):
     """
     Handle user login.
 
@@ -0,0 +1,140 @@
+"""
+Warm-up of a freshly started process.
+
+Without it the first requests of every new worker compile templates, build
+the URL resolvers, load translation catalogs and fill the field caches of
+the models. `warm_up` does this work before the worker accepts requests;
+gunicorn runs it from the `post_worker_init` hook in gunicorn.conf.py.
+"""
+
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.template import engines
+from django.urls import NoReverseMatch, get_resolver, resolve, reverse
+from django.utils import formats, translation
+
+
+def template_names(app_label, dirname="templates"):
+    """
+    Return the names of the templates in a template directory of an app.
+    """
+    directory = Path(apps.get_app_config(app_label).path) / dirname
+    return sorted(
+        path.relative_to(directory).as_posix()
+        for path in directory.rglob("*")
+        if path.is_file()
+    )
+
+
+def compile_templates():
+    """
+    Compile the templates of `WARMUP["TEMPLATE_APPS"]` with every engine,
+    each reading the app directory it loads templates from.
+
+    Returns:
+        int: Number of compiled templates.
+    """
+    count = 0
+    for engine in engines.all():
+        for app_label in settings.WARMUP["TEMPLATE_APPS"]:
+            for name in template_names(app_label, engine.app_dirname):
+                engine.get_template(name)
+                count += 1
+    return count
+
+
+def url_names(resolver=None, namespace=""):
+    """
+    Yield every named URL with the names of its parameters, including the
+    URLs of included namespaces.
+    """
+    resolver = resolver or get_resolver()
+    for key in resolver.reverse_dict:
+        if isinstance(key, str):
+            possibilities = resolver.reverse_dict.getlist(key)[0][0]
+            yield namespace + key, possibilities[0][1]
+    for name, (_, included) in resolver.namespace_dict.items():
+        yield from url_names(included, f"{namespace}{name}:")
+
+
+def resolve_urls():
+    """
+    Reverse and resolve every named URL in every language.
+
+    Parameters are filled with 1; URLs whose converters reject it (like
+    the app labels of the admin) are skipped.
+
+    Returns:
+        int: Number of resolved URLs.
+    """
+    count = 0
+    for language, _ in settings.LANGUAGES:
+        with translation.override(language):
+            for name, params in url_names():
+                try:
+                    path = reverse(name, kwargs=dict.fromkeys(params, 1))
+                except NoReverseMatch:
+                    continue
+                resolve(path)
+                count += 1
+    return count
+
+
+def load_translations():
+    """
+    Load the translation catalogs and format modules of every language.
+
+    Returns:
+        int: Number of languages.
+    """
+    for language, _ in settings.LANGUAGES:
+        with translation.override(language):
+            translation.gettext("Tasks")
+            formats.get_format("DATETIME_FORMAT")
+    return len(settings.LANGUAGES)
+
+
+def prepare_models():
+    """
+    Fill the field and relation caches of every model.
+
+    Returns:
+        int: Number of models.
+    """
+    models = apps.get_models()
+    for model in models:
+        model._meta.get_fields()
+    return len(models)
+
+
+PHASES = (
+    ("templates", compile_templates),
+    ("urls", resolve_urls),
+    ("translations", load_translations),
+    ("models", prepare_models),
+)
+
+
+def warm_up():
+    """
+    Run every warm-up phase.
+
+    Returns:
+        list[dict]: Per phase the number of warmed items and the time it
+            took in milliseconds.
+    """
+    results = []
+    for phase, function in PHASES:
+        start = time.perf_counter()
+        count = function()
+        results.append(
+            {
+                "phase": phase,
+                "count": count,
+                "ms": (time.perf_counter() - start) * 1000,
+            }
+        )
+    return results
@@ -123,7 +123,8 @@ class TestTask:
         # check filter
         page.check('text="Только свои задачи"')
         page.click('text="Показать"')
-        page.wait_for_load_state()
+        # The filtered rows replace the table body in place.
+        page.wait_for_selector('#tasks-table:not([aria-busy="true"])')
 
         assert DATA["tasks"]["first"]["name"] in page.content()
         assert DATA["tasks"]["second"]["name"] in page.content()
@@ -133,7 +134,7 @@ class TestTask:
             'text="Статус"', label=DATA["tasks"]["second"]["status"]
         )
         page.click('text="Показать"')
-        page.wait_for_load_state()
+        page.wait_for_selector('#tasks-table:not([aria-busy="true"])')
 
         assert DATA["tasks"]["first"]["name"] not in page.content()
         assert DATA["tasks"]["second"]["name"] in page.content()
@@ -143,7 +144,7 @@ class TestTask:
             'text="Метка"', label=DATA["tasks"]["second"]["labels"]["first"]
         )
         page.click('text="Показать"')
-        page.wait_for_load_state()
+        page.wait_for_selector('#tasks-table:not([aria-busy="true"])')
 
         assert DATA["tasks"]["first"]["name"] not in page.content()
         assert DATA["tasks"]["second"]["name"] in page.content()
@@ -151,7 +152,7 @@ class TestTask:
 
         page.select_option('text="Статус"', value=[])
         page.click('text="Показать"')
-        page.wait_for_load_state()
+        page.wait_for_selector('#tasks-table:not([aria-busy="true"])')
 
         assert DATA["tasks"]["first"]["name"] in page.content()
         assert DATA["tasks"]["second"]["name"] in page.content()
@@ -161,7 +162,7 @@ class TestTask:
             'text="Исполнитель"', label=DATA["tasks"]["first"]["executor"]
         )
         page.click('text="Показать"')
-        page.wait_for_load_state()
+        page.wait_for_selector('#tasks-table:not([aria-busy="true"])')
 
         assert DATA["tasks"]["first"]["name"] in page.content()
         assert DATA["tasks"]["second"]["name"] not in page.content()